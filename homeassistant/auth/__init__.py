@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant import data_entry_flow
 from homeassistant.core import (
@@ -33,11 +35,24 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of verified access tokens that are remembered
+VERIFIED_ACCESS_TOKEN_CACHE_SIZE = 256
+# Leeway in seconds when checking the expiration of an access token
+ACCESS_TOKEN_LEEWAY = 10
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
 
 
+@dataclass(slots=True, frozen=True)
+class _VerifiedAccessToken:
+    """An access token with a verified signature."""
+
+    refresh_token_id: str
+    expire_at: float
+
+
 class InvalidAuthError(Exception):
     """Raised when a authentication error occurs."""
 
@@ -176,6 +191,9 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        self._verified_access_tokens: LRU[str, _VerifiedAccessToken] = LRU(
+            VERIFIED_ACCESS_TOKEN_CACHE_SIZE
+        )
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -511,6 +529,7 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(refresh_token.id)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
@@ -631,7 +650,18 @@ class AuthManager:
 
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        The signature of an access token is only verified the first time it
+        is seen, until it expires or its refresh token is removed.
+        """
+        if (verified := self._verified_access_tokens.get(token)) is not None:
+            if verified.expire_at > time.time() and (
+                refresh_token := self.async_get_refresh_token(verified.refresh_token_id)
+            ):
+                return refresh_token if refresh_token.user.is_active else None
+            del self._verified_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -649,17 +679,34 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        self._verified_access_tokens[token] = _VerifiedAccessToken(
+            refresh_token.id, claims["exp"] + ACCESS_TOKEN_LEEWAY
+        )
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(self, refresh_token_id: str) -> None:
+        """Forget the verified access tokens of a refresh token."""
+        for token, verified in self._verified_access_tokens.items():
+            if verified.refresh_token_id == refresh_token_id:
+                del self._verified_access_tokens[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
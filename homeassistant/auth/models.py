@@ -66,6 +66,11 @@ class User:
         factory=dict, eq=False, order=False
     )
 
+    # Incremented every time the permissions of the user change.
+    permissions_revision: int = attr.ib(
+        default=0, init=False, eq=False, order=False, repr=False
+    )
+
     @cached_property
     def permissions(self) -> perm_mdl.AbstractPermissions:
         """Return permissions object for user."""
@@ -87,6 +92,7 @@ class User:
         """Invalidate permission and is_admin cache."""
         for attr_to_invalidate in ("permissions", "is_admin"):
             self.__dict__.pop(attr_to_invalidate, None)
+        self.permissions_revision += 1
 
 
 @attr.s(slots=True)
@@ -7,7 +7,7 @@ from http import HTTPStatus
 import logging
 from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import voluptuous as vol
 
@@ -51,6 +51,7 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
+from homeassistant.util.uuid import random_uuid_hex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -202,33 +203,124 @@ class APIConfigView(HomeAssistantView):
 
 
 class APIStatesView(HomeAssistantView):
-    """View to handle States requests."""
+    """View to handle States requests.
+
+    The version of the states is sent as the ETag so pollers can revalidate
+    without transferring the states again. With the since query parameter
+    set to a version, only the states changed since that version are
+    returned. Non-admin users only see the states they may read, so their
+    versions are scoped to the user and the revision of their permissions.
+    """
 
     url = URL_API_STATES
     name = "api:states"
 
+    def __init__(self) -> None:
+        """Initialize the states view."""
+        # The epoch tells versions of different runs apart
+        self._epoch = random_uuid_hex()[:8]
+
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
         """Get current states."""
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        states = hass.states
+        scope = self._async_version_scope(user)
+        version = f"{scope}-{states.version}"
+        if (since := request.query.get("since")) is not None:
+            response = self._async_get_changed_states(hass, user, scope, version, since)
+            response.headers[hdrs.VARY] = hdrs.AUTHORIZATION
+            return response
+
+        if (if_none_match := request.if_none_match) is not None and any(
+            etag.value == version for etag in if_none_match
+        ):
+            response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+            response.etag = version
+            response.headers[hdrs.VARY] = hdrs.AUTHORIZATION
+            return response
+
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states_json = (state.as_dict_json for state in states.async_all())
         else:
             entity_perm = user.permissions.check_entity
-            states = (
+            states_json = (
                 state.as_dict_json
-                for state in hass.states.async_all()
+                for state in states.async_all()
                 if entity_perm(state.entity_id, "read")
             )
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=b"".join((b"[", b",".join(states_json), b"]")),
             content_type=CONTENT_TYPE_JSON,
-            zlib_executor_size=32768,
         )
-        response.enable_compression()
+        response.etag = version
+        response.headers[hdrs.VARY] = hdrs.AUTHORIZATION
         return response
 
+    @ha.callback
+    def _async_version_scope(self, user: User) -> str:
+        """Return the scope of the versions of the states a user sees."""
+        if user.is_admin:
+            return self._epoch
+        return f"{self._epoch}.{user.id}.{user.permissions_revision}"
+
+    @ha.callback
+    def _async_get_changed_states(
+        self, hass: HomeAssistant, user: User, scope: str, version: str, since: str
+    ) -> web.Response:
+        """Return the states changed since a version.
+
+        All states are returned, with full set, when the version is from an
+        earlier run, from another scope or too old to know what changed since.
+        A changed scope means the user may now read other states which did
+        not change since the version.
+        """
+        since_scope, _, since_version = since.rpartition("-")
+        try:
+            since_number = int(since_version)
+        except ValueError:
+            return self.json_message("Invalid since version", HTTPStatus.BAD_REQUEST)
+
+        changed = (
+            hass.states.async_changed_since(since_number)
+            if since_scope == scope
+            else None
+        )
+        if changed is None:
+            changed_states = hass.states.async_all()
+            removed: list[str] = []
+        else:
+            changed_states = []
+            removed = []
+            for entity_id in changed:
+                if (state := hass.states.get(entity_id)) is None:
+                    removed.append(entity_id)
+                else:
+                    changed_states.append(state)
+
+        if not user.is_admin:
+            entity_perm = user.permissions.check_entity
+            changed_states = [
+                state
+                for state in changed_states
+                if entity_perm(state.entity_id, "read")
+            ]
+            removed = [
+                entity_id for entity_id in removed if entity_perm(entity_id, "read")
+            ]
+
+        return self.json(
+            {
+                "version": version,
+                "full": changed is None,
+                "states": [
+                    json_fragment(state.as_dict_json) for state in changed_states
+                ],
+                "removed": removed,
+            }
+        )
+
 
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
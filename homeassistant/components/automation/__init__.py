@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_samples
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -85,6 +86,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_disable,
     trace_get,
     trace_path,
 )
@@ -671,19 +673,23 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     return None
 
             # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
+            if automation_trace.recording:
+                automation_trace.set_trace(trace_get())
+            else:
+                trace_disable()
 
             # Set trigger reason
             trigger_description = variables.get("trigger", {}).get("description")
             automation_trace.set_trigger_description(trigger_description)
 
             # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
-            else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if automation_trace.recording:
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -757,6 +763,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self._async_disable()
+        async_remove_trace_samples(self.hass, DOMAIN, self.unique_id)
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
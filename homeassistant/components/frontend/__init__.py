@@ -366,15 +366,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     is_dev = repo_path is not None
     root_path = _frontend_root(repo_path)
 
-    for path, should_cache in (
-        ("service_worker.js", False),
-        ("robots.txt", False),
-        ("onboarding.html", not is_dev),
-        ("static", not is_dev),
-        ("frontend_latest", not is_dev),
-        ("frontend_es5", not is_dev),
+    for path, should_cache, immutable in (
+        ("service_worker.js", False, False),
+        ("robots.txt", False, False),
+        ("onboarding.html", not is_dev, False),
+        ("static", not is_dev, not is_dev),
+        ("frontend_latest", not is_dev, not is_dev),
+        ("frontend_es5", not is_dev, not is_dev),
     ):
-        hass.http.register_static_path(f"/{path}", str(root_path / path), should_cache)
+        hass.http.register_static_path(
+            f"/{path}", str(root_path / path), should_cache, immutable
+        )
 
     hass.http.register_static_path(
         "/auth/authorize", str(root_path / "authorize.html"), False
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import timedelta
+from itertools import count
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +34,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,6 +73,224 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey("state_trigger_index")
+
+
+@dataclass(slots=True)
+class _StateTrigger:
+    """A state trigger attached to the state trigger index."""
+
+    order: int
+    attribute: str | None
+    # The states the trigger changes to when the index matches them,
+    # None when the to matcher needs to be called
+    to_states: frozenset[str] | None
+    match_from_state: Callable[[Any], bool]
+    match_to_state: Callable[[Any], bool]
+    match_all: bool
+    action: Callable[[Event[EventStateChangedData], Any, Any], None]
+
+
+def _bucket_add(
+    buckets: dict[str, tuple[_StateTrigger, ...]], key: str, trigger: _StateTrigger
+) -> None:
+    """Add a trigger to a bucket."""
+    buckets[key] = (*buckets.get(key, ()), trigger)
+
+
+def _bucket_remove(
+    buckets: dict[str, tuple[_StateTrigger, ...]], key: str, trigger: _StateTrigger
+) -> None:
+    """Remove a trigger from a bucket."""
+    if remaining := tuple(item for item in buckets[key] if item is not trigger):
+        buckets[key] = remaining
+    else:
+        del buckets[key]
+
+
+class _EntityStateTriggers:
+    """The state triggers attached for an entity.
+
+    The triggers are kept in tuples which are replaced when a trigger is
+    attached or removed, so triggers can be removed while dispatching.
+    """
+
+    __slots__ = ("by_to_state", "other", "by_attribute", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the state triggers of an entity."""
+        self.by_to_state: dict[str, tuple[_StateTrigger, ...]] = {}
+        self.other: tuple[_StateTrigger, ...] = ()
+        self.by_attribute: dict[str, tuple[_StateTrigger, ...]] = {}
+        self.unsub: CALLBACK_TYPE | None = None
+
+    def add(self, trigger: _StateTrigger) -> None:
+        """Add a trigger."""
+        if trigger.attribute is not None:
+            _bucket_add(self.by_attribute, trigger.attribute, trigger)
+        elif trigger.to_states is not None:
+            for to_state in trigger.to_states:
+                _bucket_add(self.by_to_state, to_state, trigger)
+        else:
+            self.other = (*self.other, trigger)
+
+    def remove(self, trigger: _StateTrigger) -> None:
+        """Remove a trigger."""
+        if trigger.attribute is not None:
+            _bucket_remove(self.by_attribute, trigger.attribute, trigger)
+        elif trigger.to_states is not None:
+            for to_state in trigger.to_states:
+                _bucket_remove(self.by_to_state, to_state, trigger)
+        else:
+            self.other = tuple(item for item in self.other if item is not trigger)
+
+    @property
+    def empty(self) -> bool:
+        """Return if no triggers are attached for the entity."""
+        return not (self.by_to_state or self.other or self.by_attribute)
+
+
+class StateTriggerIndex:
+    """Match the state triggers of all automations in a single pass.
+
+    The index listens once for state changes of each entity and indexes
+    its state triggers by attribute and the states they change to. A
+    state change only calls the actions of the triggers which match it
+    instead of calling a listener for every attached trigger.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the state trigger index."""
+        self._hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+        self._order = count()
+
+    @callback
+    def async_attach(
+        self,
+        entity_ids: str | Iterable[str],
+        attribute: str | None,
+        to_states: frozenset[str] | None,
+        match_from_state: Callable[[Any], bool],
+        match_to_state: Callable[[Any], bool],
+        match_all: bool,
+        action: Callable[[Event[EventStateChangedData], Any, Any], None],
+    ) -> CALLBACK_TYPE:
+        """Attach a state trigger for entities."""
+        trigger = _StateTrigger(
+            next(self._order),
+            attribute,
+            to_states,
+            match_from_state,
+            match_to_state,
+            match_all,
+            action,
+        )
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = list(dict.fromkeys(entity_id.lower() for entity_id in entity_ids))
+        for entity_id in entity_ids:
+            if (entity := self._entities.get(entity_id)) is None:
+                entity = self._entities[entity_id] = _EntityStateTriggers()
+                entity.unsub = async_track_state_change_event(
+                    self._hass, entity_id, self._async_state_listener(entity)
+                )
+            entity.add(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the state trigger."""
+            for entity_id in entity_ids:
+                if (entity := self._entities.get(entity_id)) is None:
+                    continue
+                entity.remove(trigger)
+                if entity.empty:
+                    del self._entities[entity_id]
+                    if entity.unsub is not None:
+                        entity.unsub()
+
+        return async_remove
+
+    @callback
+    def _async_state_listener(
+        self, entity: _EntityStateTriggers
+    ) -> Callable[[Event[EventStateChangedData]], None]:
+        """Return a listener for the state changes of an entity."""
+
+        @callback
+        def _async_state_changed(event: Event[EventStateChangedData]) -> None:
+            """Call the actions of the triggers matching a state change."""
+            from_s = event.data["old_state"]
+            to_s = event.data["new_state"]
+            old_state = None if from_s is None else from_s.state
+            new_state = None if to_s is None else to_s.state
+            matched: list[tuple[_StateTrigger, Any, Any]] = []
+
+            if (
+                new_state is not None
+                and old_state != new_state
+                and (triggers := entity.by_to_state.get(new_state))
+            ):
+                matched.extend(
+                    (trigger, old_state, new_state)
+                    for trigger in triggers
+                    if trigger.match_from_state(old_state)
+                )
+
+            matched.extend(
+                (trigger, old_state, new_state)
+                for trigger in entity.other
+                if trigger.match_from_state(old_state)
+                and trigger.match_to_state(new_state)
+                and (trigger.match_all or old_state != new_state)
+            )
+
+            for attribute, triggers in entity.by_attribute.items():
+                old_value = None if from_s is None else from_s.attributes.get(attribute)
+                new_value = None if to_s is None else to_s.attributes.get(attribute)
+                # Changes of other attributes or the state are ignored
+                if old_value == new_value:
+                    continue
+                matched.extend(
+                    (trigger, old_value, new_value)
+                    for trigger in triggers
+                    if trigger.match_from_state(old_value)
+                    and trigger.match_to_state(new_value)
+                )
+
+            if len(matched) > 1:
+                # Call the actions in the order the triggers were attached
+                matched.sort(key=lambda item: item[0].order)
+            for trigger, old_value, new_value in matched:
+                try:
+                    trigger.action(event, old_value, new_value)
+                except Exception:
+                    _LOGGER.exception(
+                        "Error while dispatching state trigger for %s to %s",
+                        event.data["entity_id"],
+                        trigger.action,
+                    )
+
+        return _async_state_changed
+
+
+@callback
+def _async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+def _to_states(config: ConfigType) -> frozenset[str] | None:
+    """Return the states a trigger changes to if the index can match them."""
+    if CONF_ATTRIBUTE in config or (to_state := config.get(CONF_TO)) is None:
+        return None
+    if isinstance(to_state, str):
+        return None if to_state == MATCH_ALL else frozenset((to_state,))
+    return frozenset(to_state)
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -132,40 +354,14 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData], old_value: Any, new_value: Any
+    ) -> None:
+        """Call action for a state change matching the trigger."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -233,7 +429,15 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = _async_get_state_trigger_index(hass).async_attach(
+        entity_ids,
+        attribute,
+        _to_states(config),
+        match_from_state,
+        match_to_state,
+        match_all,
+        state_automation_listener,
+    )
 
     @callback
     def async_remove() -> None:
@@ -55,6 +55,11 @@ from homeassistant.util.json import json_loads
 
 from .auth import async_setup_auth
 from .ban import setup_bans
+from .compression import (
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_MIN_SIZE,
+    setup_compression,
+)
 from .const import DOMAIN, KEY_HASS_REFRESH_TOKEN_ID, KEY_HASS_USER  # noqa: F401
 from .cors import setup_cors
 from .decorators import require_admin  # noqa: F401
@@ -78,6 +83,8 @@ CONF_TRUSTED_PROXIES: Final = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD: Final = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED: Final = "ip_ban_enabled"
 CONF_SSL_PROFILE: Final = "ssl_profile"
+CONF_COMPRESSION_LEVEL: Final = "compression_level"
+CONF_COMPRESSION_MIN_SIZE: Final = "compression_min_size"
 
 SSL_MODERN: Final = "modern"
 SSL_INTERMEDIATE: Final = "intermediate"
@@ -127,6 +134,12 @@ HTTP_SCHEMA: Final = vol.All(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
             vol.Optional(CONF_USE_X_FRAME_OPTIONS, default=True): cv.boolean,
+            vol.Optional(
+                CONF_COMPRESSION_LEVEL, default=DEFAULT_COMPRESSION_LEVEL
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=9)),
+            vol.Optional(
+                CONF_COMPRESSION_MIN_SIZE, default=DEFAULT_COMPRESSION_MIN_SIZE
+            ): cv.positive_int,
         }
     ),
 )
@@ -150,6 +163,8 @@ class ConfData(TypedDict, total=False):
     login_attempts_threshold: int
     ip_ban_enabled: bool
     ssl_profile: str
+    compression_level: int
+    compression_min_size: int
 
 
 @bind_hass
@@ -199,6 +214,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    compression_level = conf[CONF_COMPRESSION_LEVEL]
+    compression_min_size = conf[CONF_COMPRESSION_MIN_SIZE]
 
     source_ip_task = create_eager_task(async_get_source_ip(hass))
 
@@ -218,6 +235,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
         use_x_frame_options=use_x_frame_options,
+        compression_level=compression_level,
+        compression_min_size=compression_min_size,
     )
 
     async def stop_server(event: Event) -> None:
@@ -331,6 +350,8 @@ class HomeAssistantHTTP:
         login_threshold: int,
         is_ban_enabled: bool,
         use_x_frame_options: bool,
+        compression_level: int,
+        compression_min_size: int,
     ) -> None:
         """Initialize the server."""
         self.app[KEY_HASS] = self.hass
@@ -351,6 +372,7 @@ class HomeAssistantHTTP:
 
         setup_headers(self.app, use_x_frame_options)
         setup_cors(self.app, cors_origins)
+        setup_compression(self.app, compression_level, compression_min_size)
 
         if self.ssl_certificate:
             self.context = await self.hass.async_add_executor_job(
@@ -404,14 +426,27 @@ class HomeAssistantHTTP:
         )
 
     def register_static_path(
-        self, url_path: str, path: str, cache_headers: bool = True
+        self,
+        url_path: str,
+        path: str,
+        cache_headers: bool = True,
+        immutable: bool = False,
     ) -> None:
-        """Register a folder or file to serve as a static path."""
+        """Register a folder or file to serve as a static path.
+
+        An immutable folder does not change while Home Assistant runs, it is
+        indexed in the background and its small files are kept in memory.
+        """
         if os.path.isdir(path):
             if cache_headers:
                 resource: CachingStaticResource | web.StaticResource = (
-                    CachingStaticResource(url_path, path)
+                    CachingStaticResource(url_path, path, immutable=immutable)
                 )
+                if immutable:
+                    self.hass.async_create_background_task(
+                        resource.async_index(self.hass),
+                        f"index static path {url_path}",
+                    )
             else:
                 resource = web.StaticResource(url_path, path)
             self.app.router.register_resource(resource)
@@ -0,0 +1,100 @@
+"""Middleware that compresses responses."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Final
+import zlib
+
+from aiohttp import compression_utils, hdrs
+from aiohttp.compression_utils import ZLibCompressor
+from aiohttp.helpers import ETag
+from aiohttp.web import Application, Request, Response, StreamResponse, middleware
+
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import callback
+
+from .static import _accepted_encodings
+
+DEFAULT_COMPRESSION_LEVEL: Final = 6
+DEFAULT_COMPRESSION_MIN_SIZE: Final = 1024
+# Responses larger than this are compressed in the executor
+COMPRESSION_EXECUTOR_SIZE: Final = 32768
+
+COMPRESSIBLE_CONTENT_TYPES: Final = frozenset(
+    {CONTENT_TYPE_JSON, "text/plain", "text/html"}
+)
+
+
+def _backend_level(level: int) -> int:
+    """Map a zlib compression level onto the levels of the active zlib backend.
+
+    aiohttp_fast_zlib may switch aiohttp to isal which only supports levels 0-3.
+    """
+    backend_best = compression_utils.zlib.Z_BEST_COMPRESSION
+    if backend_best == zlib.Z_BEST_COMPRESSION:
+        return level
+    return round(level * backend_best / zlib.Z_BEST_COMPRESSION)
+
+
+def _accepted_coding(request: Request) -> str | None:
+    """Return the content coding to compress a response with.
+
+    The coding with the highest q-value wins, gzip is preferred on ties.
+    """
+    accepted = _accepted_encodings(
+        request.headers.get(hdrs.ACCEPT_ENCODING, "").lower()
+    )
+    wildcard = accepted.get("*", 0.0)
+    best: str | None = None
+    best_q = 0.0
+    for coding in ("gzip", "deflate"):
+        if (q := accepted.get(coding, wildcard)) > best_q:
+            best, best_q = coding, q
+    return best
+
+
+@callback
+def setup_compression(app: Application, level: int, min_size: int) -> None:
+    """Create compression middleware for the app.
+
+    Responses with a body of at least min_size bytes are compressed when the
+    client accepts it. Responses that already enabled compression, stream
+    their body or are already encoded are left alone.
+    """
+
+    @middleware
+    async def compression_middleware(
+        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
+    ) -> StreamResponse:
+        """Compress the body of the response."""
+        response = await handler(request)
+        if (
+            not isinstance(response, Response)
+            or response.compression
+            or hdrs.CONTENT_ENCODING in response.headers
+            or not isinstance(body := response.body, bytes)
+            or len(body) < min_size
+            or response.content_type not in COMPRESSIBLE_CONTENT_TYPES
+        ):
+            return response
+
+        response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+        if (coding := _accepted_coding(request)) is None:
+            return response
+
+        compressor = ZLibCompressor(
+            encoding=coding,
+            level=_backend_level(level),
+            max_sync_chunk_size=COMPRESSION_EXECUTOR_SIZE,
+        )
+        response.body = await compressor.compress(body) + compressor.flush()
+        response.headers[hdrs.CONTENT_ENCODING] = coding
+        response.headers.pop(hdrs.CONTENT_LENGTH, None)
+        # The encoded body is not byte for byte the representation the
+        # strong ETag was computed for
+        if (etag := response.etag) is not None and not etag.is_weak:
+            response.etag = ETag(value=etag.value, is_weak=True)
+        return response
+
+    app.middlewares.append(compression_middleware)
@@ -2,23 +2,140 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 import mimetypes
+import os
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
+from homeassistant.core import HomeAssistant
+
 from .const import KEY_HASS
 
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
-PATH_CACHE: LRU[tuple[str, Path], tuple[Path | None, str | None]] = LRU(512)
+PATH_CACHE: LRU[tuple[str, Path], StaticFile | None] = LRU(512)
+
+# Precompressed variants stored next to a file, in order of preference
+ENCODING_EXTENSIONS: Final = (("br", ".br"), ("gzip", ".gz"))
+# Files of immutable directories up to this size are kept in memory
+MAX_MEMORY_FILE_SIZE: Final = 64 * 1024
+MAX_MEMORY_CACHE_SIZE: Final = 16 * 1024 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class StaticVariant:
+    """A representation of a static file on disk."""
+
+    path: Path
+    encoding: str | None
+    etag: str
+    size: int
+    last_modified: float
+
+
+@dataclass(slots=True, frozen=True)
+class StaticFile:
+    """A static file and its precompressed variants."""
+
+    content_type: str
+    # Precompressed variants in order of preference, the identity is last
+    variants: tuple[StaticVariant, ...]
+
+    def variant(self, accept_encoding: str) -> StaticVariant:
+        """Return the preferred variant for the accepted encodings.
+
+        The encoding with the highest q-value wins, ties are broken by the
+        order of preference of the variants.
+        """
+        accepted = _accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best: StaticVariant | None = None
+        best_q = 0.0
+        for variant in self.variants:
+            if variant.encoding is None:
+                return best or variant
+            if (q := accepted.get(variant.encoding, wildcard)) > best_q:
+                best, best_q = variant, q
+        raise AssertionError("identity variant missing")
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Return the q-value of each coding of a lowercased Accept-Encoding header."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if not (coding := coding.strip()):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class _VariantFileResponse(FileResponse):
+    """A FileResponse for a variant that was already selected.
+
+    FileResponse serves a .gz file next to the file whenever gzip appears in
+    the Accept-Encoding header, which would override the selected variant.
+    """
+
+    def _get_file_path_stat_and_gzip(
+        self, check_for_gzipped_file: bool
+    ) -> tuple[Path, os.stat_result, bool]:
+        """Return the file path and stat result of the variant."""
+        return super()._get_file_path_stat_and_gzip(False)
+
+
+class _MemoryCache:
+    """Keep the bodies of recently served files in memory up to a total size."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the memory cache."""
+        self.max_size = max_size
+        self.size = 0
+        self._bodies: OrderedDict[Path, bytes] = OrderedDict()
+
+    def get(self, path: Path) -> bytes | None:
+        """Return the body of a file and mark it as recently used."""
+        if (body := self._bodies.get(path)) is not None:
+            self._bodies.move_to_end(path)
+        return body
+
+    def add(self, path: Path, body: bytes) -> None:
+        """Add the body of a file and evict the least recently used bodies."""
+        if (previous := self._bodies.pop(path, None)) is not None:
+            self.size -= len(previous)
+        self._bodies[path] = body
+        self.size += len(body)
+        while self.size > self.max_size:
+            self.size -= len(self._bodies.popitem(last=False)[1])
+
+    def clear(self) -> None:
+        """Remove all bodies."""
+        self._bodies.clear()
+        self.size = 0
+
+
+MEMORY_CACHE = _MemoryCache(MAX_MEMORY_CACHE_SIZE)
 
 
 def _get_file_path(rel_url: str, directory: Path) -> Path | None:
@@ -39,45 +156,174 @@ def _get_file_path(rel_url: str, directory: Path) -> Path | None:
     raise FileNotFoundError
 
 
+def _get_variant(path: Path, encoding: str | None) -> StaticVariant:
+    """Return a variant of a static file from its stat.
+
+    The ETag matches the one FileResponse sends for the same file.
+    """
+    st = path.stat()
+    return StaticVariant(
+        path, encoding, f"{st.st_mtime_ns:x}-{st.st_size:x}", st.st_size, st.st_mtime
+    )
+
+
+def _get_static_file(rel_url: str, filepath: Path) -> StaticFile:
+    """Return a static file with the precompressed variants next to it."""
+    variants: list[StaticVariant] = []
+    for encoding, extension in ENCODING_EXTENSIONS:
+        variant_path = filepath.with_name(filepath.name + extension)
+        try:
+            if variant_path.is_file():
+                variants.append(_get_variant(variant_path, encoding))
+        except OSError:
+            continue
+    variants.append(_get_variant(filepath, None))
+    content_type = mimetypes.guess_type(rel_url)[0] or "application/octet-stream"
+    return StaticFile(content_type, tuple(variants))
+
+
+def _lookup_static_file(rel_url: str, directory: Path) -> StaticFile | None:
+    """Return the static file on disk or None for a directory."""
+    if (filepath := _get_file_path(rel_url, directory)) is None:
+        return None
+    return _get_static_file(rel_url, filepath)
+
+
+def _index_directory(directory: Path) -> dict[str, StaticFile]:
+    """Return the static files of a directory by their relative url.
+
+    Symlinks are skipped so the index never points outside the directory,
+    they are still served after looking them up on request.
+    """
+    encoded_suffixes = {extension for _, extension in ENCODING_EXTENSIONS}
+    index: dict[str, StaticFile] = {}
+    for root, _, filenames in os.walk(directory):
+        root_path = Path(root)
+        rel_root = root_path.relative_to(directory).as_posix()
+        names = set(filenames)
+        for filename in filenames:
+            stem, suffix = os.path.splitext(filename)
+            if suffix in encoded_suffixes and stem in names:
+                continue
+            filepath = root_path / filename
+            rel_url = filename if rel_root == "." else f"{rel_root}/{filename}"
+            try:
+                if filepath.is_symlink():
+                    continue
+                variants = [
+                    _get_variant(filepath.with_name(filename + extension), encoding)
+                    for encoding, extension in ENCODING_EXTENSIONS
+                    if filename + extension in names
+                ]
+                variants.append(_get_variant(filepath, None))
+            except OSError:
+                continue
+            content_type = (
+                mimetypes.guess_type(rel_url)[0] or "application/octet-stream"
+            )
+            index[rel_url] = StaticFile(content_type, tuple(variants))
+    return index
+
+
+def _read_body(path: Path) -> bytes:
+    """Read the body of a file."""
+    return path.read_bytes()
+
+
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Files are served precompressed when a `.br` or `.gz` variant exists next
+    to them and the client accepts the encoding. When the directory is
+    immutable, it is indexed at startup, conditional requests are answered
+    from the index and small files are kept in memory.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        directory: str | Path,
+        *,
+        immutable: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the static resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self.immutable = immutable
+        self._index: dict[str, StaticFile] = {}
+
+    async def async_index(self, hass: HomeAssistant) -> None:
+        """Index the static files of an immutable directory."""
+        self._index = await hass.async_add_executor_job(
+            _index_directory, self._directory
+        )
+
+    async def _async_get_static_file(
+        self, request: Request, rel_url: str
+    ) -> StaticFile | None:
+        """Return the static file for a url or None for a directory."""
+        if (static_file := self._index.get(rel_url)) is not None:
+            return static_file
+        key = (rel_url, self._directory)
+        if key in PATH_CACHE:
+            return PATH_CACHE[key]
+        hass = request.app[KEY_HASS]
+        try:
+            static_file = await hass.async_add_executor_job(_lookup_static_file, *key)
+        except (ValueError, FileNotFoundError) as error:
+            # relatively safe
+            raise HTTPNotFound from error
+        except HTTPForbidden:
+            # forbidden
+            raise
+        except Exception as error:
+            # perm error or other kind!
+            request.app.logger.exception("Unexpected exception")
+            raise HTTPNotFound from error
+        PATH_CACHE[key] = static_file
+        return static_file
 
     async def _handle(self, request: Request) -> StreamResponse:
-        """Return requested file from disk as a FileResponse."""
+        """Return requested file from memory or disk."""
         rel_url = request.match_info["filename"]
-        key = (rel_url, self._directory)
-        if (filepath_content_type := PATH_CACHE.get(key)) is None:
-            hass = request.app[KEY_HASS]
-            try:
-                filepath = await hass.async_add_executor_job(_get_file_path, *key)
-            except (ValueError, FileNotFoundError) as error:
-                # relatively safe
-                raise HTTPNotFound from error
-            except HTTPForbidden:
-                # forbidden
-                raise
-            except Exception as error:
-                # perm error or other kind!
-                request.app.logger.exception("Unexpected exception")
-                raise HTTPNotFound from error
-
-            content_type: str | None = None
-            if filepath is not None:
-                content_type = (mimetypes.guess_type(rel_url))[
-                    0
-                ] or "application/octet-stream"
-            PATH_CACHE[key] = (filepath, content_type)
-        else:
-            filepath, content_type = filepath_content_type
-
-        if filepath and content_type:
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers={
-                    hdrs.CACHE_CONTROL: CACHE_HEADER,
-                    hdrs.CONTENT_TYPE: content_type,
-                },
+        if (static_file := await self._async_get_static_file(request, rel_url)) is None:
+            return await super()._handle(request)
+
+        variant = static_file.variant(
+            request.headers.get(hdrs.ACCEPT_ENCODING, "").lower()
+        )
+        headers = {
+            hdrs.CACHE_CONTROL: CACHE_HEADER,
+            hdrs.CONTENT_TYPE: static_file.content_type,
+        }
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if variant.encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = variant.encoding
+
+        if not self.immutable or hdrs.RANGE in request.headers:
+            return _VariantFileResponse(
+                variant.path, chunk_size=self._chunk_size, headers=headers
             )
 
-        return await super()._handle(request)
+        response: StreamResponse
+        if (if_none_match := request.if_none_match) is not None and any(
+            etag.value in (variant.etag, ETAG_ANY) for etag in if_none_match
+        ):
+            del headers[hdrs.CONTENT_TYPE]
+            headers.pop(hdrs.CONTENT_ENCODING, None)
+            response = Response(status=HTTPNotModified.status_code, headers=headers)
+        elif variant.size > MAX_MEMORY_FILE_SIZE:
+            return _VariantFileResponse(
+                variant.path, chunk_size=self._chunk_size, headers=headers
+            )
+        else:
+            if (body := MEMORY_CACHE.get(variant.path)) is None:
+                body = await request.app[KEY_HASS].async_add_executor_job(
+                    _read_body, variant.path
+                )
+                MEMORY_CACHE.add(variant.path, body)
+            response = Response(body=body, headers=headers)
+        response.etag = variant.etag
+        response.last_modified = variant.last_modified
+        return response
@@ -36,6 +36,8 @@ from homeassistant.util.event_type import EventType
 from . import rest_api, websocket_api
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
+    AUTOMATION_EVENTS,
+    BUILT_IN_EVENTS,
     DOMAIN,
     LOGBOOK_ENTRY_CONTEXT_ID,
     LOGBOOK_ENTRY_DOMAIN,
@@ -44,7 +46,9 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_MESSAGE,
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
+    RECENT_EVENTS_BUFFER_SIZE,
 )
+from .helpers import RecentEventsBuffer
 from .models import LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
@@ -138,7 +142,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    recent_events = RecentEventsBuffer(hass, RECENT_EVENTS_BUFFER_SIZE)
+    recent_events.async_setup((*BUILT_IN_EVENTS, *AUTOMATION_EVENTS))
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, recent_events=recent_events
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -162,5 +170,7 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        if recent_events := logbook_config.recent_events:
+            recent_events.async_add_event_type(event_name)
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -48,3 +48,9 @@ AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
 # Events that are built-in to the logbook or core
 BUILT_IN_EVENTS = {EVENT_LOGBOOK_ENTRY, EVENT_CALL_SERVICE}
+
+# The number of context origin rows to keep between logbook requests
+CONTEXT_ROWS_CACHE_SIZE = 4096
+
+# The number of recent events to keep in memory for new live streams
+RECENT_EVENTS_BUFFER_SIZE = 2048
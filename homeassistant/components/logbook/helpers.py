@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime as dt
+import time
 from typing import Any
 
 from homeassistant.components.sensor import ATTR_STATE_CLASS
@@ -11,6 +14,7 @@ from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
 )
@@ -214,6 +218,102 @@ def async_subscribe_events(
     )
 
 
+class RecentEventsBuffer:
+    """Buffer the most recent events the logbook live stream delivers.
+
+    Live streams that start inside the buffered window are
+    replayed from memory instead of querying the database.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_events: int) -> None:
+        """Init the buffer."""
+        self._hass = hass
+        self._events: deque[Event[Any]] = deque(maxlen=max_events)
+        self._event_types: set[EventType[Any] | str] = set()
+        # Every event fired after this timestamp is in the buffer
+        self._start_timestamp = time.time()
+
+    @callback
+    def async_setup(self, event_types: Iterable[EventType[Any] | str]) -> None:
+        """Start buffering state changes and the given event types."""
+        self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_add_state_event)
+        for event_type in event_types:
+            self.async_add_event_type(event_type)
+
+    @callback
+    def async_add_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Start buffering an event type."""
+        # Service calls are only used to provide context which live
+        # streams get from the origin event of the context instead
+        if event_type == EVENT_CALL_SERVICE or event_type in self._event_types:
+            return
+        self._event_types.add(event_type)
+        self._hass.bus.async_listen(event_type, self._async_add_event)
+        # Events of this type were not buffered until now so
+        # what is in the buffer is no longer complete
+        self._events.clear()
+        self._start_timestamp = time.time()
+
+    @callback
+    def _async_add_event(self, event: Event[Any]) -> None:
+        """Add an event to the buffer."""
+        events = self._events
+        if len(events) == events.maxlen:
+            self._start_timestamp = events[0].time_fired_timestamp
+        events.append(event)
+
+    @callback
+    def _async_add_state_event(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state changed event to the buffer if the logbook shows it."""
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if not _is_state_filtered(new_state, old_state):
+            self._async_add_event(event)
+
+    @callback
+    def async_get_events(
+        self,
+        start_time: dt,
+        event_types: tuple[EventType[Any] | str, ...],
+        entities_filter: Callable[[str], bool] | None,
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+    ) -> list[Event[Any]] | None:
+        """Get the buffered events after start_time that a live stream would get.
+
+        Returns None if the buffer does not cover start_time.
+        """
+        start_timestamp = start_time.timestamp()
+        if start_timestamp < self._start_timestamp:
+            return None
+        events: list[Event[Any]] = []
+        forward_event = event_forwarder_filtered(
+            events.append, entities_filter, entity_ids, device_ids
+        )
+        wanted_event_types = set(event_types)
+        # Device only streams do not get any state changed events
+        include_states = bool(entity_ids or not device_ids)
+        entity_ids_set = set(entity_ids) if entity_ids else None
+        for event in self._events:
+            if event.time_fired_timestamp <= start_timestamp:
+                continue
+            event_type = event.event_type
+            if event_type != EVENT_STATE_CHANGED:
+                if event_type in wanted_event_types:
+                    forward_event(event)
+                continue
+            if not include_states:
+                continue
+            entity_id: str = event.data["entity_id"]
+            if (entity_ids_set is None or entity_id in entity_ids_set) and (
+                not entities_filter or entities_filter(entity_id)
+            ):
+                events.append(event)
+        return events
+
+
 def is_sensor_continuous(
     hass: HomeAssistant, ent_reg: er.EntityRegistry, entity_id: str
 ) -> bool:
@@ -7,10 +7,11 @@ from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -37,6 +38,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -65,7 +67,7 @@ from .const import (
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
-from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.common import PSEUDO_EVENT_STATE_CHANGED, context_rows_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -111,6 +113,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.context_rows = logbook_config.context_rows
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -168,9 +171,45 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            # Without a time window all the rows are fetched at once
+            rows = cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
             )
+            if self.entity_ids or self.device_ids:
+                self._load_context_rows(session, rows)
+            return self.humanify(rows)
+
+    def _load_context_rows(self, session: Session, rows: Sequence[Row]) -> None:
+        """Load the rows that originated the contexts of the rows.
+
+        The entity and device queries only select the rows that
+        match, so the rows that originated their contexts are
+        looked up by context id and remembered between runs
+        since they will never change once they have been recorded.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_rows = self.context_rows
+        missing_context_id_bins: set[bytes] = set()
+        for row in rows:
+            context_id_bin: bytes = row.context_id_bin
+            if context_id_bin in context_lookup:
+                continue
+            if context_row := context_rows.get(context_id_bin):
+                context_lookup[context_id_bin] = context_row
+            else:
+                missing_context_id_bins.add(context_id_bin)
+        if not missing_context_id_bins:
+            return
+        max_bind_vars = get_instance(self.hass).max_bind_vars
+        for context_id_bins in chunked_or_all(missing_context_id_bins, max_bind_vars):
+            for context_row in execute_stmt_lambda_element(
+                session, context_rows_stmt(context_id_bins), orm_rows=False
+            ):
+                context_id_bin = context_row.context_id_bin
+                if context_id_bin not in context_lookup:
+                    context_lookup[context_id_bin] = context_row
+                    context_rows[context_id_bin] = context_row
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
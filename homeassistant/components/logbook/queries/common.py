@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Final
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, union_all
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from homeassistant.components.recorder.db_schema import (
@@ -107,21 +109,6 @@ CONTEXT_ONLY = literal(value="1", type_=sqlalchemy.String).label("context_only")
 NOT_CONTEXT_ONLY = literal(value=None, type_=sqlalchemy.String).label("context_only")
 
 
-def select_events_context_id_subquery(
-    start_day: float,
-    end_day: float,
-    event_type_ids: tuple[int, ...],
-) -> Select:
-    """Generate the select for a context_id subquery."""
-    return (
-        select(Events.context_id_bin)
-        .where((Events.time_fired_ts > start_day) & (Events.time_fired_ts < end_day))
-        .where(Events.event_type_id.in_(event_type_ids))
-        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-        .outerjoin(EventData, (Events.data_id == EventData.data_id))
-    )
-
-
 def select_events_context_only() -> Select:
     """Generate an events query that mark them as for context_only.
 
@@ -268,3 +255,28 @@ def apply_events_context_hints(sel: Select) -> Select:
     ).with_hint(
         Events, f"FORCE INDEX ({EVENTS_CONTEXT_ID_BIN_INDEX})", dialect_name="mariadb"
     )
+
+
+def context_rows_stmt(context_id_bins: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a logbook query to find the rows for specific context ids.
+
+    The rows are marked as context_only and are ordered by time fired
+    so the first row for each context id is the row that originated it.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(Events.context_id_bin.in_(context_id_bins))
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_id_bins))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
@@ -214,6 +214,38 @@ def _ws_stream_get_events(
     return json_bytes(formatter(msg_id, message)), last_time
 
 
+@callback
+def _async_send_buffered_events(
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    events: list[Event],
+    event_processor: EventProcessor,
+) -> None:
+    """Deliver buffered events to the websocket as if they came from the database.
+
+    The buffered events are processed the same way as live
+    events so the event processor is switched to live first.
+    """
+    event_processor.switch_to_live()
+    logbook_events = event_processor.humanify(async_event_to_row(e) for e in events)
+    last_event_time = None
+    if logbook_events:
+        last_event_time = dt_util.utc_from_timestamp(logbook_events[-1]["when"])
+    message = _generate_stream_message(logbook_events, start_time, end_time)
+    message["partial"] = True
+    connection.send_message(json_bytes(messages.event_message(msg_id, message)))
+    # There is nothing waiting to be committed by the recorder
+    # so the final historical message is always empty
+    final_message = _generate_stream_message(
+        [],
+        (last_event_time or start_time) + timedelta(microseconds=1),
+        end_time,
+    )
+    connection.send_message(json_bytes(messages.event_message(msg_id, final_message)))
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
@@ -361,9 +393,9 @@ async def ws_event_stream(
             )
             _unsub()
 
+    logbook_config: LogbookConfig = hass.data[DOMAIN]
     entities_filter: Callable[[str], bool] | None = None
     if not event_processor.limited_select:
-        logbook_config: LogbookConfig = hass.data[DOMAIN]
         entities_filter = logbook_config.entity_filter
 
     async_subscribe_events(
@@ -378,6 +410,33 @@ async def ws_event_stream(
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
+
+    if (recent_events := logbook_config.recent_events) and (
+        buffered_events := recent_events.async_get_events(
+            start_time, event_types, entities_filter, entity_ids, device_ids
+        )
+    ) is not None:
+        # Everything since the start time is still in memory
+        # so we can replay it without going to the database
+        _async_send_buffered_events(
+            connection,
+            msg_id,
+            start_time,
+            subscriptions_setup_complete_time,
+            buffered_events,
+            event_processor,
+        )
+        live_stream.task = create_eager_task(
+            _async_events_consumer(
+                subscriptions_setup_complete_time,
+                connection,
+                msg_id,
+                stream_queue,
+                event_processor,
+            )
+        )
+        return
+
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
         hass,
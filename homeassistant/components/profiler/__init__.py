@@ -17,16 +17,28 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity import (
+    WriteStateStats,
+    async_get_write_state_stats,
+    async_start_write_state_stats,
+    async_stop_write_state_stats,
+)
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +52,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_WRITE_STATE_STATS = "start_write_state_stats"
+SERVICE_STOP_WRITE_STATE_STATS = "stop_write_state_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,18 +77,24 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_WRITE_STATE_STATS,
+    SERVICE_STOP_WRITE_STATE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
+DEFAULT_MAX_ENTRIES = 20
 
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_ENTRIES = "max_entries"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = [Platform.SENSOR]
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -273,6 +293,31 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_start_write_state_stats(call: ServiceCall) -> None:
+        if async_get_write_state_stats(hass) is not None:
+            raise HomeAssistantError("Write state stats already started")
+        async_start_write_state_stats(hass)
+        persistent_notification.async_create(
+            hass,
+            (
+                "Collecting write state statistics has started. Stop it to log the"
+                " entities and integrations that write their state the most."
+            ),
+            title="Write state stats started",
+            notification_id="profile_write_state_stats",
+        )
+
+    @callback
+    def _async_stop_write_state_stats(call: ServiceCall) -> None:
+        if (stats := async_stop_write_state_stats(hass)) is None:
+            raise HomeAssistantError("Write state stats not running")
+        persistent_notification.async_dismiss(hass, "profile_write_state_stats")
+        _log_write_state_stats(stats, call.data[CONF_MAX_ENTRIES])
+
+    websocket_api.async_register_command(hass, ws_write_state_stats)
+    websocket_api.async_register_command(hass, ws_subscribe_loop_monitor)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,15 +427,125 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_WRITE_STATE_STATS,
+        _async_start_write_state_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_WRITE_STATE_STATS,
+        _async_stop_write_state_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_ENTRIES, default=DEFAULT_MAX_ENTRIES): vol.Range(
+                    min=1, max=1024
+                ),
+            }
+        ),
+    )
+
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    monitor.async_start()
+
+    async def _async_stop_loop_monitor(_: Event) -> None:
+        await monitor.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_loop_monitor)
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/write_state_stats"})
+@callback
+def ws_write_state_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the write state statistics collected so far."""
+    if (stats := async_get_write_state_stats(hass)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Write state stats not running"
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "started": stats.started,
+            "entities": {
+                entity_id: entity_stats.as_dict()
+                for entity_id, entity_stats in stats.entities.items()
+            },
+            "platforms": {
+                platform: platform_stats.as_dict()
+                for platform, platform_stats in stats.async_platform_stats().items()
+            },
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/loop_monitor/subscribe"}
+)
+@callback
+def ws_subscribe_loop_monitor(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the health of the event loop."""
+    msg_id: int = msg["id"]
+    monitor: LoopMonitor | None
+    if (domain_data := hass.data.get(DOMAIN)) is None or (
+        monitor := domain_data.get(LOOP_MONITOR)
+    ) is None:
+        connection.send_error(
+            msg_id, websocket_api.ERR_NOT_FOUND, "Loop monitor is not running"
+        )
+        return
+
+    @callback
+    def _async_send_snapshot(snapshot: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg_id, snapshot))
+
+    connection.subscriptions[msg_id] = monitor.async_subscribe(_async_send_snapshot)
+    connection.send_result(msg_id)
+    _async_send_snapshot(monitor.async_as_dict())
+
+
+def _log_write_state_stats(stats: WriteStateStats, max_entries: int) -> None:
+    """Log the entities and platforms that write their state the most."""
+    _LOGGER.critical(
+        "Write state stats collected for %.1f seconds",
+        time.time() - stats.started,
+    )
+    for platform_stats in sorted(
+        stats.async_platform_stats().values(),
+        key=lambda platform_stats: platform_stats.writes,
+        reverse=True,
+    )[:max_entries]:
+        _LOGGER.critical("Write state stats for platform: %s", platform_stats)
+    for entity_id, entity_stats in sorted(
+        stats.entities.items(), key=lambda item: item[1].writes, reverse=True
+    )[:max_entries]:
+        _LOGGER.critical("Write state stats for %s: %s", entity_id, entity_stats)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    async_stop_write_state_stats(hass)
+    await hass.data[DOMAIN][LOOP_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
@@ -2,3 +2,4 @@
 
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+LOOP_MONITOR = "loop_monitor"
@@ -0,0 +1,239 @@
+"""Monitor the health of the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+import sys
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import frame
+from homeassistant.helpers.event import async_track_time_interval
+
+# Interval between lag samples in seconds
+LAG_SAMPLE_INTERVAL = 0.5
+# Number of lag samples kept, five minutes worth of samples
+LAG_SAMPLES = 600
+# Callbacks blocking the event loop for longer than this are slow
+SLOW_CALLBACK_THRESHOLD = 0.25
+# Interval the watchdog thread checks the event loop is responsive
+WATCHDOG_INTERVAL = 0.05
+MAX_RECENT_SLOW_CALLBACKS = 50
+# Interval snapshots are sent to subscribers
+SUBSCRIPTION_INTERVAL = timedelta(seconds=5)
+
+_PERCENTILES = (50, 95, 99)
+_INTEGRATION_PATHS = ("custom_components/", "homeassistant/components/")
+
+
+@dataclass(slots=True)
+class SlowCallback:
+    """A callback that blocked the event loop."""
+
+    integration: str | None
+    task: str | None
+    relative_filename: str | None
+    line_number: int | None
+    timestamp: float
+    duration: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the slow callback as a dict."""
+        return {
+            "integration": self.integration,
+            "task": self.task,
+            "relative_filename": self.relative_filename,
+            "line_number": self.line_number,
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+        }
+
+
+@lru_cache(maxsize=1024)
+def _integration_from_filename(filename: str) -> str | None:
+    """Return the integration a source file belongs to."""
+    for path in _INTEGRATION_PATHS:
+        if (index := filename.find(path)) != -1:
+            start = index + len(path)
+            if (end := filename.find("/", start)) != -1:
+                return filename[start:end]
+    return None
+
+
+def _task_integration(task: asyncio.Task[Any]) -> str | None:
+    """Return the integration that runs a task.
+
+    The await chain of the task is followed from the outermost coroutine
+    and the first coroutine that lives in an integration wins.
+    """
+    coro: Any = task.get_coro()
+    while coro is not None and (code := getattr(coro, "cr_code", None)):
+        if integration := _integration_from_filename(code.co_filename):
+            return integration
+        coro = getattr(coro, "cr_await", None)
+    return None
+
+
+class LoopMonitor:
+    """Measure the lag of the event loop and attribute slow callbacks.
+
+    A periodic callback samples how late the event loop runs it. A watchdog
+    thread notices when the samples stop and captures the stack of the
+    event loop thread to attribute the callback that blocks it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop monitor."""
+        self._hass = hass
+        self._loop = hass.loop
+        self._loop_thread_id = threading.get_ident()
+        self.lag_samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self.slow_callbacks: Counter[str] = Counter()
+        self.recent_slow_callbacks: deque[SlowCallback] = deque(
+            maxlen=MAX_RECENT_SLOW_CALLBACKS
+        )
+        self._sample_handle: asyncio.TimerHandle | None = None
+        self._heartbeat = time.monotonic()
+        self._stall: SlowCallback | None = None
+        self._stop_event = threading.Event()
+        self._watchdog: threading.Thread | None = None
+        self._subscriptions: set[CALLBACK_TYPE] = set()
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring the event loop."""
+        self._heartbeat = time.monotonic()
+        self._stop_event.clear()
+        self._async_schedule_sample()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="profiler_loop_monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def async_stop(self) -> None:
+        """Stop monitoring the event loop and close the subscriptions."""
+        for cancel_interval in self._subscriptions:
+            cancel_interval()
+        self._subscriptions.clear()
+        if self._sample_handle is not None:
+            self._sample_handle.cancel()
+            self._sample_handle = None
+        if (watchdog := self._watchdog) is not None:
+            self._watchdog = None
+            self._stop_event.set()
+            await self._loop.run_in_executor(None, watchdog.join)
+
+    @callback
+    def async_subscribe(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Send a snapshot of the loop health to the listener periodically."""
+
+        @callback
+        def _async_send_snapshot(*_: Any) -> None:
+            listener(self.async_as_dict())
+
+        cancel_interval = async_track_time_interval(
+            self._hass,
+            _async_send_snapshot,
+            SUBSCRIPTION_INTERVAL,
+            name="profiler loop monitor subscription",
+        )
+        self._subscriptions.add(cancel_interval)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if cancel_interval in self._subscriptions:
+                self._subscriptions.remove(cancel_interval)
+                cancel_interval()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_schedule_sample(self) -> None:
+        """Schedule the next lag sample."""
+        expected = self._loop.time() + LAG_SAMPLE_INTERVAL
+        self._sample_handle = self._loop.call_at(expected, self._async_sample, expected)
+
+    @callback
+    def _async_sample(self, expected: float) -> None:
+        """Record how late the sample callback runs."""
+        lag = max(self._loop.time() - expected, 0.0)
+        self.lag_samples.append(lag)
+        self._heartbeat = time.monotonic()
+        if (stall := self._stall) is not None:
+            self._stall = None
+            stall.duration = lag
+            self.recent_slow_callbacks.append(stall)
+            self.slow_callbacks[stall.integration or "unknown"] += 1
+        self._async_schedule_sample()
+
+    def _watch(self) -> None:
+        """Capture the stack of the event loop thread while it is blocked."""
+        while not self._stop_event.wait(WATCHDOG_INTERVAL):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - LAG_SAMPLE_INTERVAL
+            if stalled < SLOW_CALLBACK_THRESHOLD or self._stall is not None:
+                continue
+            if (loop_frame := sys._current_frames().get(self._loop_thread_id)) is None:  # noqa: SLF001
+                continue
+            task = asyncio.current_task(self._loop)
+            try:
+                integration_frame = frame.get_integration_frame(start_frame=loop_frame)
+            except frame.MissingIntegrationFrame:
+                stall = SlowCallback(None, None, None, None, time.time())
+            else:
+                stall = SlowCallback(
+                    integration_frame.integration,
+                    None,
+                    integration_frame.relative_filename,
+                    integration_frame.line_number,
+                    time.time(),
+                )
+            if task is not None:
+                stall.task = task.get_name()
+            # The loop may have caught up while the stack was inspected
+            if heartbeat == self._heartbeat:
+                self._stall = stall
+
+    @callback
+    def async_lag_percentiles(self) -> dict[str, float]:
+        """Return the percentiles of the lag samples in seconds."""
+        if not (samples := sorted(self.lag_samples)):
+            return {}
+        last = len(samples) - 1
+        percentiles = {
+            f"p{percentile}": samples[round(last * percentile / 100)]
+            for percentile in _PERCENTILES
+        }
+        percentiles["max"] = samples[-1]
+        return percentiles
+
+    @callback
+    def async_task_counts(self) -> dict[str, int]:
+        """Return the number of running tasks per integration."""
+        return dict(
+            Counter(
+                _task_integration(task) or "homeassistant"
+                for task in asyncio.all_tasks(self._loop)
+            )
+        )
+
+    @callback
+    def async_as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of the loop health."""
+        return {
+            "lag": self.async_lag_percentiles(),
+            "slow_callbacks": dict(self.slow_callbacks),
+            "recent_slow_callbacks": [
+                slow_callback.as_dict() for slow_callback in self.recent_slow_callbacks
+            ],
+            "tasks": self.async_task_counts(),
+        }
@@ -0,0 +1,110 @@
+"""Sensors for the health of the event loop."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import DEFAULT_NAME, DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a loop monitor sensor entity."""
+
+    value_fn: Callable[[LoopMonitor], StateType]
+
+
+def _lag_ms(key: str) -> Callable[[LoopMonitor], StateType]:
+    """Return a function that returns a lag percentile in milliseconds."""
+
+    def _value(monitor: LoopMonitor) -> StateType:
+        if (lag := monitor.async_lag_percentiles().get(key)) is None:
+            return None
+        return round(lag * 1000, 1)
+
+    return _value
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    *(
+        LoopMonitorSensorEntityDescription(
+            key=f"event_loop_lag_{key}",
+            translation_key=f"event_loop_lag_{key}",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=_lag_ms(key),
+        )
+        for key in ("p50", "p95", "p99", "max")
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_slow_callbacks",
+        translation_key="event_loop_slow_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda monitor: monitor.slow_callbacks.total(),
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_tasks",
+        translation_key="event_loop_tasks",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda monitor: sum(monitor.async_task_counts().values()),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the loop monitor sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        LoopMonitorSensor(monitor, entry, description) for description in SENSORS
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Representation of a loop monitor sensor."""
+
+    entity_description: LoopMonitorSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: LoopMonitorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=DEFAULT_NAME,
+        )
+
+    async def async_update(self) -> None:
+        """Update the sensor from the loop monitor."""
+        self._attr_native_value = self.entity_description.value_fn(self._monitor)
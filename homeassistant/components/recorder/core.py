@@ -91,7 +91,7 @@ from .migration import (
     StatesContextIDMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, READ_POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -133,6 +133,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -180,6 +181,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[EventType[Any] | str],
+        read_uri: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -195,6 +197,7 @@ class Recorder(threading.Thread):
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
+        self.db_read_url = read_uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -207,6 +210,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -230,6 +234,7 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -282,6 +287,20 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read only queries.
+
+        If a read database is configured, the session is bound to the
+        read engine so that history, logbook, and statistics queries do
+        not compete with the recorder thread for the write connection.
+
+        The recorder thread always uses the write connection since it
+        must be able to see its own pending changes.
+        """
+        if self._get_read_session is None or threading.get_ident() == self.thread_id:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -1454,12 +1473,63 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if self.db_read_url:
+            self._setup_read_connection()
+
+    def _setup_recorder_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific read connection settings."""
+        assert self.read_engine is not None
+        setup_read_connection_for_dialect(
+            self.read_engine.dialect.name, dbapi_connection
+        )
+
+    def _setup_read_connection(self) -> None:
+        """Create the engine used for read only queries."""
+        assert self.db_read_url is not None
+        kwargs: dict[str, Any] = {"pool_size": READ_POOL_SIZE}
+
+        if self.db_read_url.startswith(SQLITE_URL_PREFIX):
+            # Connections are handed out to any of the db executor
+            # workers, sqlite in WAL mode allows concurrent readers
+            kwargs["connect_args"] = {"check_same_thread": False}
+        else:
+            kwargs["echo"] = False
+            if self.db_read_url.startswith(
+                (
+                    MARIADB_URL_PREFIX,
+                    MARIADB_PYMYSQL_URL_PREFIX,
+                    MYSQLDB_URL_PREFIX,
+                    MYSQLDB_PYMYSQL_URL_PREFIX,
+                )
+            ):
+                kwargs["connect_args"] = {"charset": "utf8mb4"}
+                if self.db_read_url.startswith(
+                    (MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)
+                ):
+                    with contextlib.suppress(ImportError):
+                        kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+
+        self.read_engine = create_engine(self.db_read_url, **kwargs, future=True)
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_recorder_read_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
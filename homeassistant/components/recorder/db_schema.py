@@ -590,10 +590,15 @@ class StateAttributes(Base):
             }
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
-        encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        if dialect != PSQL_DIALECT and exclude_attrs.isdisjoint(state.attributes):
+            # Nothing to exclude, reuse the JSON shared by the states
+            # with the same attributes instead of encoding them again.
+            bytes_result = state.attributes_json
+        else:
+            encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
+            bytes_result = encoder(
+                {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+            )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
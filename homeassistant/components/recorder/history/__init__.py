@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from datetime import datetime
 from typing import Any
 
@@ -18,6 +19,7 @@ from .modern import (
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    state_changes_during_period_columns as _modern_state_changes_during_period_columns,
 )
 
 # These are the APIs of this package
@@ -28,7 +30,9 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "numeric_state_changes_during_period",
     "state_changes_during_period",
+    "state_changes_during_period_columns",
 ]
 
 
@@ -181,3 +185,81 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def state_changes_during_period_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> tuple[array[float], list[str]]:
+    """Return the timestamps and states that changed during a time period.
+
+    This is a lighter version of state_changes_during_period for consumers
+    that only need the state values since no State objects are created and
+    attributes are never fetched. The timestamps are returned as an array of
+    doubles which can be wrapped without copying with numpy.frombuffer.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        if not entity_id:
+            raise ValueError("entity_id must be provided")
+        states = state_changes_during_period(
+            hass,
+            start_time,
+            end_time,
+            entity_id,
+            True,
+            descending,
+            limit,
+            include_start_time_state,
+        ).get(entity_id.lower(), [])
+        return (
+            array("d", (state.last_changed.timestamp() for state in states)),
+            [state.state for state in states],
+        )
+    return _modern_state_changes_during_period_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_id,
+        descending,
+        limit,
+        include_start_time_state,
+    )
+
+
+def numeric_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> tuple[array[float], array[float]]:
+    """Return the timestamps and numeric values that changed during a time period.
+
+    States which can not be converted to a float are skipped.
+    """
+    timestamps, states = state_changes_during_period_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_id,
+        descending,
+        limit,
+        include_start_time_state,
+    )
+    numeric_timestamps: array[float] = array("d")
+    values: array[float] = array("d")
+    for timestamp, state in zip(timestamps, states, strict=True):
+        try:
+            value = float(state)
+        except ValueError:
+            continue
+        numeric_timestamps.append(timestamp)
+        values.append(value)
+    return numeric_timestamps, values
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
@@ -381,6 +382,52 @@ def _state_changed_during_period_stmt(
     )
 
 
+def _state_changes_during_period_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    single_metadata_id: int,
+    no_attributes: bool,
+    limit: int | None,
+    include_start_time_state: bool,
+) -> tuple[Iterable[Row], float | None]:
+    """Return the state change rows and the start time of the start time state."""
+    has_last_reported = (
+        recorder.get_instance(hass).schema_version >= LAST_REPORTED_SCHEMA_VERSION
+    )
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    stmt = lambda_stmt(
+        lambda: _state_changed_during_period_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            no_attributes,
+            limit,
+            include_start_time_state,
+            run_start_ts,
+            has_last_reported,
+        ),
+        track_on=[
+            bool(end_time_ts),
+            no_attributes,
+            bool(limit),
+            include_start_time_state,
+            has_last_reported,
+        ],
+    )
+    return (
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts if include_start_time_state else None,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -392,9 +439,6 @@ def state_changes_during_period(
     include_start_time_state: bool = True,
 ) -> dict[str, list[State]]:
     """Return states changes during UTC period start_time - end_time."""
-    has_last_reported = (
-        recorder.get_instance(hass).schema_version >= LAST_REPORTED_SCHEMA_VERSION
-    )
     if not entity_id:
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
@@ -411,39 +455,21 @@ def state_changes_during_period(
         entity_id_to_metadata_id: dict[str, int | None] = {
             entity_id: single_metadata_id
         }
-        run_start_ts: float | None = None
-        if include_start_time_state and not (
-            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
-        ):
-            include_start_time_state = False
-        start_time_ts = dt_util.utc_to_timestamp(start_time)
-        end_time_ts = datetime_to_timestamp_or_none(end_time)
-        stmt = lambda_stmt(
-            lambda: _state_changed_during_period_stmt(
-                start_time_ts,
-                end_time_ts,
-                single_metadata_id,
-                no_attributes,
-                limit,
-                include_start_time_state,
-                run_start_ts,
-                has_last_reported,
-            ),
-            track_on=[
-                bool(end_time_ts),
-                no_attributes,
-                bool(limit),
-                include_start_time_state,
-                has_last_reported,
-            ],
+        rows, start_time_ts = _state_changes_during_period_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            single_metadata_id,
+            no_attributes,
+            limit,
+            include_start_time_state,
         )
         return cast(
             dict[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
-                start_time_ts if include_start_time_state else None,
+                rows,
+                start_time_ts,
                 entity_ids,
                 entity_id_to_metadata_id,
                 descending=descending,
@@ -452,6 +478,59 @@ def state_changes_during_period(
         )
 
 
+def state_changes_during_period_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> tuple[array[float], list[str]]:
+    """Return states changes during UTC period start_time - end_time as columns.
+
+    Returns a tuple of the timestamps the state changed at and the states.
+    No State objects are created and attributes are never fetched.
+    """
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    entity_id = entity_id.lower()
+    timestamps: array[float] = array("d")
+    states: list[str] = []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = recorder.get_instance(hass)
+        if not (
+            single_metadata_id := instance.states_meta_manager.get(
+                entity_id, session, False
+            )
+        ):
+            return timestamps, states
+        rows, start_time_ts = _state_changes_during_period_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            single_metadata_id,
+            True,
+            limit,
+            include_start_time_state,
+        )
+        state_idx = _FIELD_MAP["state"]
+        last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+        timestamps_append = timestamps.append
+        states_append = states.append
+        for row in rows:
+            # The start time state has no last_updated_ts
+            timestamps_append(row[last_updated_ts_idx] or start_time_ts)
+            states_append(row[state_idx] or "")
+
+    if descending:
+        timestamps.reverse()
+        states.reverse()
+    return timestamps, states
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
@@ -27,6 +27,9 @@ DEBUG_MUTEX_POOL_TRACE = False
 
 POOL_SIZE = 5
 
+# One connection per db executor worker for the read only engine
+READ_POOL_SIZE = POOL_SIZE - 1
+
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
 )
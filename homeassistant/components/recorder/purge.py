@@ -42,6 +42,7 @@ from .queries import (
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
+from .statistics import get_statistics_during_period_cache
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -104,6 +105,8 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            # Cached results may contain the purged short term statistics
+            get_statistics_during_period_cache(instance.hass).invalidate()
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
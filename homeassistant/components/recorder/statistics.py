@@ -11,8 +11,10 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -147,6 +149,9 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 128
 
 
 def mean(values: list[float]) -> float | None:
@@ -190,6 +195,118 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+type StatisticsDuringPeriodCacheKey = tuple[
+    frozenset[str],
+    str,
+    datetime,
+    datetime | None,
+    tuple[tuple[str, str], ...] | None,
+    frozenset[str],
+    str,
+    tuple[str | None, ...],
+]
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsDuringPeriodCacheEntry:
+    """A cached statistics_during_period result."""
+
+    # The metadata_ids the result depends on
+    metadata_ids: frozenset[int]
+    # The end of the aligned period, None if the period is open ended
+    end_ts: float | None
+    result: dict[str, list[StatisticsRow]]
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for statistics_during_period results.
+
+    Entries are invalidated when new statistics are written for
+    any of the metadata_ids they depend on. When statistics are
+    compiled, entries for periods which ended before the compiled
+    period are kept since compiling never changes closed periods.
+
+    The cache is accessed from the db executor and the recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: LRU[
+            StatisticsDuringPeriodCacheKey, _StatisticsDuringPeriodCacheEntry
+        ] = LRU(STATISTICS_DURING_PERIOD_CACHE_SIZE)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the current generation of the cache.
+
+        The generation must be read before querying the database and
+        passed to set so results which raced an invalidation are not stored.
+        """
+        return self._generation
+
+    def get(
+        self, key: StatisticsDuringPeriodCacheKey
+    ) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of the cached result for key."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            return _copy_statistics_result(entry.result)
+
+    def set(
+        self,
+        key: StatisticsDuringPeriodCacheKey,
+        generation: int,
+        metadata_ids: frozenset[int],
+        end_ts: float | None,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Store a copy of result for key."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = _StatisticsDuringPeriodCacheEntry(
+                metadata_ids, end_ts, _copy_statistics_result(result)
+            )
+
+    def invalidate(
+        self,
+        metadata_ids: Iterable[int] | None = None,
+        closed_before: datetime | None = None,
+    ) -> None:
+        """Invalidate entries which depend on metadata_ids.
+
+        If metadata_ids is None, entries for all metadata_ids are invalidated.
+        If closed_before is set, entries for periods which ended at or before
+        closed_before are kept.
+        """
+        ids = None if metadata_ids is None else set(metadata_ids)
+        closed_before_ts = None if closed_before is None else closed_before.timestamp()
+        with self._lock:
+            self._generation += 1
+            for key, entry in self._entries.items():
+                if (
+                    closed_before_ts is not None
+                    and entry.end_ts is not None
+                    and entry.end_ts <= closed_before_ts
+                ):
+                    continue
+                if ids is None or not entry.metadata_ids.isdisjoint(ids):
+                    del self._entries[key]
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a statistics result so callers can modify it."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -383,12 +500,14 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(session: Session, start: datetime) -> set[int]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    returns the set of metadata_ids which hourly statistics were compiled for.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -438,6 +557,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return set(summary)
 
 
 @retryable_database_job("compile missing statistics")
@@ -451,6 +571,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     start = start.replace(minute=0, second=0, microsecond=0)
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
+    compiled_metadata_ids: set[int] = set()
 
     with session_scope(
         session=instance.get_session(),
@@ -463,12 +584,13 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             start = max(start, process_timestamp(last_run) + timedelta(minutes=5))
 
         periods_without_commit = 0
+        first_start = start
         while start < last_period:
             periods_without_commit += 1
             end = start + timedelta(minutes=period_size)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             modified_statistic_ids = _compile_statistics(
-                instance, session, start, end >= last_period
+                instance, session, start, end >= last_period, compiled_metadata_ids
             )
             if periods_without_commit == commit_interval or modified_statistic_ids:
                 session.commit()
@@ -476,6 +598,11 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    if compiled_metadata_ids:
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            compiled_metadata_ids, first_start.replace(minute=0)
+        )
+
     return True
 
 
@@ -490,6 +617,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # filter_unique_constraint_integrity_error which would make
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
+    compiled_metadata_ids: set[int] = set()
 
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
@@ -499,7 +627,14 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         ),
     ) as session:
         modified_statistic_ids = _compile_statistics(
-            instance, session, start, fire_events
+            instance, session, start, fire_events, compiled_metadata_ids
+        )
+
+    if compiled_metadata_ids:
+        # Compiling only adds statistics for the current hour so
+        # cached results for periods which ended before are still valid.
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            compiled_metadata_ids, start.replace(minute=0)
         )
 
     if modified_statistic_ids:
@@ -519,13 +654,20 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    compiled_metadata_ids: set[int],
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
     This is a helper function for compile_statistics and compile_missing_statistics
     that does not retry on database errors since both callers already retry.
 
+    The metadata_ids statistics were compiled for are added to
+    compiled_metadata_ids.
+
     returns a set of modified statistic_ids if any were modified.
     """
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
@@ -580,9 +722,11 @@ def _compile_statistics(
         ):
             new_short_term_stats.append(new_stat)
 
+    compiled_metadata_ids.update(updated_metadata_ids)
+
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        compiled_metadata_ids.update(_compile_hourly_statistics(session, start))
 
     session.add(StatisticsRuns(start=start))
 
@@ -729,6 +873,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate()
 
 
 def update_statistics_metadata(
@@ -754,6 +899,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).invalidate()
 
 
 async def async_list_statistic_ids(
@@ -1667,6 +1813,28 @@ def _statistics_during_period_with_session(
         # This is for backwards compatibility to avoid a breaking change
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    cache = get_statistics_during_period_cache(hass)
+    cache_key: StatisticsDuringPeriodCacheKey | None = None
+    if statistic_ids is not None:
+        cache_key = (
+            frozenset(statistic_ids),
+            period,
+            start_time,
+            end_time,
+            None if units is None else tuple(sorted(units.items())),
+            frozenset(_types),
+            str(dt_util.get_default_time_zone()),
+            # The display unit depends on the unit of the current state
+            tuple(
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := hass.states.get(statistic_id))
+                else None
+                for statistic_id in sorted(statistic_ids)
+            ),
+        )
+        if (cached_result := cache.get(cache_key)) is not None:
+            return cached_result
+    cache_generation = cache.generation
     # Fetch metadata for the given (or all) statistic_ids
     metadata = get_instance(hass).statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
@@ -1755,6 +1923,18 @@ def _statistics_during_period_with_session(
             hass, session, start_time, units, _types, table, metadata, result
         )
 
+    # Results are only cached if metadata was found for all the requested
+    # statistic_ids, otherwise we would miss the invalidation when the
+    # missing statistics are created.
+    if cache_key is not None and len(metadata) == len(cache_key[0]):
+        cache.set(
+            cache_key,
+            cache_generation,
+            frozenset(metadata_id for metadata_id, _ in metadata.values()),
+            None if end_time is None else end_time.timestamp(),
+            result,
+        )
+
     # Return statistics combined with metadata
     return result
 
@@ -2297,6 +2477,27 @@ def _import_statistics_with_session(
     return True
 
 
+def _invalidate_statistics_during_period_cache(
+    instance: Recorder, statistic_ids: set[str]
+) -> None:
+    """Invalidate cached statistics_during_period results for statistic_ids."""
+    metadata = instance.statistics_meta_manager.get_from_cache_threadsafe(statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        # If the metadata is not cached, we have to invalidate everything
+        [metadata_id for metadata_id, _ in metadata.values()]
+        if len(metadata) == len(statistic_ids)
+        else None
+    )
+
+
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics during period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 @singleton(DATA_SHORT_TERM_STATISTICS_RUN_CACHE)
 def get_short_term_statistics_run_cache(
     hass: HomeAssistant,
@@ -2363,6 +2564,7 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
+    imported = False
 
     with session_scope(
         session=instance.get_session(),
@@ -2370,10 +2572,13 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    _invalidate_statistics_during_period_cache(instance, {metadata["statistic_id"]})
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2414,6 +2619,7 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    _invalidate_statistics_during_period_cache(instance, {statistic_id})
     return True
 
 
@@ -2482,6 +2688,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    _invalidate_statistics_during_period_cache(instance, {statistic_id})
+
 
 @callback
 def async_change_statistics_unit(
@@ -123,10 +123,12 @@ def session_scope(
 
     read_only is used to indicate that the session is only used for reading
     data and that no commit is required. It does not prevent the session
-    from writing and is not a security measure.
+    from writing and is not a security measure. When a session is created
+    for a read_only scope, it is bound to the read engine if one is configured.
     """
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        session = instance.get_read_session() if read_only else instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -601,6 +603,24 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_connection_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Execute statements needed for a read only dialect connection."""
+    if dialect_name == SupportedDialect.SQLITE:
+        # The upper bound on the cache size is approximately 16MiB of memory
+        execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+        # The writer connection owns the database, make sure the
+        # read connections can never modify it by accident
+        execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
+        # Ensure all times are using UTC to avoid issues with daylight savings
+        execute_on_connection(dbapi_connection, "SET time_zone = '+00:00'")
+    elif dialect_name != SupportedDialect.POSTGRESQL:
+        _fail_unsupported_dialect(dialect_name)
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
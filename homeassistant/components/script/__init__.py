@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_samples
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -53,7 +54,7 @@ from homeassistant.helpers.script import (
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
-from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.helpers.trace import trace_disable, trace_get, trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
@@ -643,7 +644,10 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             self._trace_config,
         ) as script_trace:
             # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            if script_trace.recording:
+                script_trace.set_trace(trace_get())
+            else:
+                trace_disable()
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -702,6 +706,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
+        async_remove_trace_samples(self.hass, DOMAIN, self.unique_id)
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
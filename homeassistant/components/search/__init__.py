@@ -20,16 +20,32 @@ from homeassistant.helpers import (
     entity_registry as er,
 )
 from homeassistant.helpers.entity import (
+    Entity,
     EntityInfo,
     entity_sources as get_entity_sources,
 )
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+DATA_REFERENCE_INDEXES: HassKey[dict[str, ReferenceIndex]] = HassKey(
+    f"{DOMAIN}_reference_indexes"
+)
+
+# Properties of automation and script entities with the items they reference
+_REFERENCE_PROPERTIES = (
+    "referenced_areas",
+    "referenced_devices",
+    "referenced_entities",
+    "referenced_floors",
+    "referenced_labels",
+)
+
 
 # enum of item types
 class ItemType(StrEnum):
@@ -76,6 +92,86 @@ def websocket_search_related(
     )
 
 
+class ReferenceIndex:
+    """Index the entities of an automation or script component by references.
+
+    The items an automation or script entity references never change, a
+    reload replaces the entity instead. The index is kept between searches
+    and is only updated for the entities added or removed since the last
+    search, so finding what references an item does not walk every entity.
+    """
+
+    def __init__(self, domain: str) -> None:
+        """Initialize the reference index."""
+        self.domain = domain
+        self._entities: dict[int, Entity] = {}
+        self._blueprints: defaultdict[str, set[Entity]] = defaultdict(set)
+        self._references: dict[str, defaultdict[str, set[Entity]]] = {
+            property_name: defaultdict(set) for property_name in _REFERENCE_PROPERTIES
+        }
+
+    @callback
+    def async_update(self, hass: HomeAssistant) -> None:
+        """Update the index with the entities added or removed."""
+        component: EntityComponent[Any] | None = hass.data.get(self.domain)
+        entities = (
+            {id(entity): entity for entity in component.entities}
+            if component is not None
+            else {}
+        )
+        if entities.keys() == self._entities.keys():
+            return
+        for key in self._entities.keys() - entities.keys():
+            self._async_index(self._entities[key], add=False)
+        for key in entities.keys() - self._entities.keys():
+            self._async_index(entities[key], add=True)
+        self._entities = entities
+
+    @callback
+    def _async_index(self, entity: Any, *, add: bool) -> None:
+        """Add or remove the references of an entity."""
+        for property_name, references in self._references.items():
+            for referenced_id in getattr(entity, property_name):
+                if add:
+                    references[referenced_id].add(entity)
+                elif entities := references.get(referenced_id):
+                    entities.discard(entity)
+                    if not entities:
+                        del references[referenced_id]
+        if (blueprint := entity.referenced_blueprint) is None:
+            return
+        if add:
+            self._blueprints[blueprint].add(entity)
+        elif entities := self._blueprints.get(blueprint):
+            entities.discard(entity)
+            if not entities:
+                del self._blueprints[blueprint]
+
+    @callback
+    def async_with(self, property_name: str, referenced_id: str) -> list[str]:
+        """Return the entity ids of the entities referencing an item."""
+        if (entities := self._references[property_name].get(referenced_id)) is None:
+            return []
+        return [entity.entity_id for entity in entities]
+
+    @callback
+    def async_with_blueprint(self, blueprint_path: str) -> list[str]:
+        """Return the entity ids of the entities using a blueprint."""
+        if (entities := self._blueprints.get(blueprint_path)) is None:
+            return []
+        return [entity.entity_id for entity in entities]
+
+
+@callback
+def _async_get_reference_index(hass: HomeAssistant, domain: str) -> ReferenceIndex:
+    """Return the updated reference index of an automation or script component."""
+    indexes = hass.data.setdefault(DATA_REFERENCE_INDEXES, {})
+    if (index := indexes.get(domain)) is None:
+        index = indexes[domain] = ReferenceIndex(domain)
+    index.async_update(hass)
+    return index
+
+
 class Searcher:
     """Find related things."""
 
@@ -92,6 +188,8 @@ class Searcher:
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
         self._entity_sources = entity_sources
+        self._automations = _async_get_reference_index(hass, automation.DOMAIN)
+        self._scripts = _async_get_reference_index(hass, script.DOMAIN)
         self.results: defaultdict[ItemType, set[str]] = defaultdict(set)
 
     @callback
@@ -130,11 +228,14 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._automations.async_with("referenced_areas", area_id),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_with("referenced_areas", area_id)
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -150,11 +251,14 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._automations.async_with("referenced_devices", device.id),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._scripts.async_with("referenced_devices", device.id),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -176,13 +280,15 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._automations.async_with(
+                    "referenced_entities", entity_entry.entity_id
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._scripts.async_with("referenced_entities", entity_entry.entity_id),
             )
 
             # Groups that have this entity as a member
@@ -272,7 +378,7 @@ class Searcher:
         """Find results for an automation blueprint."""
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_blueprint(self.hass, blueprint_path),
+            self._automations.async_with_blueprint(blueprint_path),
         )
 
     @callback
@@ -303,11 +409,13 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._automations.async_with("referenced_devices", device_id),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_with("referenced_devices", device_id)
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -330,11 +438,13 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._automations.async_with("referenced_entities", entity_id),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_with("referenced_entities", entity_id)
+        )
 
         # Groups that have this entity as a member
         self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
@@ -351,11 +461,13 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._automations.async_with("referenced_floors", floor_id),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_with("referenced_floors", floor_id)
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -371,12 +483,13 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._automations.async_with("referenced_entities", group_entity_id),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_with("referenced_entities", group_entity_id),
         )
 
         # Scenes that reference this group
@@ -411,11 +524,13 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._automations.async_with("referenced_labels", label_id),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_with("referenced_labels", label_id)
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -428,12 +543,13 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._automations.async_with("referenced_entities", person_entity_id),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_with("referenced_entities", person_entity_id),
         )
 
         # Add all member entities of this person
@@ -452,12 +568,13 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._automations.async_with("referenced_entities", scene_entity_id),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_with("referenced_entities", scene_entity_id),
         )
 
         # Add all entities in this scene
@@ -528,9 +645,7 @@ class Searcher:
     @callback
     def _async_search_script_blueprint(self, blueprint_path: str) -> None:
         """Find results for a script blueprint."""
-        self._add(
-            ItemType.SCRIPT, script.scripts_with_blueprint(self.hass, blueprint_path)
-        )
+        self._add(ItemType.SCRIPT, self._scripts.async_with_blueprint(blueprint_path))
 
     @callback
     def _async_resolve_up_device(self, device_id: str) -> dr.DeviceEntry | None:
@@ -19,11 +19,16 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     DATA_TRACE,
+    DATA_TRACE_SAMPLES,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TraceLevel,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -35,7 +40,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_LEVEL, default=TraceLevel.FULL): vol.Coerce(TraceLevel),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -51,6 +60,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_SAMPLES] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -148,6 +158,45 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Decide if a run is traced and store its trace according to the trace level.
+
+    With the errors level the run is traced, but the trace is only stored
+    by async_finish_trace when the run failed.
+    """
+    level = trace_config.get(CONF_TRACE_LEVEL, TraceLevel.FULL)
+    if level == TraceLevel.SAMPLED:
+        samples: dict[str, int] = hass.data[DATA_TRACE_SAMPLES]
+        runs = samples.get(trace.key, 0)
+        samples[trace.key] = runs + 1
+        level = (
+            TraceLevel.OFF if runs % trace_config[CONF_SAMPLE_RATE] else TraceLevel.FULL
+        )
+    trace.start(level != TraceLevel.OFF)
+    if level == TraceLevel.FULL:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store the trace of a failed run when only errors are traced."""
+    if trace.failed and trace_config.get(CONF_TRACE_LEVEL) == TraceLevel.ERRORS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_remove_trace_samples(
+    hass: HomeAssistant, domain: str, item_id: str | None
+) -> None:
+    """Forget the sampled runs of an automation or script which is removed."""
+    hass.data[DATA_TRACE_SAMPLES].pop(f"{domain}.{item_id}", None)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
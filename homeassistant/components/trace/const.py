@@ -1,7 +1,22 @@
 """Shared constants for script and automation tracing and debugging."""
 
+from enum import StrEnum
+
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_LEVEL = "level"
 DATA_TRACE = "trace"
+DATA_TRACE_SAMPLES = "trace_samples"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_RATE = 10  # Trace one in this many runs when sampling
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+
+class TraceLevel(StrEnum):
+    """Which runs of a script or automation are traced."""
+
+    OFF = "off"
+    SAMPLED = "sampled"
+    ERRORS = "errors"
+    FULL = "full"
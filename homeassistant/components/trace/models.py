@@ -68,7 +68,15 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
-        if trace_id_get():
+        self.recording = True
+
+    def start(self, recording: bool) -> None:
+        """Start the run in the current context.
+
+        A run that is not recorded is not linked from the trace of its parent.
+        """
+        self.recording = recording
+        if recording and trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
 
@@ -80,6 +88,14 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed."""
+        return self._error is not None or self._script_execution in (
+            "aborted",
+            "error",
+        )
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -466,15 +466,37 @@ def _send_handle_entities_init_response(
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
     """Return JSON of descriptions (i.e. user documentation) for all service calls."""
     descriptions = await async_get_all_descriptions(hass)
+    cached_domains: dict[str, tuple[dict[str, Any], bytes]] = {}
     if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
+        cached_descriptions, cached_json_payload, cached_domains = hass.data[
             ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
         ]
         # If the descriptions are the same, return the cached JSON payload
         if cached_descriptions is descriptions:
             return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
+    # Only serialize the domains which descriptions changed
+    domains: dict[str, tuple[dict[str, Any], bytes]] = {}
+    for domain, domain_descriptions in descriptions.items():
+        if (cached_domain := cached_domains.get(domain)) is None or cached_domain[
+            0
+        ] is not domain_descriptions:
+            cached_domain = (domain_descriptions, json_bytes(domain_descriptions))
+        domains[domain] = cached_domain
+    json_payload = b"".join(
+        (
+            b"{",
+            b",".join(
+                json_bytes(domain) + b":" + domain_json
+                for domain, (_, domain_json) in domains.items()
+            ),
+            b"}",
+        )
+    )
+    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (
+        descriptions,
+        json_payload,
+        domains,
+    )
     return json_payload
 
 
@@ -34,6 +34,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Outgoing messages smaller than this are sent uncompressed even when the
+# client negotiated per-message compression, compressing them costs more
+# than the bytes it saves.
+COMPRESS_MIN_SIZE: Final = 512
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -11,6 +11,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp import WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -22,6 +23,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -42,6 +44,31 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+async def _async_send_compressed(
+    writer: WebSocketWriter, compress: int, message: bytes
+) -> None:
+    """Send a text message and compress it when it is large enough."""
+    if len(message) < COMPRESS_MIN_SIZE:
+        await writer.send(message, binary=False)
+    else:
+        await writer.send(message, binary=False, compress=compress)
+
+
+def _send_bytes_text(
+    writer: WebSocketWriter,
+) -> Callable[[bytes], Coroutine[Any, Any, None]]:
+    """Return the function that sends a text message.
+
+    When the client negotiated per-message compression, each large message
+    is compressed on its own instead of every message with a shared
+    compressor.
+    """
+    if compress := writer.compress:
+        writer.compress = 0
+        return partial(_async_send_compressed, writer, compress)
+    return partial(writer.send, binary=False)
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -321,7 +348,7 @@ class WebSocketHandler:
         if TYPE_CHECKING:
             assert writer is not None
 
-        send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_text = _send_bytes_text(writer)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -7,7 +7,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
@@ -44,6 +44,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+from weakref import WeakValueDictionary
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -106,7 +107,7 @@ from .util.async_ import (
 from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
-from .util.json import JsonObjectType
+from .util.json import JSON_ENCODE_EXCEPTIONS, JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
@@ -137,6 +138,12 @@ _SENTINEL = object()
 _DataT = TypeVar("_DataT", bound=Mapping[str, Any], default=Mapping[str, Any])
 type CALLBACK_TYPE = Callable[[], None]
 
+# Key of the JSON of the attributes cached on the attributes ReadOnlyDict
+# which is shared by all the states with the same attributes
+_ATTRIBUTES_JSON = "_attributes_json"
+# Only attributes with immutable scalar values are shared between states
+_INTERNABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 CORE_STORAGE_KEY = "core.config"
 CORE_STORAGE_VERSION = 1
 CORE_STORAGE_MINOR_VERSION = 3
@@ -146,6 +153,9 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# Number of state changes remembered to answer what changed since a version
+STATE_CHANGE_LOG_SIZE = 16384
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -1887,10 +1897,27 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @cached_property
+    def attributes_json(self) -> bytes:
+        """Return a JSON string of the attributes of the State.
+
+        Interned attributes carry their JSON, so it is only encoded once for
+        all the states that share them.
+        """
+        attributes = self.attributes
+        # Only interned attributes cache their JSON as their values are
+        # immutable. Subclasses like the recorder LazyState may use plain dicts.
+        attributes_vars: dict[str, Any] = getattr(attributes, "__dict__", {})
+        if (attributes_json := attributes_vars.get(_ATTRIBUTES_JSON)) is not None:
+            return attributes_json
+        return json_bytes(attributes)
+
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": json_fragment(self.attributes_json)}
+        )
 
     @cached_property
     def json_fragment(self) -> json_fragment:
@@ -1933,7 +1960,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: json_fragment(self.attributes_json),
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2044,7 +2078,16 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+        "_version",
+        "_change_log",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2055,6 +2098,42 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Identical attributes of different states share one ReadOnlyDict
+        self._interned_attributes: WeakValueDictionary[
+            bytes, ReadOnlyDict[str, Any]
+        ] = WeakValueDictionary()
+        # The version is incremented each time a state changes or is removed
+        self._version = 0
+        self._change_log: deque[tuple[int, str]] = deque(maxlen=STATE_CHANGE_LOG_SIZE)
+
+    @property
+    def version(self) -> int:
+        """Return the version of the states."""
+        return self._version
+
+    @callback
+    def async_changed_since(self, version: int) -> set[str] | None:
+        """Return the entity ids of the states changed or removed since a version.
+
+        Returns None if the version is unknown or too old to be in the change log.
+
+        This method must be run in the event loop.
+        """
+        change_log = self._change_log
+        if not self._version - len(change_log) <= version <= self._version:
+            return None
+        changed: set[str] = set()
+        for change_version, entity_id in reversed(change_log):
+            if change_version <= version:
+                break
+            changed.add(entity_id)
+        return changed
+
+    @callback
+    def _async_log_change(self, entity_id: str) -> None:
+        """Increment the version and log the changed entity id."""
+        self._version += 1
+        self._change_log.append((self._version, entity_id))
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2167,6 +2246,7 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._async_log_change(entity_id)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2230,6 +2310,37 @@ class StateMachine:
             entity_id not in self._states_data and entity_id not in self._reservations
         )
 
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Return the shared ReadOnlyDict for the attributes.
+
+        The attributes are encoded to JSON which is used as the key and
+        cached on the shared ReadOnlyDict to be reused when the state is
+        serialized. Attributes with values that are not immutable scalars
+        are not interned as the values would be shared between states.
+        """
+        for value in attributes.values():
+            if type(value) not in _INTERNABLE_ATTRIBUTE_TYPES:
+                return attributes
+        try:
+            attributes_json = json_bytes(attributes)
+        except JSON_ENCODE_EXCEPTIONS:
+            return attributes
+        interned_attributes = self._interned_attributes
+        # Different values can encode to the same JSON, for example
+        # NaN and None, so they must also be equal.
+        if (
+            interned := interned_attributes.get(attributes_json)
+        ) is not None and interned == attributes:
+            return interned
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        vars(attributes)[_ATTRIBUTES_JSON] = attributes_json
+        interned_attributes[attributes_json] = attributes
+        return attributes
+
     @callback
     def async_set(
         self,
@@ -2307,6 +2418,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif attributes:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2324,6 +2437,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._async_log_change(entity_id)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -64,6 +64,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -91,6 +92,9 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Marks a compiled condition whose result depends on the state of the system
+_NOT_CONSTANT: Any = object()
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -176,6 +180,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_cv.get() is None:
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -184,6 +190,140 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+class CompiledCondition:
+    """A condition lowered into a traced and an untraced evaluator.
+
+    The traced evaluator records a trace element for every check and is
+    used while a trace is being recorded. The untraced evaluator is a flat
+    function without any trace bookkeeping. A condition which result does
+    not depend on the state of the system is folded into a constant.
+    """
+
+    __slots__ = ("__wrapped__", "constant", "untraced")
+
+    def __init__(
+        self,
+        traced: ConditionCheckerType,
+        untraced: ConditionCheckerType,
+        constant: bool | None = _NOT_CONSTANT,
+    ) -> None:
+        """Initialize the compiled condition."""
+        self.__wrapped__ = traced
+        self.untraced = untraced
+        self.constant = constant
+
+    @classmethod
+    def folded(
+        cls, traced: ConditionCheckerType, constant: bool | None
+    ) -> CompiledCondition:
+        """Return a compiled condition which always has the same result."""
+
+        def constant_condition(
+            hass: HomeAssistant, variables: TemplateVarsType = None
+        ) -> bool | None:
+            """Return the constant result."""
+            return constant
+
+        return cls(traced, constant_condition, constant)
+
+    def __call__(
+        self, hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool | None:
+        """Evaluate the condition."""
+        if trace_cv.get() is None:
+            return self.untraced(hass, variables)
+        return self.__wrapped__(hass, variables)
+
+
+def _untraced(check: ConditionCheckerType) -> ConditionCheckerType:
+    """Return the untraced evaluator of a condition."""
+    if isinstance(check, CompiledCondition):
+        return check.untraced
+    return check
+
+
+def _constant(check: ConditionCheckerType) -> bool | None:
+    """Return the constant result of a condition or _NOT_CONSTANT."""
+    if isinstance(check, CompiledCondition):
+        return check.constant
+    return _NOT_CONSTANT
+
+
+def _is_false(result: bool | None) -> bool:
+    """Return if the result of a check is False."""
+    return result is False
+
+
+def _is_true(result: bool | None) -> bool:
+    """Return if the result of a check is True."""
+    return result is True
+
+
+def _compile_untraced_group(
+    condition: str,
+    checks: list[tuple[int, ConditionCheckerType]],
+    total: int,
+    stop: Callable[[bool | None], bool],
+    stop_result: bool,
+) -> ConditionCheckerType:
+    """Lower the checks of an and, or or not condition into a flat evaluator.
+
+    The evaluator returns stop_result as soon as stop returns True for the
+    result of a check, raises the errors of the checks when no check stopped
+    the evaluation and returns the opposite of stop_result otherwise.
+    """
+    evaluators = tuple((index, _untraced(check)) for index, check in checks)
+
+    def untraced_group(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Evaluate the checks without tracing."""
+        errors = None
+        for index, evaluator in evaluators:
+            try:
+                if stop(evaluator(hass, variables)):
+                    return stop_result
+            except ConditionError as ex:
+                if errors is None:
+                    errors = []
+                errors.append(
+                    ConditionErrorIndex(condition, index=index, total=total, error=ex)
+                )
+
+        if errors:
+            raise ConditionErrorContainer(condition, errors=errors)
+
+        return not stop_result
+
+    return untraced_group
+
+
+def _compile_group(
+    condition: str,
+    traced: ConditionCheckerType,
+    checks: list[ConditionCheckerType],
+    stop: Callable[[bool | None], bool],
+    stop_result: bool,
+) -> CompiledCondition:
+    """Compile an and, or or not condition with constant folding.
+
+    Checks with a constant result that never stops the evaluation are
+    dropped. A check with a constant result that stops the evaluation folds
+    the whole condition into a constant, the errors of the other checks
+    would be ignored anyway.
+    """
+    remaining: list[tuple[int, ConditionCheckerType]] = []
+    for index, check in enumerate(checks):
+        if (constant := _constant(check)) is _NOT_CONSTANT:
+            remaining.append((index, check))
+        elif stop(constant):
+            return CompiledCondition.folded(traced, stop_result)
+    if not remaining:
+        return CompiledCondition.folded(traced, not stop_result)
+    return CompiledCondition(
+        traced,
+        _compile_untraced_group(condition, remaining, len(checks), stop, stop_result),
+    )
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -245,7 +385,7 @@ async def async_from_config(
                 """Condition not enabled, will act as if it didn't exist."""
                 return None
 
-            return disabled_condition
+            return CompiledCondition.folded(disabled_condition, None)
 
     # Check for partials to properly determine if coroutine function
     check_factory = factory
@@ -285,7 +425,7 @@ async def async_and_from_config(
 
         return True
 
-    return if_and_condition
+    return _compile_group("and", if_and_condition, checks, _is_false, False)
 
 
 async def async_or_from_config(
@@ -316,7 +456,7 @@ async def async_or_from_config(
 
         return False
 
-    return if_or_condition
+    return _compile_group("or", if_or_condition, checks, _is_true, True)
 
 
 async def async_not_from_config(
@@ -347,7 +487,7 @@ async def async_not_from_config(
 
         return True
 
-    return if_not_condition
+    return _compile_group("not", if_not_condition, checks, bool, False)
 
 
 def numeric_state(
@@ -540,7 +680,41 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    def untraced_numeric_state(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test numeric state condition without tracing."""
+        if value_template is not None:
+            value_template.hass = hass
+
+        errors = None
+        for index, entity_id in enumerate(entity_ids):
+            try:
+                if not async_numeric_state(
+                    hass,
+                    entity_id,
+                    below,
+                    above,
+                    value_template,
+                    variables,
+                    attribute,
+                ):
+                    return False
+            except ConditionError as ex:
+                if errors is None:
+                    errors = []
+                errors.append(
+                    ConditionErrorIndex(
+                        "numeric_state", index=index, total=len(entity_ids), error=ex
+                    )
+                )
+
+        if errors:
+            raise ConditionErrorContainer("numeric_state", errors=errors)
+
+        return True
+
+    return CompiledCondition(if_numeric_state, untraced_numeric_state)
 
 
 def state(
@@ -616,6 +790,52 @@ def state(
     return duration_ok
 
 
+def _compile_untraced_state(
+    entity_ids: list[str],
+    req_states: list[Any],
+    attribute: str | None,
+    match: str,
+) -> ConditionCheckerType:
+    """Lower a state condition comparing states directly without tracing."""
+    wanted_states = tuple(req_states)
+    match_any = match == ENTITY_MATCH_ANY
+
+    def untraced_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test if condition without tracing."""
+        errors = None
+        result = not match_any
+        for index, entity_id in enumerate(entity_ids):
+            if (entity := hass.states.get(entity_id)) is None:
+                error = ConditionErrorMessage("state", f"unknown entity {entity_id}")
+                if errors is None:
+                    errors = []
+                errors.append(
+                    ConditionErrorIndex(
+                        "state", index=index, total=len(entity_ids), error=error
+                    )
+                )
+                continue
+            if attribute is None:
+                value: Any = entity.state
+            elif attribute in entity.attributes:
+                value = entity.attributes[attribute]
+            elif match_any:
+                continue
+            else:
+                return False
+            if value in wanted_states:
+                result = True
+            elif not match_any:
+                return False
+
+        if errors:
+            raise ConditionErrorContainer("state", errors=errors)
+
+        return result
+
+    return untraced_state
+
+
 def state_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     entity_ids = config.get(CONF_ENTITY_ID, [])
@@ -655,7 +875,43 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
-    return if_state
+    # States are compared directly unless they refer to the state of
+    # another entity or the condition needs the time the state changed
+    if for_period is None and not any(
+        isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None
+        for req_state in req_states
+    ):
+        return CompiledCondition(
+            if_state,
+            _compile_untraced_state(entity_ids, req_states, attribute, match),
+        )
+
+    def untraced_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test if condition without tracing."""
+        template_attach(hass, for_period)
+        errors = None
+        result = match != ENTITY_MATCH_ANY
+        for index, entity_id in enumerate(entity_ids):
+            try:
+                if state(hass, entity_id, req_states, for_period, attribute, variables):
+                    result = True
+                elif match == ENTITY_MATCH_ALL:
+                    return False
+            except ConditionError as ex:
+                if errors is None:
+                    errors = []
+                errors.append(
+                    ConditionErrorIndex(
+                        "state", index=index, total=len(entity_ids), error=ex
+                    )
+                )
+
+        if errors:
+            raise ConditionErrorContainer("state", errors=errors)
+
+        return result
+
+    return CompiledCondition(if_state, untraced_state)
 
 
 def sun(
@@ -897,7 +1153,38 @@ def time_from_config(config: ConfigType) -> ConditionCheckerType:
         """Validate time based if-condition."""
         return time(hass, before, after, weekday)
 
-    return time_if
+    # Times which come from entities need to be looked up on every evaluation
+    if isinstance(before, str) or isinstance(after, str):
+
+        def untraced_time(
+            hass: HomeAssistant, variables: TemplateVarsType = None
+        ) -> bool:
+            """Validate time based if-condition without tracing."""
+            return time(hass, before, after, weekday)
+
+        return CompiledCondition(time_if, untraced_time)
+
+    after_time: dt_time = after or dt_time(0)
+    before_time: dt_time = before or dt_time(23, 59, 59, 999999)
+    crosses_midnight = not after_time < before_time
+    weekdays: frozenset[str] | None = None
+    if weekday is not None:
+        weekdays = frozenset([weekday] if isinstance(weekday, str) else weekday)
+
+    def untraced_static_time(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Validate time based if-condition without tracing."""
+        now = dt_util.now()
+        now_time = now.time()
+        if crosses_midnight:
+            if before_time <= now_time < after_time:
+                return False
+        elif not after_time <= now_time < before_time:
+            return False
+        return weekdays is None or WEEKDAYS[now.weekday()] in weekdays
+
+    return CompiledCondition(time_if, untraced_static_time)
 
 
 def zone(
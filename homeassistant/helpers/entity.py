@@ -44,6 +44,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    State,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -56,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.hass_dict import HassKey
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -73,6 +75,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_WRITE_STATE_STATS: HassKey[WriteStateStats] = HassKey("entity_write_state_stats")
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -98,6 +101,90 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@dataclasses.dataclass(slots=True)
+class EntityWriteStateStats:
+    """Write state statistics for a single entity."""
+
+    platform: str | None
+    writes: int = 0
+    # Writes where neither the state nor the attributes
+    # changed and only last_reported was updated
+    unchanged_writes: int = 0
+    calculate_time: float = 0.0
+    set_time: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stats."""
+        return dataclasses.asdict(self)
+
+
+class WriteStateStats:
+    """Collect statistics about entities writing their state.
+
+    Collection is opt-in since it adds overhead to every state write.
+    """
+
+    def __init__(self) -> None:
+        """Init the stats."""
+        self.started = time.time()
+        self.entities: dict[str, EntityWriteStateStats] = {}
+
+    @callback
+    def async_record_write(
+        self,
+        entity: Entity,
+        calculate_time: float,
+        set_time: float,
+        unchanged: bool,
+    ) -> None:
+        """Record a state write for an entity."""
+        if (stats := self.entities.get(entity.entity_id)) is None:
+            platform = entity.platform
+            stats = self.entities[entity.entity_id] = EntityWriteStateStats(
+                platform.platform_name if platform else None
+            )
+        stats.writes += 1
+        stats.calculate_time += calculate_time
+        stats.set_time += set_time
+        if unchanged:
+            stats.unchanged_writes += 1
+
+    @callback
+    def async_platform_stats(self) -> dict[str | None, EntityWriteStateStats]:
+        """Return the stats summed up per platform."""
+        platforms: dict[str | None, EntityWriteStateStats] = {}
+        for stats in self.entities.values():
+            if (platform_stats := platforms.get(stats.platform)) is None:
+                platform_stats = platforms[stats.platform] = EntityWriteStateStats(
+                    stats.platform
+                )
+            platform_stats.writes += stats.writes
+            platform_stats.unchanged_writes += stats.unchanged_writes
+            platform_stats.calculate_time += stats.calculate_time
+            platform_stats.set_time += stats.set_time
+        return platforms
+
+
+@callback
+def async_start_write_state_stats(hass: HomeAssistant) -> WriteStateStats:
+    """Start collecting write state statistics."""
+    if (stats := hass.data.get(DATA_WRITE_STATE_STATS)) is None:
+        stats = hass.data[DATA_WRITE_STATE_STATS] = WriteStateStats()
+    return stats
+
+
+@callback
+def async_stop_write_state_stats(hass: HomeAssistant) -> WriteStateStats | None:
+    """Stop collecting write state statistics and return what was collected."""
+    return hass.data.pop(DATA_WRITE_STATE_STATS, None)
+
+
+@callback
+def async_get_write_state_stats(hass: HomeAssistant) -> WriteStateStats | None:
+    """Return the write state statistics if they are being collected."""
+    return hass.data.get(DATA_WRITE_STATE_STATS)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -471,6 +558,12 @@ class Entity(
     # Protect for multiple updates
     _update_staged = False
 
+    # Coalesce state writes within this many seconds, set from the platform
+    _state_write_coalesce_time: float | None = None
+
+    # Pending coalesced state write
+    _coalesced_write_handle: asyncio.Handle | None = None
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -997,8 +1090,40 @@ class Entity(
         self._async_verify_state_writable()
         if self._is_custom_component or self.hass.config.debug:
             self.hass.verify_event_loop_thread("async_write_ha_state")
+        if (
+            coalesce_time := self._state_write_coalesce_time
+        ) is not None and not self.force_update:
+            self._async_schedule_coalesced_write_ha_state(coalesce_time)
+            return
         self._async_write_ha_state()
 
+    @callback
+    def _async_schedule_coalesced_write_ha_state(self, coalesce_time: float) -> None:
+        """Schedule a write of the state unless one is already pending."""
+        if self._coalesced_write_handle is not None:
+            return
+        if coalesce_time:
+            self._coalesced_write_handle = self.hass.loop.call_later(
+                coalesce_time, self._async_write_coalesced_ha_state
+            )
+        else:
+            self._coalesced_write_handle = self.hass.loop.call_soon(
+                self._async_write_coalesced_ha_state
+            )
+
+    @callback
+    def _async_write_coalesced_ha_state(self) -> None:
+        """Write the state for the coalesced writes."""
+        self._coalesced_write_handle = None
+        self._async_write_ha_state()
+
+    @callback
+    def _async_cancel_coalesced_write_ha_state(self) -> None:
+        """Cancel a pending coalesced write."""
+        if self._coalesced_write_handle is not None:
+            self._coalesced_write_handle.cancel()
+            self._coalesced_write_handle = None
+
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -1106,6 +1231,10 @@ class Entity(
             # Polling returned after the entity has already been removed
             return
 
+        if self._coalesced_write_handle is not None:
+            # The state is written now so the pending write is not needed
+            self._async_cancel_coalesced_write_ha_state()
+
         hass = self.hass
         entity_id = self.entity_id
 
@@ -1194,6 +1323,12 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        old_state: State | None = None
+        state_set_start = 0.0
+        if (write_stats := hass.data.get(DATA_WRITE_STATE_STATS)) is not None:
+            old_state = hass.states.get(entity_id)
+            state_set_start = timer()
+
         try:
             hass.states.async_set(
                 entity_id,
@@ -1212,6 +1347,16 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+        if write_stats is not None:
+            # The state object is only replaced if the state or attributes
+            # changed, otherwise only last_reported is updated in place
+            write_stats.async_record_write(
+                self,
+                time_now - state_calculate_start,
+                timer() - state_set_start,
+                hass.states.get(entity_id) is old_state,
+            )
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1353,6 +1498,9 @@ class Entity(
         await self.async_internal_added_to_hass()
         await self.async_added_to_hass()
         self.async_write_ha_state()
+        # The first state is always written right away
+        if (platform := self.platform) is not None:
+            self._state_write_coalesce_time = platform.state_write_coalesce_time
 
     @final
     async def async_remove(self, *, force_remove: bool = False) -> None:
@@ -1383,6 +1531,7 @@ class Entity(
         """Remove entity from Home Assistant."""
 
         self._platform_state = EntityPlatformState.REMOVED
+        self._async_cancel_coalesced_write_ha_state()
 
         self._call_on_remove_callbacks()
 
@@ -46,6 +46,7 @@ from . import (
     config_validation as cv,
     device_registry as dev_reg,
     entity_registry as ent_reg,
+    polling,
     service,
     translation,
 )
@@ -115,6 +116,12 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+type EntityServiceBatchHandler = Callable[
+    [HomeAssistant, list[Entity], str, dict[str, Any]],
+    Coroutine[Any, Any, Iterable[Entity]],
+]
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -151,6 +158,7 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._poll_key: str | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -158,6 +166,24 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Platforms can opt in to coalesce the state writes of their entities.
+        # A value of 0 coalesces the writes made within the same event loop
+        # iteration, a positive value the writes made within that many seconds.
+        self.state_write_coalesce_time: float | None = getattr(
+            platform, "STATE_WRITE_COALESCE_TIME", None
+        )
+
+        # Platforms can opt in to handle an entity service call for several of
+        # their entities at once, for example with a single group command. The
+        # handler returns the entities it did not handle.
+        self.async_handle_entity_service_batch: EntityServiceBatchHandler | None = (
+            getattr(platform, "async_handle_entity_service_batch", None)
+        )
+        # Platforms can cap how many entity service calls run at the same time
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        if parallel_service_calls := getattr(platform, "PARALLEL_SERVICE_CALLS", None):
+            self.parallel_service_calls = asyncio.Semaphore(parallel_service_calls)
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -188,6 +214,18 @@ class EntityPlatform:
             f"config_entry={self.config_entry}>"
         )
 
+    @callback
+    def _async_get_poll_key(self) -> str:
+        """Return the key the polling scheduler spreads the polls with."""
+        if self._poll_key is None:
+            key = f"{self.domain}.{self.platform_name}"
+            if self.config_entry:
+                key = f"{key}.{self.config_entry.entry_id}"
+            self._poll_key = polling.async_get_polling_scheduler(
+                self.hass
+            ).async_register(key, self.platform_name)
+        return self._poll_key
+
     @callback
     def _get_parallel_updates_semaphore(
         self, entity_has_sync_update: bool
@@ -664,18 +702,23 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        self._async_schedule_polling()
+
+    @callback
+    def _async_schedule_polling(self) -> None:
+        """Schedule the next poll of the platform."""
+        self._async_polling_timer = self.hass.loop.call_at(
+            polling.async_get_polling_scheduler(self.hass).async_next_refresh(
+                self._async_get_poll_key(), self.scan_interval_seconds
+            ),
             self._async_handle_interval_callback,
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_schedule_polling()
+        polling.async_get_polling_scheduler(self.hass).async_probe_loop_lag()
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -944,6 +987,9 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+        if self._poll_key is not None:
+            polling.async_get_polling_scheduler(self.hass).async_remove(self._poll_key)
+            self._poll_key = None
 
     @callback
     def async_prepare(self) -> None:
@@ -1038,7 +1084,12 @@ class EntityPlatform:
             )
             return
 
-        async with self._process_updates:
+        async with (
+            self._process_updates,
+            polling.async_get_polling_scheduler(self.hass).async_refresh_slot(
+                self._async_get_poll_key(), self.platform_name
+            ),
+        ):
             if self._update_in_sequence or len(self.entities) <= 1:
                 # If we know we will update sequentially, we want to avoid scheduling
                 # the coroutines as tasks that will wait on the semaphore lock.
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -70,6 +71,12 @@ _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
 
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
+
+# The resolutions of the timer wheel in seconds. Timers are aligned to
+# the coarsest resolution that is within the tolerance of the timer.
+_TIMER_WHEEL_RESOLUTIONS = (60.0, 15.0, 5.0, 1.0)
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1503,6 +1510,96 @@ def async_track_point_in_utc_time(
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
 
+class _WheelTimer:
+    """A timer in the timer wheel."""
+
+    __slots__ = ("target", "cancelled")
+
+    def __init__(self, target: Callable[[], None]) -> None:
+        """Init the timer."""
+        self.target = target
+        self.cancelled = False
+
+
+@dataclass(slots=True)
+class _TimerWheelBucket:
+    """Timers in the timer wheel that fire at the same time."""
+
+    handle: asyncio.TimerHandle
+    # Timers in the order they were added
+    timers: dict[_WheelTimer, None]
+
+
+class _TimerWheel:
+    """Batch timers that can fire late into shared event loop timers.
+
+    Each timer is rounded up to a multiple of the coarsest resolution
+    within its tolerance, so timers due around the same time share a
+    single call_at handle and fire together.
+    """
+
+    __slots__ = ("_loop", "_buckets")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Init the timer wheel."""
+        self._loop = loop
+        self._buckets: dict[float, _TimerWheelBucket] = {}
+
+    @callback
+    def async_call_at(
+        self, when: float, tolerance: float, target: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call target at loop time when or at most tolerance seconds later."""
+        for resolution in _TIMER_WHEEL_RESOLUTIONS:
+            if resolution <= tolerance:
+                break
+        else:
+            return self._loop.call_at(when, target).cancel
+
+        fire_at = math.ceil(when / resolution) * resolution
+        timer = _WheelTimer(target)
+        if (bucket := self._buckets.get(fire_at)) is None:
+            self._buckets[fire_at] = _TimerWheelBucket(
+                self._loop.call_at(fire_at, self._async_fire, fire_at), {timer: None}
+            )
+        else:
+            bucket.timers[timer] = None
+        return partial(self._async_cancel, fire_at, timer)
+
+    @callback
+    def _async_cancel(self, fire_at: float, timer: _WheelTimer) -> None:
+        """Cancel a timer."""
+        # The bucket is no longer in the wheel while its timers fire
+        timer.cancelled = True
+        if (bucket := self._buckets.get(fire_at)) is None:
+            return
+        bucket.timers.pop(timer, None)
+        if not bucket.timers:
+            bucket.handle.cancel()
+            del self._buckets[fire_at]
+
+    @callback
+    def _async_fire(self, fire_at: float) -> None:
+        """Fire all the timers in a bucket."""
+        if (bucket := self._buckets.pop(fire_at, None)) is None:
+            return
+        for timer in bucket.timers:
+            if timer.cancelled:
+                continue
+            try:
+                timer.target()
+            except Exception:
+                _LOGGER.exception("Error running timer %s", timer.target)
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Get the timer wheel."""
+    if (timer_wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        timer_wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass.loop)
+    return timer_wheel
+
+
 def _run_async_call_action(
     hass: HomeAssistant, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
 ) -> None:
@@ -1537,10 +1634,15 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    tolerance: float | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <delay>.
 
     The listener is passed the time it fires in UTC time.
+
+    If the listener can fire up to tolerance seconds late, it is batched
+    with other listeners that fire around the same time.
     """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
@@ -1550,6 +1652,10 @@ def async_call_later(
         else HassJob(action, f"call_later {delay}")
     )
     loop = hass.loop
+    if tolerance:
+        return _async_get_timer_wheel(hass).async_call_at(
+            loop.time() + delay, tolerance, partial(_run_async_call_action, hass, job)
+        )
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
@@ -1565,9 +1671,10 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
+    tolerance: float | None = None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _cancel_timer: CALLBACK_TYPE | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1590,9 +1697,16 @@ class _TrackTimeInterval:
             assert self._track_job is not None
         hass = self.hass
         loop = hass.loop
-        self._timer_handle = loop.call_at(
+        if self.tolerance:
+            self._cancel_timer = _async_get_timer_wheel(hass).async_call_at(
+                loop.time() + self.seconds,
+                self.tolerance,
+                partial(self._interval_listener, self._track_job),
+            )
+            return
+        self._cancel_timer = loop.call_at(
             loop.time() + self.seconds, self._interval_listener, self._track_job
-        )
+        ).cancel
 
     @callback
     def _interval_listener(self, _: Any) -> None:
@@ -1606,8 +1720,8 @@ class _TrackTimeInterval:
     def async_cancel(self) -> None:
         """Cancel the call_at."""
         if TYPE_CHECKING:
-            assert self._timer_handle is not None
-        self._timer_handle.cancel()
+            assert self._cancel_timer is not None
+        self._cancel_timer()
 
 
 @callback
@@ -1619,16 +1733,23 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    tolerance: float | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval.
 
     The listener is passed the time it fires in UTC time.
+
+    If the listener can fire up to tolerance seconds late, it is batched
+    with other listeners that fire around the same time, which also keeps
+    listeners with the same interval aligned.
     """
     seconds = interval.total_seconds()
     job_name = f"track time interval {seconds} {action}"
     if name:
         job_name = f"{name}: {job_name}"
-    track = _TrackTimeInterval(hass, seconds, job_name, action, cancel_on_shutdown)
+    track = _TrackTimeInterval(
+        hass, seconds, job_name, action, cancel_on_shutdown, tolerance
+    )
     track.async_attach()
     return track.async_cancel
 
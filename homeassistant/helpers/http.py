@@ -138,15 +138,12 @@ class HomeAssistantView:
                 ),
             )
             raise HTTPInternalServerError from err
-        response = web.Response(
+        return web.Response(
             body=msg,
             content_type=CONTENT_TYPE_JSON,
             status=int(status_code),
             headers=headers,
-            zlib_executor_size=32768,
         )
-        response.enable_compression()
-        return response
 
     def json_message(
         self,
@@ -0,0 +1,176 @@
+"""Helpers to schedule polling of integrations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import math
+from typing import Any
+from zlib import crc32
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+# Maximum number of scheduled refreshes that run at the same time
+MAX_CONCURRENT_REFRESHES = 32
+MAX_CONCURRENT_REFRESHES_PER_INTEGRATION = 8
+
+# When a ready callback waits longer than this to run, the event loop is
+# considered overloaded and polling intervals are stretched to relieve it.
+LOOP_LAG_BACKOFF_THRESHOLD = 0.25
+MAX_BACKOFF_FACTOR = 4.0
+
+# Minimum time in seconds between scheduling a refresh and running it
+MIN_REFRESH_GAP = 0.05
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Statistics about the refreshes of a poller."""
+
+    integration: str
+    refreshes: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    last_duration: float = 0.0
+
+    @callback
+    def async_record(self, duration: float) -> None:
+        """Record the duration of a refresh."""
+        self.refreshes += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "integration": self.integration,
+            "refreshes": self.refreshes,
+            "total_duration": self.total_duration,
+            "mean_duration": (
+                self.total_duration / self.refreshes if self.refreshes else 0.0
+            ),
+            "max_duration": self.max_duration,
+            "last_duration": self.last_duration,
+        }
+
+
+class PollingScheduler:
+    """Spread and throttle the scheduled refreshes of pollers.
+
+    Pollers get a deterministic phase within their interval based on their
+    key so that pollers sharing an interval do not all refresh at the same
+    time, concurrent refreshes are capped per integration and globally, and
+    intervals are stretched while the event loop is lagging.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self._loop = hass.loop
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REFRESHES)
+        self._integration_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._probe_pending = False
+        self.backoff_factor = 1.0
+        self.loop_lag = 0.0
+        self.stats: dict[str, RefreshStats] = {}
+        self._keys: set[str] = set()
+
+    @callback
+    def async_register(self, key: str, integration: str) -> str:
+        """Register a poller and return its unique key.
+
+        Pollers that share a key, for example coordinators with the same
+        name, get a counter appended in the order they are registered.
+        """
+        unique_key = key
+        counter = 1
+        while unique_key in self._keys:
+            counter += 1
+            unique_key = f"{key}_{counter}"
+        self._keys.add(unique_key)
+        self.stats[unique_key] = RefreshStats(integration)
+        return unique_key
+
+    @callback
+    def async_next_refresh(self, key: str, interval: float) -> float:
+        """Return the loop time of the next refresh of a poller.
+
+        The returned time is at most one (backed off) interval from now and
+        is aligned to the phase of the poller, so scheduled refreshes are
+        one interval apart. A slot that would fire right away is skipped so
+        a poller refreshing at the start of its slot does not schedule the
+        same slot again.
+        """
+        now = self._loop.time()
+        interval *= self.backoff_factor
+        offset = crc32(key.encode()) / 2**32 * interval
+        next_refresh = (
+            math.floor((now + interval - offset) / interval) * interval + offset
+        )
+        if next_refresh - now < MIN_REFRESH_GAP:
+            next_refresh += interval
+        return next_refresh
+
+    @callback
+    def async_probe_loop_lag(self) -> None:
+        """Measure how long the event loop takes to run a ready callback."""
+        if not self._probe_pending:
+            self._probe_pending = True
+            self._loop.call_soon(self._async_record_loop_lag, self._loop.time())
+
+    @callback
+    def _async_record_loop_lag(self, scheduled: float) -> None:
+        """Record the event loop lag and adjust the backoff."""
+        self._probe_pending = False
+        self.loop_lag = lag = self._loop.time() - scheduled
+        if lag > LOOP_LAG_BACKOFF_THRESHOLD:
+            self.backoff_factor = min(self.backoff_factor * 2, MAX_BACKOFF_FACTOR)
+        elif self.backoff_factor > 1.0:
+            self.backoff_factor = max(self.backoff_factor / 2, 1.0)
+
+    @asynccontextmanager
+    async def async_refresh_slot(
+        self, key: str, integration: str
+    ) -> AsyncGenerator[None]:
+        """Wait for a free refresh slot and record the refresh duration."""
+        if (semaphore := self._integration_semaphores.get(integration)) is None:
+            semaphore = self._integration_semaphores[integration] = asyncio.Semaphore(
+                MAX_CONCURRENT_REFRESHES_PER_INTEGRATION
+            )
+        async with semaphore, self._semaphore:
+            start = self._loop.time()
+            try:
+                yield
+            finally:
+                # The poller may have been removed while it was refreshing
+                if (stats := self.stats.get(key)) is not None:
+                    stats.async_record(self._loop.time() - start)
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Remove a poller that stopped polling and its statistics."""
+        self._keys.discard(key)
+        self.stats.pop(key, None)
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Get the polling scheduler."""
+    return PollingScheduler(hass)
+
+
+@callback
+def async_get_refresh_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the refresh statistics of all pollers."""
+    return {
+        key: stats.as_dict()
+        for key, stats in async_get_polling_scheduler(hass).stats.items()
+    }
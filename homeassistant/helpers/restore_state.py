@@ -12,13 +12,13 @@ from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .singleton import singleton
 from .storage import Store
 
@@ -29,9 +29,17 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# Changes since the last full dump are saved to a journal
+JOURNAL_STORAGE_KEY = "core.restore_state.journal"
+
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between full dumps that fold the journal into the saved states.
+# Must be well below STATE_EXPIRATION since the last seen time of unchanged
+# states is only refreshed by full dumps.
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -96,6 +104,20 @@ class StoredState:
         )
 
 
+def _extra_data_bytes(stored_state: StoredState) -> bytes | object | None:
+    """Return the serialized extra data of a stored state to detect changes.
+
+    Extra data which cannot be serialized returns a new object which never
+    compares equal, so the state is always considered changed.
+    """
+    if stored_state.extra_data is None:
+        return None
+    try:
+        return json_bytes(stored_state.extra_data.as_dict())
+    except JSON_ENCODE_EXCEPTIONS:
+        return object()
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -137,8 +159,17 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, JOURNAL_STORAGE_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The states and serialized extra data as of the last dump
+        self._dumped: dict[str, tuple[State, bytes | object | None]] | None = None
+        # The changes since the last full dump by entity_id
+        self._journal: dict[str, dict[str, Any]] = {}
+        self._journal_saved = False
+        self._last_full_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -168,8 +199,47 @@ class RestoreStateData:
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
+
+        try:
+            journal = await self.journal_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+            journal = None
+
+        if journal:
+            self._journal_saved = True
+            self._async_replay_journal(journal)
+
+        if self.last_states:
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+    @callback
+    def _async_replay_journal(self, journal: list[dict[str, Any]]) -> None:
+        """Apply the changes saved after the last full dump.
+
+        Entries older than the saved state are skipped, they were written
+        before a full dump that was not followed by clearing the journal.
+        """
+        last_states = self.last_states
+        for item in journal:
+            if (entity_id := item.get("removed")) is not None:
+                removed_at = dt_util.parse_datetime(item["last_seen"])
+                if (
+                    removed_at is not None
+                    and (stored_state := last_states.get(entity_id)) is not None
+                    and stored_state.last_seen <= removed_at
+                ):
+                    del last_states[entity_id]
+                continue
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            if (
+                existing := last_states.get(entity_id)
+            ) is None or existing.last_seen <= stored_state.last_seen:
+                last_states[entity_id] = stored_state
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -217,41 +287,109 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        dumped = {
+            stored_state.state.entity_id: (
+                stored_state.state,
+                _extra_data_bytes(stored_state),
+            )
+            for stored_state in stored_states
+        }
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped = dumped
+        self._last_full_dump = dt_util.utcnow()
+        self._journal.clear()
+        if self._journal_saved:
+            self._journal_saved = False
+            await self.journal_store.async_remove()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last dump to the journal.
+
+        Falls back to a full dump when there is no previous dump to diff
+        against, the last full dump is too old, or the journal has grown
+        to more than half of the saved states.
+        """
+        if (
+            self._dumped is None
+            or self._last_full_dump is None
+            or dt_util.utcnow() - self._last_full_dump >= STATE_COMPACT_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+
+        previous = self._dumped
+        journal = self._journal
+        dumped: dict[str, tuple[State, bytes | object | None]] = {}
+        changed = False
+        for stored_state in self.async_get_stored_states():
+            entity_id = stored_state.state.entity_id
+            extra_data = _extra_data_bytes(stored_state)
+            dumped[entity_id] = (stored_state.state, extra_data)
+            if (
+                (previous_dump := previous.get(entity_id)) is None
+                or previous_dump[0] is not stored_state.state
+                or previous_dump[1] != extra_data
+            ):
+                journal[entity_id] = stored_state.as_dict()
+                changed = True
+
+        if removed := previous.keys() - dumped.keys():
+            now = dt_util.utcnow()
+            for entity_id in removed:
+                journal[entity_id] = {"removed": entity_id, "last_seen": now}
+            changed = True
+
+        self._dumped = dumped
+        if not changed:
+            return
+
+        if len(journal) * 2 > len(dumped):
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(journal))
+        try:
+            await self.journal_store.async_save(list(journal.values()))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+        self._journal_saved = True
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
-        # has started and the old states have been read.
+        # has started and the old states have been read. It is a full dump
+        # which also folds the journal of the previous run into the states.
         self.hass.async_create_task_internal(
-            _async_dump_states(), "RestoreStateData dump"
+            self.async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        # Dump states periodically, a dump may run up to a minute late
         cancel_interval = async_track_time_interval(
             self.hass,
             _async_dump_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
+            tolerance=60,
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
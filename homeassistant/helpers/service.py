@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
 import dataclasses
 from enum import Enum
 from functools import cache, partial
 import logging
+import os
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -28,10 +29,12 @@ from homeassistant.const import (
     CONF_TARGET,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
@@ -63,10 +66,13 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .singleton import singleton
+from .storage import Store
 from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -75,9 +81,21 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
+TARGET_EXPANSION_CACHE: HassKey[_TargetExpansionCache] = HassKey(
+    "service_target_expansion_cache"
+)
+# Maximum number of distinct targets which expansions are cached
+MAX_TARGET_EXPANSIONS = 1024
+
+# The set of services the descriptions were built for, or None when a
+# description changed since and the descriptions must be rebuilt
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
-    tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
+    tuple[set[tuple[str, str]] | None, dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+SERVICES_FILE_CACHE: HassKey[_ServicesFileCache] = HassKey("services_file_cache")
+SERVICES_FILE_CACHE_STORAGE_KEY = "core.services_file_cache"
+SERVICES_FILE_CACHE_STORAGE_VERSION = 1
+SERVICES_FILE_CACHE_SAVE_DELAY = 30
 
 
 @cache
@@ -483,7 +501,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -507,6 +525,130 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    expansion = _async_get_target_expansion_cache(hass).async_get(selector)
+    selected.indirectly_referenced.update(expansion.indirectly_referenced)
+    selected.missing_devices.update(expansion.missing_devices)
+    selected.missing_areas.update(expansion.missing_areas)
+    selected.missing_floors.update(expansion.missing_floors)
+    selected.missing_labels.update(expansion.missing_labels)
+    selected.referenced_devices.update(expansion.referenced_devices)
+    selected.referenced_areas.update(expansion.referenced_areas)
+    return selected
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _TargetExpansion:
+    """Entities, devices and areas device, area, floor and label targets expand to."""
+
+    indirectly_referenced: frozenset[str]
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    missing_floors: frozenset[str]
+    missing_labels: frozenset[str]
+    referenced_devices: frozenset[str]
+    referenced_areas: frozenset[str]
+
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+# Fields of registry entries which change what a target expands to
+_ENTITY_TARGET_FIELDS = {
+    "area_id",
+    "device_id",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+    "labels",
+}
+_DEVICE_TARGET_FIELDS = {"area_id", "labels"}
+
+
+class _TargetExpansionCache:
+    """Cache what device, area, floor and label targets expand to.
+
+    Expanding a target walks the registry indexes, which is repeated for
+    every service call that targets the same devices, areas, floors or
+    labels. The expansions are cached until a registry changes in a way
+    that can change an expansion.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the target expansion cache."""
+        self._hass = hass
+        self._expansions: dict[_TargetKey, _TargetExpansion] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for registry changes."""
+        bus = self._hass.bus
+        bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=partial(_registry_changes_targets, _ENTITY_TARGET_FIELDS),
+        )
+        bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=partial(_registry_changes_targets, _DEVICE_TARGET_FIELDS),
+        )
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            bus.async_listen(event_type, self._async_registry_updated)
+
+    @callback
+    def _async_registry_updated(self, event: Event[Any]) -> None:
+        """Clear the cached expansions when a registry changed."""
+        self.async_clear()
+
+    @callback
+    def async_clear(self) -> None:
+        """Clear the cached expansions."""
+        self._expansions.clear()
+
+    @callback
+    def async_get(self, selector: ServiceTargetSelector) -> _TargetExpansion:
+        """Return what the device, area, floor and label targets expand to."""
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (expansion := self._expansions.get(key)) is None:
+            if len(self._expansions) >= MAX_TARGET_EXPANSIONS:
+                del self._expansions[next(iter(self._expansions))]
+            expansion = self._expansions[key] = _async_expand_target(
+                self._hass, selector
+            )
+        return expansion
+
+
+@callback
+def _registry_changes_targets(fields: set[str], event_data: Mapping[str, Any]) -> bool:
+    """Return if a registry update can change what targets expand to."""
+    return event_data["action"] != "update" or not fields.isdisjoint(
+        event_data["changes"]
+    )
+
+
+@callback
+@singleton(TARGET_EXPANSION_CACHE)
+def _async_get_target_expansion_cache(hass: HomeAssistant) -> _TargetExpansionCache:
+    """Return the target expansion cache."""
+    cache = _TargetExpansionCache(hass)
+    cache.async_setup()
+    return cache
+
+
+@callback
+def _async_expand_target(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> _TargetExpansion:
+    """Expand the device, area, floor and label targets of a service call."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -563,40 +705,47 @@ def async_extract_referenced_entity_ids(  # noqa: C901
                 for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
             )
 
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+    if selected.referenced_areas or selected.referenced_devices:
+        # Add indirectly referenced by area
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for area_id in selected.referenced_areas
+            # The entity's area matches a targeted area
+            for entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if entry.entity_category is None and entry.hidden_by is None
+        )
+        # Add indirectly referenced by device
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for device_id in selected.referenced_devices
+            for entry in entities.get_entries_for_device_id(device_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if (
+                entry.entity_category is None
+                and entry.hidden_by is None
+                and (
+                    # The entity's device matches a device referenced
+                    # by an area and the entity
+                    # has no explicitly set area
+                    not entry.area_id
+                    # The entity's device matches a targeted device
+                    or device_id in selector.device_ids
+                )
             )
         )
+
+    return _TargetExpansion(
+        frozenset(selected.indirectly_referenced),
+        frozenset(selected.missing_devices),
+        frozenset(selected.missing_areas),
+        frozenset(selected.missing_floors),
+        frozenset(selected.missing_labels),
+        frozenset(selected.referenced_devices),
+        frozenset(selected.referenced_areas),
     )
-    return selected
 
 
 @bind_hass
@@ -655,6 +804,99 @@ def _load_services_files(
     return [_load_services_file(hass, integration) for integration in integrations]
 
 
+def _services_file_signatures(
+    integrations: Iterable[Integration],
+) -> dict[str, list[Any]]:
+    """Return the signatures of the services files of integrations."""
+    signatures: dict[str, list[Any]] = {}
+    for integration in integrations:
+        try:
+            stat = os.stat(integration.file_path / "services.yaml")
+        except OSError:
+            continue
+        signatures[integration.domain] = [
+            HA_VERSION,
+            str(integration.version),
+            stat.st_mtime_ns,
+            stat.st_size,
+        ]
+    return signatures
+
+
+class _ServicesFileCache:
+    """Persisted cache of parsed services files.
+
+    Entries are kept per domain and are only used as long as Home Assistant,
+    the integration and the modification time and size of its services.yaml
+    did not change, so the files do not have to be parsed again after a
+    restart.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the services file cache."""
+        self.hass = hass
+        self._store = Store[dict[str, dict[str, Any]]](
+            hass,
+            SERVICES_FILE_CACHE_STORAGE_VERSION,
+            SERVICES_FILE_CACHE_STORAGE_KEY,
+        )
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_load_services_files(
+        self, integrations: list[Integration]
+    ) -> dict[str, JSON_TYPE]:
+        """Return the parsed services files of integrations by domain."""
+        async with self._lock:
+            if (entries := self._entries) is None:
+                entries = self._entries = await self._store.async_load() or {}
+
+            signatures = await self.hass.async_add_executor_job(
+                _services_file_signatures, integrations
+            )
+            contents: dict[str, JSON_TYPE] = {}
+            missing: list[Integration] = []
+            for integration in integrations:
+                domain = integration.domain
+                if (
+                    (signature := signatures.get(domain)) is not None
+                    and (entry := entries.get(domain)) is not None
+                    and entry["signature"] == signature
+                ):
+                    contents[domain] = entry["services"]
+                else:
+                    missing.append(integration)
+
+            if not missing:
+                return contents
+
+            loaded = await self.hass.async_add_executor_job(
+                _load_services_files, self.hass, missing
+            )
+            for integration, content in zip(missing, loaded, strict=True):
+                domain = integration.domain
+                contents[domain] = content
+                # Files that failed to load are not cached
+                if content and (signature := signatures.get(domain)) is not None:
+                    entries[domain] = {"signature": signature, "services": content}
+            self._store.async_delay_save(
+                self._data_to_save, SERVICES_FILE_CACHE_SAVE_DELAY
+            )
+            return contents
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to store."""
+        return self._entries or {}
+
+
+@callback
+@singleton(SERVICES_FILE_CACHE)
+def _async_get_services_file_cache(hass: HomeAssistant) -> _ServicesFileCache:
+    """Get the services file cache."""
+    return _ServicesFileCache(hass)
+
+
 @callback
 def async_get_cached_service_description(
     hass: HomeAssistant, domain: str, service: str
@@ -683,12 +925,13 @@ async def async_get_all_descriptions(
         for service_name in services_by_domain
     }
     # If we have a complete cache, check if it is still valid
-    all_cache: tuple[set[tuple[str, str]], dict[str, dict[str, Any]]] | None
+    all_cache: tuple[set[tuple[str, str]] | None, dict[str, dict[str, Any]]] | None
+    previous_descriptions: dict[str, dict[str, Any]] = {}
     if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
-        previous_all_services, previous_descriptions_cache = all_cache
+        previous_all_services, previous_descriptions = all_cache
         # If the services are the same, we can return the cache
         if previous_all_services == all_services:
-            return previous_descriptions_cache
+            return previous_descriptions
 
     # Files we loaded for missing descriptions
     loaded: dict[str, JSON_TYPE] = {}
@@ -712,10 +955,9 @@ async def async_get_all_descriptions(
             _LOGGER.error("Failed to load integration: %s", domain, exc_info=int_or_exc)
 
         if integrations:
-            contents = await hass.async_add_executor_job(
-                _load_services_files, hass, integrations
-            )
-            loaded = dict(zip(domains_with_missing_services, contents, strict=False))
+            loaded = await _async_get_services_file_cache(
+                hass
+            ).async_load_services_files(integrations)
 
     # Load translations for all service domains
     translations = await translation.async_get_translations(
@@ -725,6 +967,20 @@ async def async_get_all_descriptions(
     # Build response
     descriptions: dict[str, dict[str, Any]] = {}
     for domain, services_map in services.items():
+        # Keep the descriptions of domains that did not change so
+        # consumers can reuse what they derived from them
+        if (
+            (previous_domain_descriptions := previous_descriptions.get(domain))
+            is not None
+            and previous_domain_descriptions.keys() == services_map.keys()
+            and all(
+                descriptions_cache.get((domain, service_name)) is description
+                for service_name, description in previous_domain_descriptions.items()
+            )
+        ):
+            descriptions[domain] = previous_domain_descriptions
+            continue
+
         descriptions[domain] = {}
         domain_descriptions = descriptions[domain]
 
@@ -762,7 +1018,14 @@ async def async_get_all_descriptions(
                     f"component.{domain}.services.{service_name}.description",
                     yaml_description.get("description", ""),
                 ),
-                "fields": dict(yaml_description.get("fields", {})),
+                # The fields are copied as the parsed services file
+                # is cached and must not get the translations
+                "fields": {
+                    field_name: dict(field_schema)
+                    for field_name, field_schema in yaml_description.get(
+                        "fields", {}
+                    ).items()
+                },
             }
 
             # Translate fields names & descriptions as well
@@ -834,7 +1097,8 @@ def async_set_service_schema(
             "optional": response == SupportsResponse.OPTIONAL,
         }
 
-    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
+    if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
+        hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (None, all_cache[1])
     descriptions_cache[(domain, service)] = description
 
 
@@ -974,8 +1238,8 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
+        single_response = await _async_limit_entity_call(
+            entity, _handle_entity_call(hass, entity, func, data, call.context)
         )
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
@@ -984,20 +1248,29 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    individual_entities = entities
+    if isinstance(func, str) and not return_response:
+        individual_entities = await _async_handle_entity_batches(
+            hass, entities, func, cast(dict, data), call.context
+        )
+
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
+            _async_limit_entity_call(
+                entity,
+                entity.async_request_call(
+                    _handle_entity_call(hass, entity, func, data, call.context)
+                ),
             )
-            for entity in entities
+            for entity in individual_entities
         ],
         return_exceptions=True,
     )
 
     response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for entity, result in zip(individual_entities, results, strict=False):
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
@@ -1022,6 +1295,64 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+async def _async_handle_entity_batches(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    func: str,
+    data: dict[str, Any],
+    context: Context,
+) -> list[Entity]:
+    """Let platforms handle the service call for several of their entities at once.
+
+    Returns the entities the service needs to be called for one by one.
+    """
+    batches: dict[EntityPlatform, list[Entity]] = {}
+    individual_entities: list[Entity] = []
+    for entity in entities:
+        if (
+            platform := entity.platform
+        ) is not None and platform.async_handle_entity_service_batch is not None:
+            batches.setdefault(platform, []).append(entity)
+        else:
+            individual_entities.append(entity)
+
+    if not batches:
+        return entities
+
+    handlers: list[Coroutine[Any, Any, Iterable[Entity]]] = []
+    for platform, batch in batches.items():
+        if len(batch) == 1:
+            individual_entities.extend(batch)
+            continue
+        for entity in batch:
+            entity.async_set_context(context)
+        assert platform.async_handle_entity_service_batch is not None
+        handlers.append(
+            platform.async_handle_entity_service_batch(hass, batch, func, data)
+        )
+
+    for remaining in await asyncio.gather(*handlers):
+        individual_entities.extend(remaining)
+
+    # Keep the order of the targeted entities
+    if len(individual_entities) != len(entities):
+        remaining_ids = {entity.entity_id for entity in individual_entities}
+        return [entity for entity in entities if entity.entity_id in remaining_ids]
+    return entities
+
+
+async def _async_limit_entity_call(
+    entity: Entity, coro: Coroutine[Any, Any, ServiceResponse]
+) -> ServiceResponse:
+    """Run an entity service call within the concurrency cap of its platform."""
+    if (platform := entity.platform) is None or (
+        semaphore := platform.parallel_service_calls
+    ) is None:
+        return await coro
+    async with semaphore:
+        return await coro
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -66,17 +66,22 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
-        if variables is None:
-            variables = {}
+        """Update variables.
+
+        Only a shallow copy of the variables is taken, the changed variables
+        are not determined until the trace element is read.
+        """
+        self._variables = {} if variables is None else dict(variables)
+        variables_cv.set(self._variables)
+
+    def changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed since the previous trace element."""
         last_variables = self._last_variables
-        variables_cv.set(dict(variables))
-        changed_variables = {
+        return {
             key: value
-            for key, value in variables.items()
+            for key, value in self._variables.items()
             if key not in last_variables or last_variables[key] != value
         }
-        self._variables = changed_variables
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -88,8 +93,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self.changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error) or self._error.__class__.__name__
         if self._result is not None:
@@ -182,10 +187,9 @@ def trace_append_element(
     trace_element: TraceElement,
     maxlen: int | None = None,
 ) -> None:
-    """Append a TraceElement to trace[path]."""
+    """Append a TraceElement to trace[path] if a trace is being recorded."""
     if (trace := trace_cv.get()) is None:
-        trace = {}
-        trace_cv.set(trace)
+        return
     if (path := trace_element.path) not in trace:
         trace[path] = deque(maxlen=maxlen)
     trace[path].append(trace_element)
@@ -200,7 +204,13 @@ def trace_get(clear: bool = True) -> dict[str, deque[TraceElement]] | None:
 
 def trace_clear() -> None:
     """Clear the trace."""
+    trace_disable()
     trace_cv.set({})
+
+
+def trace_disable() -> None:
+    """Stop recording a trace in the current context."""
+    trace_cv.set(None)
     trace_stack_cv.set(None)
     trace_path_stack_cv.set(None)
     variables_cv.set(None)
@@ -138,9 +138,14 @@ class _TranslationsCacheData:
     This class contains data that is designed to be shared
     between multiple instances of the translation cache so
     we only have to load the data once.
+
+    The parsed translation files are kept in strings and a category
+    is only flattened into the cache the first time it is read.
     """
 
     loaded: dict[str, set[str]]
+    strings: dict[str, dict[str, dict[str, Any]]]
+    flattened: dict[str, dict[str, set[str]]]
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
 
 
@@ -152,7 +157,7 @@ class _TranslationCache:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
-        self.cache_data = _TranslationsCacheData({}, {})
+        self.cache_data = _TranslationsCacheData({}, {}, {}, {})
         self.lock = asyncio.Lock()
 
     @callback
@@ -196,7 +201,7 @@ class _TranslationCache:
         components: set[str],
     ) -> dict[str, str]:
         """Read resources from the cache."""
-        category_cache = self.cache_data.cache.get(language, {}).get(category, {})
+        category_cache = self._get_category_cache(language, category, components)
         # If only one component was requested, return it directly
         # to avoid merging the dictionaries and keeping additional
         # copies of the same data in memory.
@@ -208,9 +213,28 @@ class _TranslationCache:
             result.update(category_cache[component])
         return result
 
+    def _get_category_cache(
+        self,
+        language: str,
+        category: str,
+        components: set[str],
+    ) -> dict[str, dict[str, str]]:
+        """Return the category cache, flattening loaded components on first use."""
+        cache_data = self.cache_data
+        category_cache = cache_data.cache.get(language, {}).get(category, {})
+        if (loaded := cache_data.loaded.get(language)) and (
+            components_to_flatten := components.intersection(loaded).difference(
+                cache_data.flattened.get(language, {}).get(category, ())
+            )
+        ):
+            category_cache = self._build_category_cache(
+                language, category, components_to_flatten
+            )
+        return category_cache
+
     async def _async_load(self, language: str, components: set[str]) -> None:
         """Populate the cache for a given set of components."""
-        loaded = self.cache_data.loaded
+        cache_data = self.cache_data
         _LOGGER.debug(
             "Cache miss for %s: %s",
             language,
@@ -233,27 +257,14 @@ class _TranslationCache:
             self.hass, languages, components, integrations
         )
 
-        # English is always the fallback language so we load them first
-        self._build_category_cache(
-            language, components, translation_by_language_strings[LOCALE_EN]
-        )
-
-        if language != LOCALE_EN:
-            # Now overlay the requested language on top of the English
-            self._build_category_cache(
-                language, components, translation_by_language_strings[language]
+        # The strings are only flattened when a category is read. Since we
+        # just loaded English anyway we can avoid loading again if they
+        # switch back to English.
+        for strings_language in languages:
+            cache_data.strings.setdefault(strings_language, {}).update(
+                translation_by_language_strings[strings_language]
             )
-
-            loaded_english_components = loaded.setdefault(LOCALE_EN, set())
-            # Since we just loaded english anyway we can avoid loading
-            # again if they switch back to english.
-            if loaded_english_components.isdisjoint(components):
-                self._build_category_cache(
-                    LOCALE_EN, components, translation_by_language_strings[LOCALE_EN]
-                )
-                loaded_english_components.update(components)
-
-        loaded[language].update(components)
+            cache_data.loaded.setdefault(strings_language, set()).update(components)
 
     def _validate_placeholders(
         self,
@@ -303,21 +314,23 @@ class _TranslationCache:
     def _build_category_cache(
         self,
         language: str,
+        category: str,
         components: set[str],
-        translation_strings: dict[str, dict[str, Any]],
-    ) -> None:
-        """Extract resources into the cache."""
+    ) -> dict[str, dict[str, str]]:
+        """Flatten the resources of a category into the cache."""
+        cache_data = self.cache_data
         resource: dict[str, Any] | str
-        cached = self.cache_data.cache.setdefault(language, {})
-        categories = {
-            category
-            for component in translation_strings.values()
-            for category in component
-        }
+        category_cache = cache_data.cache.setdefault(language, {}).setdefault(
+            category, {}
+        )
+        # English is always the fallback language so it is flattened first
+        # and the requested language is overlaid on top of it
+        languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
 
-        for category in categories:
-            new_resources = build_resources(translation_strings, components, category)
-            category_cache = cached.setdefault(category, {})
+        for strings_language in languages:
+            new_resources = build_resources(
+                cache_data.strings.get(strings_language, {}), components, category
+            )
 
             for component, resource in new_resources.items():
                 component_cache = category_cache.setdefault(component, {})
@@ -331,6 +344,11 @@ class _TranslationCache:
                 flat = self._validate_placeholders(language, flat, component_cache)
                 component_cache.update(flat)
 
+        cache_data.flattened.setdefault(language, {}).setdefault(
+            category, set()
+        ).update(components)
+        return category_cache
+
 
 @bind_hass
 async def async_get_translations(
@@ -445,7 +463,9 @@ def async_get_exception_message(
     localize_key = (
         f"component.{translation_domain}.exceptions.{translation_key}.message"
     )
-    translations = async_get_cached_translations(hass, language, "exceptions")
+    translations = async_get_cached_translations(
+        hass, language, "exceptions", translation_domain
+    )
     if localize_key in translations:
         if message := translations[localize_key]:
             message = message.rstrip(".")
@@ -476,11 +496,13 @@ def async_translate_state(
         localize_key = (
             f"component.{platform}.entity.{domain}.{translation_key}.state.{state}"
         )
-        translations = async_get_cached_translations(hass, language, "entity")
+        translations = async_get_cached_translations(hass, language, "entity", platform)
         if localize_key in translations:
             return translations[localize_key]
 
-    translations = async_get_cached_translations(hass, language, "entity_component")
+    translations = async_get_cached_translations(
+        hass, language, "entity_component", domain
+    )
     if device_class is not None:
         localize_key = (
             f"component.{domain}.entity_component.{device_class}.state.{state}"
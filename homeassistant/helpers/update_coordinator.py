@@ -7,7 +7,6 @@ import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
@@ -26,7 +25,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity, polling
 from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -54,6 +53,16 @@ class BaseDataUpdateCoordinatorProtocol(Protocol):
         """Listen for data updates."""
 
 
+def _integration_from_logger(logger: logging.Logger) -> str:
+    """Return the integration a coordinator belongs to based on its logger."""
+    parts = logger.name.split(".")
+    if len(parts) > 2 and parts[:2] == ["homeassistant", "components"]:
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return logger.name
+
+
 class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     """Class to manage fetching data from single endpoint.
 
@@ -91,11 +100,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
+        # The polling scheduler spreads the refreshes of coordinators across
+        # their interval based on this key to avoid a thundering herd.
+        if self.config_entry:
+            self._integration = self.config_entry.domain
+            self._base_poll_key = (
+                f"{self._integration}.{name}.{self.config_entry.entry_id}"
+            )
+        else:
+            self._integration = _integration_from_logger(logger)
+            self._base_poll_key = f"{self._integration}.{name}"
+        self._poll_key: str | None = None
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
@@ -168,6 +183,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        if self._poll_key is not None:
+            polling.async_get_polling_scheduler(self.hass).async_remove(self._poll_key)
+            self._poll_key = None
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
 
@@ -223,18 +241,26 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
         hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        next_refresh = polling.async_get_polling_scheduler(hass).async_next_refresh(
+            self._async_get_poll_key(), self._update_interval_seconds
         )
-        self._unsub_refresh = loop.call_at(
+        self._unsub_refresh = hass.loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
 
+    @callback
+    def _async_get_poll_key(self) -> str:
+        """Return the key of the coordinator in the polling scheduler."""
+        if self._poll_key is None:
+            self._poll_key = polling.async_get_polling_scheduler(
+                self.hass
+            ).async_register(self._base_poll_key, self._integration)
+        return self._poll_key
+
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
         """Handle a refresh interval occurrence."""
+        polling.async_get_polling_scheduler(self.hass).async_probe_loop_lag()
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -252,7 +278,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        async with polling.async_get_polling_scheduler(self.hass).async_refresh_slot(
+            self._async_get_poll_key(), self._integration
+        ):
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
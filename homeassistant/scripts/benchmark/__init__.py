@@ -13,6 +13,7 @@ from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -312,6 +313,58 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def evaluate_conditions(hass):
+    """Evaluate a condition tree a million times without recording a trace."""
+    for idx in range(10):
+        hass.states.async_set(f"sensor.temperature{idx}", 20 + idx)
+        hass.states.async_set(f"input_select.mode{idx}", "away")
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": [f"input_select.mode{idx}" for idx in range(10)],
+                    "state": ["home", "away"],
+                },
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": "sensor.temperature0",
+                            "above": 25,
+                        },
+                        {
+                            "condition": "not",
+                            "conditions": [
+                                {
+                                    "condition": "time",
+                                    "after": "23:00:00",
+                                    "before": "06:00:00",
+                                },
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "enabled": False,
+                    "condition": "state",
+                    "entity_id": "sensor.temperature1",
+                    "state": "21",
+                },
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+
+    start = timer()
+    for _ in range(10**6):
+        check(hass)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -191,9 +191,10 @@ def check(config_dir, secrets=False):
         """Mock _get_secrets."""
         try:
             val = MOCKS["secrets"][1](ldr, node)
+            # The secrets of files that can be cached are resolved after parsing
+            res["secrets"][node.value] = ldr.secrets.get(ldr.get_name, node.value)
         except HomeAssistantError:
-            val = None
-        res["secrets"][node.value] = val
+            val = res["secrets"][node.value] = None
         return val
 
     # Patches with local mock functions
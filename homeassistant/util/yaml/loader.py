@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from copy import deepcopy
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -36,6 +39,11 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed configuration files by file name, with the hash of their content,
+# in the order they were last used
+_PARSED_YAML_CACHE: dict[str, tuple[bytes, JSON_TYPE, list[tuple[Any, ...]]]] = {}
+_PARSED_YAML_CACHE_SIZE = 256
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -108,11 +116,28 @@ class Secrets:
         return secrets
 
 
+@dataclass(slots=True, frozen=True)
+class _SecretReference:
+    """Reference to a secret, resolved every time the file is loaded."""
+
+    secret: str
+
+
+@dataclass(slots=True)
+class _ParseInfo:
+    """Information collected while parsing a file that may be cached."""
+
+    cacheable: bool = True
+    has_secrets: bool = False
+    warnings: list[tuple[Any, ...]] = field(default_factory=list)
+
+
 class _LoaderMixin:
     """Mixin class with extensions for YAML loader."""
 
     name: str
     stream: Any
+    parse_info: _ParseInfo | None
 
     @cached_property
     def get_name(self) -> str:
@@ -142,6 +167,7 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.parse_info = None
 
 
 class SafeLoader(FastSafeLoader):
@@ -182,6 +208,7 @@ class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.parse_info = None
 
 
 class SafeLineLoader(PythonSafeLoader):
@@ -224,7 +251,9 @@ def load_yaml(
     """Load a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            if secrets is None:
+                return parse_yaml(conf_file, secrets)
+            return _load_config_yaml(conf_file, os.fspath(fname), secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -274,6 +303,90 @@ def _parse_yaml_python(
         raise HomeAssistantError(exc) from exc
 
 
+def _load_config_yaml(conf_file: TextIO, fname: str, secrets: Secrets) -> JSON_TYPE:
+    """Load a configuration file, reusing the parsed file if it did not change.
+
+    Files are parsed with references in place of their secrets and cached by
+    the hash of their content unless they include other files or read
+    environment variables. Every load returns a copy of the parsed file with
+    the secrets resolved again.
+    """
+    content = conf_file.read()
+    digest = hashlib.sha256(content.encode()).digest()
+    if (cached := _PARSED_YAML_CACHE.pop(fname, None)) is not None and (
+        cached[0] == digest
+    ):
+        _PARSED_YAML_CACHE[fname] = cached
+        _, parsed, warnings = cached
+        for warning in warnings:
+            _LOGGER.warning(*warning)
+        return _resolve_parsed_yaml(parsed, fname, secrets)
+
+    stream = StringIO(content)
+    stream.name = getattr(conf_file, "name", fname)  # type: ignore[misc]
+    loader: LoaderType = (FastSafeLoader if HAS_C_LOADER else PythonSafeLoader)(
+        stream, secrets
+    )
+    loader.parse_info = parse_info = _ParseInfo()
+    try:
+        parsed = loader.get_single_data()
+    except yaml.YAMLError:
+        # Load with the Python loader which has more readable exceptions
+        stream.seek(0, 0)
+        return _parse_yaml_python(stream, secrets)
+    finally:
+        loader.dispose()
+
+    if parse_info.cacheable:
+        if len(_PARSED_YAML_CACHE) >= _PARSED_YAML_CACHE_SIZE:
+            # Evict the least recently used file
+            del _PARSED_YAML_CACHE[next(iter(_PARSED_YAML_CACHE))]
+        _PARSED_YAML_CACHE[fname] = (digest, parsed, parse_info.warnings)
+    elif not parse_info.has_secrets:
+        return parsed
+    return _resolve_parsed_yaml(parsed, fname, secrets)
+
+
+def _resolve_parsed_yaml(obj: Any, fname: str, secrets: Secrets) -> Any:
+    """Return a copy of a parsed file with its secrets resolved."""
+    if type(obj) is NodeDictClass:
+        resolved_dict = NodeDictClass(
+            {
+                (
+                    secrets.get(fname, key.secret)
+                    if type(key) is _SecretReference
+                    else key
+                ): _resolve_parsed_yaml(value, fname, secrets)
+                for key, value in obj.items()
+            }
+        )
+        return _copy_reference(obj, resolved_dict)
+    if type(obj) is NodeListClass:
+        resolved_list = NodeListClass(
+            _resolve_parsed_yaml(value, fname, secrets) for value in obj
+        )
+        return _copy_reference(obj, resolved_list)
+    if type(obj) is _SecretReference:
+        return secrets.get(fname, obj.secret)
+    if isinstance(obj, (dict, list, set)):
+        # Containers constructed from explicit tags like !!omap and !!set
+        return deepcopy(obj)
+    # Strings, numbers and inputs are immutable and shared
+    return obj
+
+
+def _copy_reference(
+    source: NodeDictClass | NodeListClass, obj: NodeDictClass | NodeListClass
+) -> Any:
+    """Copy file reference information from one node class object to another."""
+    try:  # suppress is much slower
+        obj.__config_file__ = source.__config_file__
+        obj.__line__ = source.__line__
+    except AttributeError:
+        pass
+    return obj
+
+
 def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
@@ -355,6 +468,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
+    _mark_not_cacheable(loader)
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -367,6 +481,12 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         ) from exc
 
 
+def _mark_not_cacheable(loader: LoaderType) -> None:
+    """Mark the file being parsed as depending on more than its content."""
+    if (parse_info := loader.parse_info) is not None:
+        parse_info.cacheable = False
+
+
 def _is_file_valid(name: str) -> bool:
     """Decide if a file is valid."""
     return not name.startswith(".")
@@ -384,6 +504,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
 
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
+    _mark_not_cacheable(loader)
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -403,6 +524,7 @@ def _include_dir_merge_named_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeDictClass:
     """Load multiple files from directory as a merged dictionary."""
+    _mark_not_cacheable(loader)
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -418,6 +540,7 @@ def _include_dir_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
+    _mark_not_cacheable(loader)
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
@@ -431,6 +554,7 @@ def _include_dir_merge_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
+    _mark_not_cacheable(loader)
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
@@ -470,14 +594,16 @@ def _handle_mapping_tag(
             ) from exc
 
         if key in seen:
-            fname = loader.get_stream_name
-            _LOGGER.warning(
+            warning = (
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
-                fname,
+                loader.get_stream_name,
                 key,
                 seen[key],
                 line,
             )
+            _LOGGER.warning(*warning)
+            if (parse_info := loader.parse_info) is not None:
+                parse_info.warnings.append(warning)
         seen[key] = line
 
     return _add_reference_to_node_class(NodeDictClass(nodes), loader, node)
@@ -501,6 +627,7 @@ def _handle_scalar_tag(
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    _mark_not_cacheable(loader)
     args = node.value.split()
 
     # Check for a default value
@@ -517,6 +644,9 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    if (parse_info := loader.parse_info) is not None:
+        parse_info.has_secrets = True
+        return _SecretReference(node.value)  # type: ignore[return-value]
     return loader.secrets.get(loader.get_name, node.value)
 
 
@@ -6,6 +6,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import jwt
 import pytest
 import voluptuous as vol
@@ -390,6 +391,36 @@ async def test_cannot_retrieve_expired_access_token(hass: HomeAssistant) -> None
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_cached(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test verified access tokens are cached until revoked or expired."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        side_effect=AssertionError("signature verified again"),
+    ):
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        user.is_active = False
+        assert manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+        assert manager.async_validate_access_token(access_token) is refresh_token
+
+    manager.async_remove_refresh_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is None
+
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is refresh_token
+    freezer.tick(auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(seconds=11))
+    assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass: HomeAssistant) -> None:
     """Test that we can add a system user."""
     events = []
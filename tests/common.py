@@ -72,6 +72,7 @@ from homeassistant.helpers import (
     recorder as recorder_helper,
     restore_state,
     restore_state as rs,
+    service,
     storage,
     translation,
 )
@@ -605,6 +606,12 @@ def mock_component(hass: HomeAssistant, component: str) -> None:
     hass.config.components.add(component)
 
 
+def _reset_target_expansion_cache(hass: HomeAssistant) -> None:
+    """Reset the targets expanded from a registry which is replaced."""
+    if (cache := hass.data.get(service.TARGET_EXPANSION_CACHE)) is not None:
+        cache.async_clear()
+
+
 def mock_registry(
     hass: HomeAssistant,
     mock_entries: dict[str, er.RegistryEntry] | None = None,
@@ -631,6 +638,7 @@ def mock_registry(
 
     hass.data[er.DATA_REGISTRY] = registry
     er.async_get.cache_clear()
+    _reset_target_expansion_cache(hass)
     return registry
 
 
@@ -655,6 +663,7 @@ def mock_area_registry(
 
     hass.data[ar.DATA_REGISTRY] = registry
     ar.async_get.cache_clear()
+    _reset_target_expansion_cache(hass)
     return registry
 
 
@@ -684,6 +693,7 @@ def mock_device_registry(
 
     hass.data[dr.DATA_REGISTRY] = registry
     dr.async_get.cache_clear()
+    _reset_target_expansion_cache(hass)
     return registry
 
 
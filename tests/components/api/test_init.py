@@ -11,7 +11,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant import const
-from homeassistant.auth.models import Credentials
+from homeassistant.auth.models import Credentials, Group
 from homeassistant.auth.providers.legacy_api_password import (
     LegacyApiPasswordAuthProvider,
 )
@@ -47,6 +47,68 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_list_states_etag(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test listing states can be revalidated with the ETag."""
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+
+    hass.states.async_set("test.entity", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert [item["state"] for item in await resp.json()] == ["world"]
+
+
+async def test_api_list_states_since(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test listing the states changed since a version."""
+    hass.states.async_set("test.one", "1")
+    hass.states.async_set("test.two", "2")
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "0-0"})
+    assert resp.status == HTTPStatus.OK
+    data = await resp.json()
+    assert data["full"] is True
+    assert {item["entity_id"] for item in data["states"]} == {"test.one", "test.two"}
+    assert data["removed"] == []
+    version = data["version"]
+
+    hass.states.async_set("test.one", "changed")
+    hass.states.async_remove("test.two")
+    hass.states.async_set("test.three", "3")
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": version})
+    data = await resp.json()
+    assert data["full"] is False
+    assert sorted((item["entity_id"], item["state"]) for item in data["states"]) == [
+        ("test.one", "changed"),
+        ("test.three", "3"),
+    ]
+    assert data["removed"] == ["test.two"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": data["version"]}
+    )
+    data = await resp.json()
+    assert data["full"] is False
+    assert data["states"] == []
+    assert data["removed"] == []
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "bad"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_api_get_state(hass: HomeAssistant, mock_api_client: TestClient) -> None:
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -684,6 +746,57 @@ async def test_states_view_filters(
     assert json[0]["entity_id"] == "test.entity"
 
 
+async def test_states_view_scoped_to_permissions(
+    hass: HomeAssistant,
+    hass_read_only_user: MockUser,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the versions of the states are scoped to the permissions of a user."""
+    hass_read_only_user.groups = [
+        Group(name="one", policy={"entities": {"entity_ids": {"test.one": True}}})
+    ]
+    await async_setup_component(hass, "api", {})
+    refresh_token = await hass.auth.async_create_refresh_token(
+        hass_read_only_user, CLIENT_ID
+    )
+    token = hass.auth.async_create_access_token(refresh_token)
+    mock_api_client = await hass_client(token)
+    hass.states.async_set("test.one", "1")
+    hass.states.async_set("test.two", "2")
+
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Vary"] == "Authorization"
+    assert [item["entity_id"] for item in await resp.json()] == ["test.one"]
+    etag = resp.headers["ETag"]
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "0-0"})
+    version = (await resp.json())["version"]
+    assert resp.headers["Vary"] == "Authorization"
+
+    hass_read_only_user.groups = [
+        Group(
+            name="both",
+            policy={"entities": {"entity_ids": {"test.one": True, "test.two": True}}},
+        )
+    ]
+
+    # The states did not change but the user may now read other states
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert [item["entity_id"] for item in await resp.json()] == [
+        "test.one",
+        "test.two",
+    ]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": version})
+    data = await resp.json()
+    assert data["full"] is True
+    assert {item["entity_id"] for item in data["states"]} == {"test.one", "test.two"}
+
+
 async def test_get_entity_state_read_perm(
     hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
 ) -> None:
@@ -1770,3 +1770,98 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(calls) == 2
     assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test state triggers of many automations share a single listener."""
+    hass.states.async_set("test.entity", "off", {"brightness": 0})
+    await hass.async_block_till_done()
+
+    triggers = [
+        {"to": "on"},
+        {"to": ["on", "idle"], "from": "off"},
+        {"to": "off"},
+        {"not_to": "off"},
+        {},
+        {"attribute": "brightness", "to": 100},
+    ]
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        **trigger,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"index": index},
+                    },
+                }
+                for index, trigger in enumerate(triggers)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    index = hass.data[state_trigger.DATA_STATE_TRIGGER_INDEX]
+    assert list(index._entities) == ["test.entity"]
+
+    hass.states.async_set("test.entity", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert [call.data["index"] for call in calls] == [0, 1, 3, 4, 5]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "on", {"brightness": 50})
+    await hass.async_block_till_done()
+    assert [call.data["index"] for call in calls] == [4]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "idle", {"brightness": 50})
+    await hass.async_block_till_done()
+    assert [call.data["index"] for call in calls] == [3, 4]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert index._entities == {}
+
+
+async def test_state_trigger_index_action_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an action raising does not stop the other triggers of an entity."""
+    index = state_trigger.StateTriggerIndex(hass)
+    calls: list[str] = []
+
+    def _failing_action(event, old_value, new_value) -> None:
+        raise ValueError("boom")
+
+    def _action(event, old_value, new_value) -> None:
+        calls.append(new_value)
+
+    for action in (_failing_action, _action):
+        # Unvalidated trigger configs may pass a single entity id
+        index.async_attach(
+            "test.entity",
+            None,
+            frozenset(("on",)),
+            lambda _: True,
+            lambda _: True,
+            False,
+            action,
+        )
+    assert list(index._entities) == ["test.entity"]
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert calls == ["on"]
+    assert "Error while dispatching state trigger for test.entity" in caplog.text
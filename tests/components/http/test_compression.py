@@ -0,0 +1,103 @@
+"""Test compression middleware."""
+
+from collections.abc import Generator
+from http import HTTPStatus
+import zlib
+
+from aiohttp import web
+import aiohttp_fast_zlib
+import pytest
+
+from homeassistant.components.http.compression import setup_compression
+
+from tests.typing import ClientSessionGenerator
+
+LARGE_JSON = b"[" + b",".join(b'{"state":"on"}' for _ in range(200)) + b"]"
+
+
+async def mock_handler_large(_: web.Request) -> web.Response:
+    """Return a large JSON body."""
+    response = web.Response(body=LARGE_JSON, content_type="application/json")
+    response.etag = "abc"
+    return response
+
+
+async def mock_handler_small(_: web.Request) -> web.Response:
+    """Return a small JSON body."""
+    return web.Response(body=b"[]", content_type="application/json")
+
+
+async def mock_handler_binary(_: web.Request) -> web.Response:
+    """Return a large binary body."""
+    return web.Response(body=LARGE_JSON, content_type="application/octet-stream")
+
+
+@pytest.fixture(params=[False, True], ids=["zlib", "fast_zlib"])
+def fast_zlib(request: pytest.FixtureRequest) -> Generator[None]:
+    """Run with the standard zlib and with the fastest available zlib."""
+    if request.param:
+        aiohttp_fast_zlib.enable()
+    else:
+        aiohttp_fast_zlib.disable()
+    yield
+    aiohttp_fast_zlib.disable()
+
+
+@pytest.mark.usefixtures("fast_zlib")
+@pytest.mark.parametrize("level", [1, 6, 9])
+async def test_compression(aiohttp_client: ClientSessionGenerator, level: int) -> None:
+    """Test large responses are compressed when the client accepts it."""
+    app = web.Application()
+    app.router.add_get("/large", mock_handler_large)
+    app.router.add_get("/small", mock_handler_small)
+    app.router.add_get("/binary", mock_handler_binary)
+
+    setup_compression(app, level=level, min_size=1024)
+
+    client = await aiohttp_client(app)
+    resp = await client.get(
+        "/large", headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["ETag"] == 'W/"abc"'
+    body = await resp.read()
+    assert len(body) < len(LARGE_JSON)
+    assert zlib.decompress(body, wbits=16 + zlib.MAX_WBITS) == LARGE_JSON
+
+    resp = await client.get(
+        "/large", headers={"Accept-Encoding": "deflate"}, auto_decompress=False
+    )
+    assert resp.headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(await resp.read()) == LARGE_JSON
+
+    resp = await client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["ETag"] == '"abc"'
+    assert await resp.read() == LARGE_JSON
+
+    for accept_encoding, coding in (
+        ("gzip;q=0, deflate", "deflate"),
+        ("gzip;q=0.5, deflate;q=0.8", "deflate"),
+        ("*", "gzip"),
+        ("*, gzip;q=0", "deflate"),
+    ):
+        resp = await client.get(
+            "/large",
+            headers={"Accept-Encoding": accept_encoding},
+            auto_decompress=False,
+        )
+        assert resp.headers["Content-Encoding"] == coding
+
+    resp = await client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.read() == LARGE_JSON
+
+    for path in ("/small", "/binary"):
+        resp = await client.get(
+            path, headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+        )
+        assert resp.status == HTTPStatus.OK
+        assert "Content-Encoding" not in resp.headers
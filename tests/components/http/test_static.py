@@ -6,7 +6,14 @@ from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    MAX_MEMORY_FILE_SIZE,
+    MEMORY_CACHE,
+    CachingStaticResource,
+    _get_file_path,
+    _MemoryCache,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGRED_CORS
 from homeassistant.setup import async_setup_component
@@ -59,3 +66,109 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path)
+
+
+@pytest.mark.parametrize("immutable", [False, True])
+async def test_static_precompressed_variants(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    immutable: bool,
+) -> None:
+    """Test precompressed variants are served when the encoding is accepted."""
+    (tmp_path / "app.js").write_text("identity")
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "app.js.gz").write_bytes(b"gzip")
+    (tmp_path / "plain.txt").write_text("plain")
+    resource = CachingStaticResource("/static", str(tmp_path), immutable=immutable)
+    if immutable:
+        await resource.async_index(hass)
+    hass.http.app.router.register_resource(resource)
+
+    for accept_encoding, body, encoding in (
+        ("gzip, deflate, br", b"brotli", "br"),
+        ("gzip", b"gzip", "gzip"),
+        ("identity", b"identity", None),
+        ("gzip, br;q=0", b"gzip", "gzip"),
+        ("br;q=0.5, gzip", b"gzip", "gzip"),
+        ("BR;Q=0.8, gzip;q=0.8", b"brotli", "br"),
+        ("gzip;q=0, *", b"brotli", "br"),
+        ("*;q=0", b"identity", None),
+        ("brotli, xgzip", b"identity", None),
+    ):
+        resp = await mock_http_client.get(
+            "/static/app.js",
+            headers={"Accept-Encoding": accept_encoding},
+            auto_decompress=False,
+        )
+        assert resp.status == 200
+        assert await resp.read() == body
+        assert resp.headers.get("Content-Encoding") == encoding
+        assert resp.headers["Content-Type"] == "text/javascript"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert resp.headers["Cache-Control"] == CACHE_HEADER
+
+    resp = await mock_http_client.get("/static/plain.txt")
+    assert resp.status == 200
+    assert await resp.text() == "plain"
+    assert "Vary" not in resp.headers
+
+
+async def test_static_immutable_etag_and_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test immutable directories revalidate with ETags and serve from memory."""
+    (tmp_path / "small.js").write_text("small")
+    (tmp_path / "large.bin").write_bytes(b"x" * (MAX_MEMORY_FILE_SIZE + 1))
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.css").write_text("nested")
+    resource = CachingStaticResource("/static", str(tmp_path), immutable=True)
+    await resource.async_index(hass)
+    hass.http.app.router.register_resource(resource)
+    MEMORY_CACHE.clear()
+
+    resp = await mock_http_client.get("/static/small.js")
+    assert resp.status == 200
+    assert await resp.text() == "small"
+    etag = resp.headers["ETag"]
+    assert MEMORY_CACHE.size == len("small")
+
+    resp = await mock_http_client.get(
+        "/static/small.js", headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+    assert await resp.read() == b""
+
+    resp = await mock_http_client.get(
+        "/static/small.js", headers={"If-None-Match": '"other"'}
+    )
+    assert resp.status == 200
+    assert await resp.text() == "small"
+
+    resp = await mock_http_client.get("/static/large.bin")
+    assert resp.status == 200
+    assert len(await resp.read()) == MAX_MEMORY_FILE_SIZE + 1
+    assert MEMORY_CACHE.size == len("small")
+
+    resp = await mock_http_client.get("/static/sub/nested.css")
+    assert resp.status == 200
+    assert await resp.text() == "nested"
+    assert resp.headers["Content-Type"] == "text/css"
+
+    resp = await mock_http_client.get("/static/missing.js")
+    assert resp.status == 404
+    MEMORY_CACHE.clear()
+
+
+async def test_static_memory_cache_size_cap(tmp_path: Path) -> None:
+    """Test the memory cache evicts the least recently used bodies."""
+    cache = _MemoryCache(10)
+    cache.add(tmp_path / "a", b"aaaa")
+    cache.add(tmp_path / "b", b"bbbb")
+    assert cache.get(tmp_path / "a") == b"aaaa"
+    cache.add(tmp_path / "c", b"cccc")
+    assert cache.size == 8
+    assert cache.get(tmp_path / "b") is None
+    assert cache.get(tmp_path / "a") == b"aaaa"
+    assert cache.get(tmp_path / "c") == b"cccc"
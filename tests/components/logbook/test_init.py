@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -17,7 +17,10 @@ from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
-from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
+from homeassistant.components.logbook.queries.common import (
+    PSEUDO_EVENT_STATE_CHANGED,
+    context_rows_stmt,
+)
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
@@ -47,6 +50,7 @@ from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import MockRow, mock_humanify
 
@@ -2957,6 +2961,60 @@ async def test_get_events_with_context_state(
     assert "context_event_type" not in results[3]
 
 
+async def test_get_events_entities_context_rows_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the rows that originated a context are remembered between requests."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    hass.states.async_set("light.kitchen1", STATE_OFF)
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.states.async_set("binary_sensor.is_light", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen1", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    with patch(
+        "homeassistant.components.logbook.processor.context_rows_stmt",
+        wraps=context_rows_stmt,
+    ) as mock_context_rows_stmt:
+        for msg_id in (1, 2):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": now.isoformat(),
+                    "entity_ids": ["light.kitchen1"],
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            results = response["result"]
+            assert len(results) == 1
+            assert results[0]["entity_id"] == "light.kitchen1"
+            assert results[0]["state"] == "on"
+            assert results[0]["context_entity_id"] == "binary_sensor.is_light"
+            assert results[0]["context_state"] == "off"
+            assert results[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+    assert mock_context_rows_stmt.call_count == 1
+    assert ulid_to_bytes(context.id) in hass.data[logbook.DOMAIN].context_rows
+
+
 async def test_logbook_with_empty_config(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1567,6 +1567,90 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_subscribe_logbook_stream_entities_from_recent_events(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a logbook stream starting inside the recent events buffer skips the database."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await hass.async_block_till_done()
+    now = dt_util.utcnow()
+
+    hass.states.async_set("light.small", STATE_ON)
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    hass.states.async_set("binary_sensor.is_light", STATE_OFF)
+    state: State = hass.states.get("binary_sensor.is_light")
+    hass.states.async_set("binary_sensor.other", STATE_ON)
+    hass.states.async_set("binary_sensor.other", STATE_OFF)
+    await hass.async_block_till_done()
+
+    websocket_client = await hass_ws_client()
+    with patch.object(
+        websocket_api, "_async_get_ws_stream_events"
+    ) as mock_get_ws_stream_events:
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small", "binary_sensor.is_light"],
+            }
+        )
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == TYPE_RESULT
+        assert msg["success"]
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["start_time"] == now.timestamp()
+        assert msg["event"]["partial"] is True
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "binary_sensor.is_light",
+                "state": "off",
+                "when": state.last_updated.timestamp(),
+            }
+        ]
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert "partial" not in msg["event"]
+        assert msg["event"]["events"] == []
+
+        hass.states.async_set("light.small", STATE_OFF)
+        await hass.async_block_till_done()
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "light.small",
+                "state": "off",
+                "when": ANY,
+            },
+        ]
+
+    assert not mock_get_ws_stream_events.called
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
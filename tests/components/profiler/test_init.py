@@ -1,10 +1,12 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
 import os
 from pathlib import Path
+import time
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -27,16 +29,22 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_WRITE_STATE_STATS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_WRITE_STATE_STATS,
+    loop_monitor,
 )
-from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity, async_get_write_state_stats
+from homeassistant.helpers.entity_component import async_update_entity
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +454,113 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_write_state_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test collecting write state stats."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_WRITE_STATE_STATS)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_WRITE_STATE_STATS)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/write_state_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_WRITE_STATE_STATS, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_WRITE_STATE_STATS, {}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_WRITE_STATE_STATS, {}, blocking=True
+        )
+
+    ent = Entity()
+    ent.hass = hass
+    ent.entity_id = "test.noisy"
+    ent.async_write_ha_state()
+    ent.async_write_ha_state()
+
+    await client.send_json_auto_id({"type": "profiler/write_state_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["entities"]["test.noisy"]["writes"] == 2
+    assert result["entities"]["test.noisy"]["unchanged_writes"] == 1
+    assert result["platforms"]["null"]["writes"] == 2
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_WRITE_STATE_STATS, {}, blocking=True
+    )
+    assert "Write state stats for test.noisy" in caplog.text
+    assert async_get_write_state_stats(hass) is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the event loop monitor sensors and subscription."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    with (
+        patch.object(loop_monitor, "LAG_SAMPLE_INTERVAL", 0.05),
+        patch.object(loop_monitor, "SLOW_CALLBACK_THRESHOLD", 0.1),
+        patch.object(loop_monitor, "WATCHDOG_INTERVAL", 0.01),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        await asyncio.sleep(0.2)
+        # Block the event loop to register a slow callback
+        time.sleep(0.4)
+        await asyncio.sleep(0.2)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_monitor/subscribe"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    snapshot = response["event"]
+    assert set(snapshot["lag"]) == {"p50", "p95", "p99", "max"}
+    assert snapshot["lag"]["max"] >= 0.3
+    assert sum(snapshot["slow_callbacks"].values()) == 1
+    assert snapshot["recent_slow_callbacks"][0]["duration"] >= 0.3
+    assert snapshot["tasks"]
+
+    await async_update_entity(hass, "sensor.profiler_event_loop_slow_callbacks")
+    state = hass.states.get("sensor.profiler_event_loop_slow_callbacks")
+    assert state.state == "1"
+    await async_update_entity(hass, "sensor.profiler_event_loop_lag_maximum")
+    state = hass.states.get("sensor.profiler_event_loop_lag_maximum")
+    assert float(state.state) >= 300
+
+    monitor = hass.data[DOMAIN][LOOP_MONITOR]
+    assert monitor._subscriptions
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not monitor._subscriptions
+
+    await client.send_json_auto_id({"type": "profiler/loop_monitor/subscribe"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from copy import copy
 from datetime import datetime, timedelta
 import json
@@ -389,6 +390,82 @@ async def test_state_changes_during_period_descending(
     )
 
 
+async def test_state_changes_during_period_columns(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes during period as columns."""
+    entity_id = "sensor.test"
+
+    def set_state(state):
+        """Set the state."""
+        hass.states.async_set(entity_id, state, {"any": 1})
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow().replace(microsecond=0)
+    point = start + timedelta(seconds=1)
+    point2 = point + timedelta(seconds=1)
+    point3 = point2 + timedelta(seconds=1)
+    end = point3 + timedelta(seconds=1)
+
+    with freeze_time(start) as freezer:
+        set_state("1")
+
+        freezer.move_to(point)
+        states = [set_state("2")]
+
+        freezer.move_to(point2)
+        states.append(set_state("unavailable"))
+
+        freezer.move_to(point3)
+        states.append(set_state("3.5"))
+
+        freezer.move_to(end)
+        set_state("4")
+    await async_wait_recording_done(hass)
+
+    timestamps, values = history.state_changes_during_period_columns(
+        hass, start, end, entity_id, include_start_time_state=False
+    )
+    assert list(timestamps) == [state.last_changed.timestamp() for state in states]
+    assert values == ["2", "unavailable", "3.5"]
+
+    timestamps, values = history.state_changes_during_period_columns(
+        hass, start, end, entity_id, descending=True, include_start_time_state=False
+    )
+    assert list(timestamps) == [
+        state.last_changed.timestamp() for state in reversed(states)
+    ]
+    assert values == ["3.5", "unavailable", "2"]
+
+    timestamps, values = history.state_changes_during_period_columns(
+        hass, start, end, "Sensor.Test", include_start_time_state=False
+    )
+    assert values == ["2", "unavailable", "3.5"]
+
+    start_time = point + timedelta(microseconds=10)
+    timestamps, values = history.state_changes_during_period_columns(
+        hass, start_time, end, entity_id
+    )
+    assert list(timestamps) == [
+        start_time.timestamp(),
+        point2.timestamp(),
+        point3.timestamp(),
+    ]
+    assert values == ["2", "unavailable", "3.5"]
+
+    timestamps, values = history.numeric_state_changes_during_period(
+        hass, start_time, end, entity_id
+    )
+    assert list(timestamps) == [start_time.timestamp(), point3.timestamp()]
+    assert list(values) == [2.0, 3.5]
+
+    assert history.state_changes_during_period_columns(
+        hass, start, end, "sensor.unknown"
+    ) == (array("d"), [])
+    with pytest.raises(ValueError):
+        history.state_changes_during_period_columns(hass, start, end)
+
+
 async def test_get_last_state_changes(hass: HomeAssistant) -> None:
     """Test number of state changes."""
     entity_id = "sensor.test"
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -292,6 +293,59 @@ async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_state_with_read_engine(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read only sessions use the read engine when one is configured."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific to SQLite in WAL mode
+        return
+
+    recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    config = {
+        recorder.CONF_DB_URL: recorder_db_url,
+        recorder.CONF_DB_READ_URL: recorder_db_url,
+        recorder.CONF_COMMIT_INTERVAL: 0,
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    assert instance.read_engine is not None
+    assert isinstance(instance.read_engine.pool, QueuePool)
+
+    hass.states.async_set("test.recorder", "on", {"test_attr": 5})
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            return [
+                state.state
+                for state in session.query(States).filter(States.state == "on")
+            ]
+
+    assert await instance.async_add_executor_job(_read_states) == ["on"]
+
+    def _write_with_read_session() -> None:
+        with session_scope(session=instance.get_read_session()) as session:
+            session.execute(text("DELETE FROM states"))
+
+    with pytest.raises(OperationalError):
+        await instance.async_add_executor_job(_write_with_read_session)
+
+    def _write_session_bind() -> Any:
+        with session_scope(hass=hass) as session:
+            return session.get_bind()
+
+    assert await instance.async_add_executor_job(_write_session_bind) is (
+        instance.engine
+    )
+
+    await hass.async_stop()
+    assert instance.read_engine is None
+
+
 @pytest.mark.parametrize(
     ("db_engine", "expected_attributes"),
     [
@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
@@ -15,6 +15,7 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    StatisticsDuringPeriodCache,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -25,6 +26,7 @@ from homeassistant.components.recorder.statistics import (
     get_latest_short_term_statistics_with_session,
     get_metadata,
     get_short_term_statistics_run_cache,
+    get_statistics_during_period_cache,
     list_statistic_ids,
 )
 from homeassistant.components.recorder.table_managers.statistics_meta import (
@@ -917,6 +919,110 @@ async def test_import_statistics(
     }
 
 
+async def test_statistics_during_period_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics_during_period results are cached until new statistics are written."""
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    period2 = period1 + timedelta(hours=1)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period1, "state": 0, "sum": 2},)
+    )
+    await async_wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2]
+    # Modifying the result must not modify the cached result
+    stats["test:total_energy_import"][0]["sum"] = 100
+
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=statistics._generate_statistics_during_period_stmt,
+    ) as generate_stmt_mock:
+        stats = statistics_during_period(
+            hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+        )
+        assert generate_stmt_mock.call_count == 0
+        assert [row["sum"] for row in stats["test:total_energy_import"]] == [2]
+
+        # Importing statistics invalidates the cached result
+        async_add_external_statistics(
+            hass, external_metadata, ({"start": period2, "state": 1, "sum": 3},)
+        )
+        await async_wait_recording_done(hass)
+        stats = statistics_during_period(
+            hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+        )
+        assert generate_stmt_mock.call_count == 1
+        assert [row["sum"] for row in stats["test:total_energy_import"]] == [2, 3]
+
+        # Requesting a different unit is a different cache entry
+        stats = statistics_during_period(
+            hass,
+            zero,
+            period="hour",
+            statistic_ids={"test:total_energy_import"},
+            units={"energy": "Wh"},
+        )
+        assert generate_stmt_mock.call_count == 2
+        assert [row["sum"] for row in stats["test:total_energy_import"]] == [
+            2000,
+            3000,
+        ]
+
+    assert get_statistics_during_period_cache(hass) is (
+        get_statistics_during_period_cache(hass)
+    )
+
+
+def test_statistics_during_period_cache_invalidate() -> None:
+    """Test invalidating the statistics_during_period cache."""
+    cache = StatisticsDuringPeriodCache()
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    result = {"sensor.test": [{"start": now.timestamp(), "sum": 1.0}]}
+
+    def _key(statistic_id: str, end: datetime | None) -> tuple:
+        return (frozenset({statistic_id}), "hour", now, end, None, frozenset(), "", ())
+
+    closed_key = _key("sensor.test", now)
+    open_key = _key("sensor.test", None)
+    other_key = _key("sensor.other", None)
+    cache.set(closed_key, cache.generation, frozenset({1}), now.timestamp(), result)
+    cache.set(open_key, cache.generation, frozenset({1}), None, result)
+    cache.set(other_key, cache.generation, frozenset({2}), None, result)
+    assert cache.get(closed_key) == result
+    assert cache.get(closed_key) is not cache.get(closed_key)
+
+    # Compiling statistics keeps entries for periods which already ended
+    cache.invalidate({1}, now)
+    assert cache.get(closed_key) == result
+    assert cache.get(open_key) is None
+    assert cache.get(other_key) == result
+
+    # A result which raced an invalidation is not stored
+    generation = cache.generation
+    cache.invalidate({2})
+    cache.set(open_key, generation, frozenset({1}), None, result)
+    assert cache.get(open_key) is None
+    assert cache.get(other_key) is None
+
+    cache.invalidate()
+    assert cache.get(closed_key) is None
+
+
 async def test_external_statistics_errors(
     hass: HomeAssistant, setup_recorder: None, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,5 +1,7 @@
 """Tests for Search integration."""
 
+from unittest.mock import patch
+
 import pytest
 from pytest_unordered import unordered
 
@@ -986,3 +988,42 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_reference_index_follows_reloads(hass: HomeAssistant) -> None:
+    """Test the reference index is updated when automations are reloaded."""
+    assert await async_setup_component(hass, "search", {})
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "id": "kitchen",
+                "alias": "kitchen",
+                "trigger": {"platform": "state", "entity_id": "light.kitchen"},
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    def search(entity_id: str) -> dict[str, set[str]]:
+        return Searcher(hass, {}).async_search(ItemType.ENTITY, entity_id)
+
+    assert search("light.kitchen") == {ItemType.AUTOMATION: {"automation.kitchen"}}
+    assert not search("light.bedroom")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            "automation": {
+                "id": "bedroom",
+                "alias": "bedroom",
+                "trigger": {"platform": "state", "entity_id": "light.bedroom"},
+                "action": {"service": "test.automation"},
+            }
+        },
+    ):
+        await hass.services.async_call("automation", "reload", blocking=True)
+
+    assert not search("light.kitchen")
+    assert search("light.bedroom") == {ItemType.AUTOMATION: {"automation.bedroom"}}
@@ -2,6 +2,7 @@
 
 import asyncio
 from collections import defaultdict
+import contextlib
 import json
 from typing import Any
 from unittest.mock import patch
@@ -10,9 +11,14 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_SAMPLES,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import ServiceNotFound
+from homeassistant.helpers.trace import TraceElement
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
@@ -39,7 +45,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -63,6 +69,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -778,6 +788,104 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "sun_traces", "moon_traces"),
+    [
+        ({"level": "off"}, 0, 0),
+        ({"level": "errors"}, 0, 3),
+        ({"level": "sampled", "sample_rate": 2}, 2, 2),
+        ({"level": "full"}, 3, 3),
+    ],
+)
+async def test_trace_levels(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    sun_traces: int,
+    moon_traces: int,
+) -> None:
+    """Test the trace level selects which runs are traced."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"service": "test.automation"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config=trace_config
+    )
+
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        with contextlib.suppress(ServiceNotFound):
+            await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == sun_traces
+    moon = _find_traces(response["result"], domain, "moon")
+    assert len(moon) == moon_traces
+    assert all(trace["script_execution"] == "error" for trace in moon)
+
+    if sun_traces:
+        run_id = _find_run_id(response["result"], domain, "sun")
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": run_id,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["trace"]
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_untraced_runs_skip_trace_elements(
+    hass: HomeAssistant, domain: str
+) -> None:
+    """Test runs which are not traced skip the trace elements of their steps."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "some_event"}, {"event": "another_event"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"level": "sampled", "sample_rate": 2}
+    )
+
+    with patch(
+        "homeassistant.helpers.script.TraceElement", wraps=TraceElement
+    ) as mock_trace_element:
+        for _ in range(2):
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done()
+    # Only the sampled run creates trace elements for its steps
+    assert mock_trace_element.call_count == 2
+    assert hass.data[DATA_TRACE_SAMPLES] == {f"{domain}.sun": 2}
+
+    # The sample state is removed with the automation or script
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={domain: {}},
+    ):
+        await hass.services.async_call(domain, "reload", blocking=True)
+    assert hass.data[DATA_TRACE_SAMPLES] == {}
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -999,6 +1107,50 @@ async def test_nested_traces(
     assert child_id == {"domain": "script", "item_id": "moon", "run_id": moon_run_id}
 
 
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+async def test_nested_untraced_run_not_linked(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    prefix: str,
+) -> None:
+    """Test a nested run which is not traced is not linked from its parent."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "script.moon"},
+    }
+    moon_config = {
+        "moon": {"sequence": {"event": "another_event"}, "trace": {"level": "off"}}
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config], moon_config)
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], "script", "moon")) == 0
+    sun_run_id = _find_run_id(response["result"], domain, "sun")
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": sun_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert "child_id" not in response["result"]["trace"][f"{prefix}/0"][0]
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
 )
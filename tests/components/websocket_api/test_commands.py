@@ -16,6 +16,9 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import (
+    ALL_SERVICE_DESCRIPTIONS_JSON_CACHE,
+)
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -23,6 +26,7 @@ from homeassistant.core import Context, HomeAssistant, State, SupportsResponse,
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.service import async_set_service_schema
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -704,6 +708,32 @@ async def test_get_services(
         assert msg["result"].keys() == hass.services.async_services().keys()
 
 
+async def test_get_services_json_cached_per_domain(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services only serializes the domains that changed."""
+    hass.services.async_register("domain_1", "service_1", lambda call: None)
+    hass.services.async_register("domain_2", "service_2", lambda call: None)
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    _, _, domains = hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE]
+    domain_1_json = domains["domain_1"][1]
+
+    async_set_service_schema(
+        hass, "domain_2", "service_2", {"description": "Updated description"}
+    )
+    await websocket_client.send_json({"id": 6, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["domain_2"]["service_2"]["description"] == (
+        "Updated description"
+    )
+    assert msg["result"].keys() == hass.services.async_services().keys()
+    _, _, domains = hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE]
+    assert domains["domain_1"][1] is domain_1_json
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
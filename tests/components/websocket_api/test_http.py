@@ -6,6 +6,7 @@ from typing import Any, cast
 from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -16,10 +17,15 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -433,6 +439,49 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+@pytest.mark.usefixtures("socket_enabled")
+async def test_compress_large_messages(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test only large messages are compressed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    for idx in range(20):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": 255})
+
+    sent: list[tuple[int, int | None]] = []
+    original_send = WebSocketWriter.send
+
+    async def _send(
+        self: WebSocketWriter,
+        message: bytes,
+        binary: bool = False,
+        compress: int | None = None,
+    ) -> None:
+        if not self.use_mask:
+            # Only record the messages sent by the server
+            sent.append((len(message), compress))
+        await original_send(self, message, binary, compress)
+
+    client = await aiohttp_client(hass.http.app)
+    with patch.object(WebSocketWriter, "send", _send):
+        websocket = await client.ws_connect(const.URL, compress=15)
+        assert (await websocket.receive_json())["type"] == "auth_required"
+        await websocket.send_json({"type": "auth", "access_token": hass_access_token})
+        assert (await websocket.receive_json())["type"] == "auth_ok"
+        await websocket.send_json({"id": 1, "type": "ping"})
+        assert (await websocket.receive_json())["type"] == "pong"
+        await websocket.send_json({"id": 2, "type": "get_states"})
+        assert len((await websocket.receive_json())["result"]) == 20
+        await websocket.close()
+
+    assert [compress for size, compress in sent if size < const.COMPRESS_MIN_SIZE]
+    assert all(
+        (compress == 15) is (size >= const.COMPRESS_MIN_SIZE) for size, compress in sent
+    )
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
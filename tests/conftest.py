@@ -68,6 +68,7 @@ from homeassistant.setup import BASE_PLATFORMS, async_setup_component
 from homeassistant.util import location
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
+from homeassistant.util.yaml import loader as yaml_loader
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension
@@ -384,6 +385,13 @@ def reset_hass_threading_local_object() -> Generator[None, None, None]:
     ha._hass.__dict__.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_parsed_yaml_cache() -> Generator[None, None, None]:
+    """Reset the cache of parsed configuration files for every test case."""
+    yield
+    yaml_loader._PARSED_YAML_CACHE.clear()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def bcrypt_cost() -> Generator[None, None, None]:
     """Run with reduced rounds during tests, to speed up uses."""
@@ -1171,7 +1179,7 @@ def translations_once() -> Generator[_patch, None, None]:
     """Only load translations once per session."""
     from homeassistant.helpers.translation import _TranslationsCacheData
 
-    cache = _TranslationsCacheData({}, {})
+    cache = _TranslationsCacheData({}, {}, {}, {})
     patcher = patch(
         "homeassistant.helpers.translation._TranslationsCacheData",
         return_value=cache,
@@ -5,6 +5,7 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -3571,3 +3572,122 @@ async def test_or_condition_with_disabled_condition(hass: HomeAssistant) -> None
             "conditions/1/entity_id/0": [{"result": {"result": True, "state": 100.0}}],
         }
     )
+
+
+async def test_untraced_evaluation(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test conditions are evaluated without tracing when no trace is recorded."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "state",
+                "entity_id": ["sensor.mode", "sensor.other_mode"],
+                "state": ["home", "away"],
+                "match": "any",
+            },
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "below": 20,
+                    },
+                    {
+                        "condition": "not",
+                        "conditions": [
+                            {"condition": "time", "after": "08:00:00"},
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    assert isinstance(test, condition.CompiledCondition)
+
+    freezer.move_to(dt_util.as_utc(dt_util.now().replace(hour=12)))
+    hass.states.async_set("sensor.mode", "home")
+    hass.states.async_set("sensor.other_mode", "unknown")
+    hass.states.async_set("sensor.temperature", 25)
+
+    trace.trace_cv.set(None)
+    assert not test(hass)
+    hass.states.async_set("sensor.temperature", 15)
+    assert test(hass)
+    hass.states.async_set("sensor.mode", "unknown")
+    assert not test(hass)
+    assert trace.trace_cv.get() is None
+
+    hass.states.async_remove("sensor.other_mode")
+    with pytest.raises(ConditionError, match="unknown entity sensor.other_mode"):
+        test(hass)
+    assert trace.trace_cv.get() is None
+
+    # The traced evaluation gives the same results
+    trace.trace_clear()
+    with pytest.raises(ConditionError, match="unknown entity sensor.other_mode"):
+        test(hass)
+    hass.states.async_set("sensor.other_mode", "away")
+    assert test(hass)
+    assert trace.trace_get(clear=False)["conditions/1/conditions/0/entity_id/0"]
+
+
+async def test_untraced_constant_folding(hass: HomeAssistant) -> None:
+    """Test conditions which result does not depend on states are folded."""
+    disabled = {
+        "enabled": False,
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "state": "100",
+    }
+    for config, constant in (
+        ({"condition": "and", "conditions": [disabled]}, True),
+        ({"condition": "or", "conditions": [disabled]}, False),
+        ({"condition": "not", "conditions": [disabled]}, True),
+        (
+            {
+                "condition": "and",
+                "conditions": [
+                    {"condition": "not", "conditions": [disabled]},
+                    {"condition": "or", "conditions": [disabled]},
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.missing",
+                        "state": "on",
+                    },
+                ],
+            },
+            False,
+        ),
+    ):
+        config = cv.CONDITION_SCHEMA(config)
+        config = await condition.async_validate_condition_config(hass, config)
+        test = await condition.async_from_config(hass, config)
+        assert test.constant is constant
+
+        trace.trace_cv.set(None)
+        assert test(hass) is constant
+        trace.trace_clear()
+        assert test(hass) is constant
+
+    config = {
+        "condition": "or",
+        "conditions": [
+            disabled,
+            {"condition": "state", "entity_id": "sensor.missing", "state": "on"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    assert test.constant is not True
+
+    # Errors of the checks keep the index of the check in the condition
+    trace.trace_cv.set(None)
+    with pytest.raises(ConditionError, match="In 'or' \\(item 2 of 2\\)"):
+        test(hass)
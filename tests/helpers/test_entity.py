@@ -574,6 +574,37 @@ async def test_async_parallel_updates_with_one_using_executor(
     assert locked == [True, True, True]
 
 
+async def test_write_state_stats(hass: HomeAssistant) -> None:
+    """Test collecting write state statistics."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "test.stats"
+    ent.async_write_ha_state()
+    assert entity.async_get_write_state_stats(hass) is None
+
+    stats = entity.async_start_write_state_stats(hass)
+    assert entity.async_start_write_state_stats(hass) is stats
+    assert entity.async_get_write_state_stats(hass) is stats
+
+    # Nothing changed, only last_reported is updated
+    ent.async_write_ha_state()
+    ent._attr_extra_state_attributes = {"changed": True}
+    ent.async_write_ha_state()
+
+    entity_stats = stats.entities["test.stats"]
+    assert entity_stats.platform is None
+    assert entity_stats.writes == 2
+    assert entity_stats.unchanged_writes == 1
+    assert entity_stats.calculate_time > 0
+    assert entity_stats.set_time > 0
+    assert stats.async_platform_stats()[None].writes == 2
+
+    assert entity.async_stop_write_state_stats(hass) is stats
+    assert entity.async_get_write_state_stats(hass) is None
+    ent.async_write_ha_state()
+    assert entity_stats.writes == 2
+
+
 async def test_async_remove_no_platform(hass: HomeAssistant) -> None:
     """Test async_remove method when no platform set."""
     ent = entity.Entity()
@@ -8,8 +8,13 @@ from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
+import voluptuous as vol
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+)
 from homeassistant.core import (
     CoreState,
     HomeAssistant,
@@ -25,6 +30,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
     issue_registry as ir,
+    polling,
 )
 from homeassistant.helpers.entity import (
     DeviceInfo,
@@ -44,6 +50,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_platform,
     mock_registry,
@@ -233,12 +240,17 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch.object(
+        polling.PollingScheduler,
+        "async_next_refresh",
+        autospec=True,
+        side_effect=polling.PollingScheduler.async_next_refresh,
+    ) as mock_next_refresh:
         await component.async_setup({DOMAIN: {"platform": "platform"}})
 
         await hass.async_block_till_done()
-    assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert mock_next_refresh.called
+    assert mock_next_refresh.call_args[0][2] == 30.0
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -387,6 +399,161 @@ async def test_parallel_updates_async_platform_with_constant(
     assert handle._update_in_sequence is False
 
 
+async def test_entity_service_batches_and_concurrency_cap(
+    hass: HomeAssistant,
+) -> None:
+    """Test a platform can batch entity service calls and cap their concurrency."""
+    batches: list[tuple[list[str], str, dict[str, Any]]] = []
+
+    async def async_handle_entity_service_batch(
+        hass: HomeAssistant, entities: list[Entity], method: str, data: dict[str, Any]
+    ) -> list[Entity]:
+        """Handle the service call for all entities which support groups."""
+        grouped = [
+            entity for entity in entities if entity.entity_id != "test_domain.solo"
+        ]
+        batches.append(([entity.entity_id for entity in grouped], method, data))
+        return [entity for entity in entities if entity not in grouped]
+
+    platform = MockPlatform()
+    platform.async_handle_entity_service_batch = async_handle_entity_service_batch
+    platform.PARALLEL_SERVICE_CALLS = 2
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+    handle = list(component._platforms.values())[-1]
+
+    running = 0
+    max_running = 0
+    turned_on: list[str] = []
+
+    class SwitchEntity(MockEntity):
+        """Entity with a turn on service."""
+
+        async def async_turn_on(self, **kwargs: Any) -> None:
+            """Turn the entity on."""
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            turned_on.append(self.entity_id)
+
+    await handle.async_add_entities(
+        [
+            SwitchEntity(entity_id=f"test_domain.{name}")
+            for name in ("one", "two", "solo")
+        ]
+    )
+    component.async_register_entity_service(
+        "turn_on", {vol.Optional("brightness"): int}, "async_turn_on"
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        "turn_on",
+        {"entity_id": "all", "brightness": 10},
+        blocking=True,
+    )
+    assert batches == [
+        (["test_domain.one", "test_domain.two"], "async_turn_on", {"brightness": 10})
+    ]
+    assert turned_on == ["test_domain.solo"]
+
+    # Without the batch handler the entities are called one by one
+    handle.async_handle_entity_service_batch = None
+    turned_on.clear()
+    await hass.services.async_call(
+        DOMAIN, "turn_on", {"entity_id": "all"}, blocking=True
+    )
+    assert sorted(turned_on) == [
+        "test_domain.one",
+        "test_domain.solo",
+        "test_domain.two",
+    ]
+    assert max_running == 2
+
+    # Concurrent service calls targeting a single entity are capped as well
+    max_running = 0
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                DOMAIN, "turn_on", {"entity_id": f"test_domain.{name}"}, blocking=True
+            )
+            for name in ("one", "two", "solo")
+        )
+    )
+    assert max_running == 2
+
+
+async def test_state_writes_coalesced_with_constant(hass: HomeAssistant) -> None:
+    """Test a platform can coalesce the state writes of its entities."""
+    platform = MockPlatform()
+    platform.STATE_WRITE_COALESCE_TIME = 0
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.state_write_coalesce_time == 0
+
+    class ChattyEntity(Entity):
+        """Entity that writes its state many times."""
+
+        _attr_should_poll = False
+
+    entity = ChattyEntity()
+    entity.entity_id = "test_domain.chatty"
+    entity._attr_state = "initial"
+    forced_entity = ChattyEntity()
+    forced_entity.entity_id = "test_domain.forced"
+    forced_entity._attr_force_update = True
+    await handle.async_add_entities([entity, forced_entity])
+    # The first state is written right away
+    assert hass.states.get("test_domain.chatty").state == "initial"
+
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for value in ("one", "two", "three"):
+        entity._attr_state = value
+        entity.async_write_ha_state()
+        forced_entity._attr_state = value
+        forced_entity.async_write_ha_state()
+
+    assert hass.states.get("test_domain.chatty").state == "initial"
+    assert hass.states.get("test_domain.forced").state == "three"
+    await hass.async_block_till_done()
+    assert hass.states.get("test_domain.chatty").state == "three"
+    assert [
+        event.data["entity_id"]
+        for event in state_changes
+        if event.data["entity_id"] == "test_domain.chatty"
+    ] == ["test_domain.chatty"]
+    assert (
+        len(
+            [
+                event
+                for event in state_changes
+                if event.data["entity_id"] == "test_domain.forced"
+            ]
+        )
+        == 3
+    )
+
+    # A pending write is dropped when the entity is removed
+    entity._attr_state = "removed"
+    entity.async_write_ha_state()
+    await entity.async_remove()
+    await hass.async_block_till_done()
+    assert hass.states.get("test_domain.chatty") is None
+
+
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
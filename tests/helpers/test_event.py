@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from functools import partial
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -15,8 +16,15 @@ import pytest
 
 from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import event
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
@@ -3568,6 +3576,74 @@ async def test_track_time_interval(hass: HomeAssistant) -> None:
     assert len(specific_runs) == 2
 
 
+async def test_track_time_interval_tolerance(hass: HomeAssistant) -> None:
+    """Test time intervals with a tolerance share a timer and stay cancellable."""
+    runs_1 = []
+    runs_2 = []
+
+    utc_now = dt_util.utcnow()
+    unsub_1 = async_track_time_interval(
+        hass,
+        callback(lambda x: runs_1.append(x)),
+        timedelta(seconds=10),
+        tolerance=5,
+    )
+    unsub_2 = async_track_time_interval(
+        hass,
+        callback(lambda x: runs_2.append(x)),
+        timedelta(seconds=11),
+        tolerance=5,
+    )
+    timer_wheel = hass.data[event._TIMER_WHEEL]
+    assert len(timer_wheel._buckets) <= 2
+    fire_at = {*timer_wheel._buckets}
+    assert all(when % 5 == 0 for when in fire_at)
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(runs_1) == 0
+    assert len(runs_2) == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=17))
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 1
+
+    unsub_1()
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=35))
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 2
+
+    unsub_2()
+    assert not timer_wheel._buckets
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert len(runs_2) == 2
+
+
+async def test_timer_wheel_cancel_while_firing(hass: HomeAssistant) -> None:
+    """Test timers of a bucket fire in order and can cancel each other."""
+    timer_wheel = event._async_get_timer_wheel(hass)
+    when = hass.loop.time() + 1
+    fired: list[str] = []
+    cancels: dict[str, CALLBACK_TYPE] = {}
+
+    def _fire(name: str, cancel: str | None = None) -> None:
+        fired.append(name)
+        if cancel:
+            cancels[cancel]()
+
+    for name, cancel in (("a", "b"), ("b", "a"), ("c", None), ("d", None)):
+        cancels[name] = timer_wheel.async_call_at(when, 5, partial(_fire, name, cancel))
+    assert len(timer_wheel._buckets) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert fired == ["a", "c", "d"]
+    assert not timer_wheel._buckets
+
+
 async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
@@ -4377,6 +4453,29 @@ async def test_async_call_later(hass: HomeAssistant) -> None:
     remove()
 
 
+async def test_async_call_later_tolerance(hass: HomeAssistant) -> None:
+    """Test calling an action later with a tolerance."""
+    runs = []
+
+    utc_now = dt_util.utcnow()
+    remove = async_call_later(hass, 3, callback(lambda x: runs.append(x)), tolerance=1)
+    cancelled = async_call_later(
+        hass, 3.2, callback(lambda x: runs.append(x)), tolerance=1
+    )
+    timer_wheel = hass.data[event._TIMER_WHEEL]
+    cancelled()
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(runs) == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert not timer_wheel._buckets
+    remove()
+
+
 async def test_async_call_later_timedelta(hass: HomeAssistant) -> None:
     """Test calling an action later with a timedelta."""
     future = asyncio.get_running_loop().create_future()
@@ -0,0 +1,153 @@
+"""Test the polling scheduler helper."""
+
+import asyncio
+from datetime import timedelta
+import logging
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import polling, update_coordinator
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_next_refresh_spread_within_interval(hass: HomeAssistant) -> None:
+    """Test refreshes are spread deterministically within their interval."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    now = hass.loop.time()
+
+    next_refreshes = {
+        scheduler.async_next_refresh(f"test.poller_{idx}", 60) for idx in range(10)
+    }
+    assert len(next_refreshes) == 10
+    assert all(now < when <= now + 60 for when in next_refreshes)
+
+    assert scheduler.async_next_refresh("test.poller_0", 60) in next_refreshes
+
+
+async def test_next_refresh_one_interval_apart(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled refreshes are one interval apart."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    first = scheduler.async_next_refresh("test.poller", 3600)
+    assert hass.loop.time() < first <= hass.loop.time() + 3600
+
+    # The refresh timer may fire slightly early or late
+    for delay in (-0.001, 1):
+        freezer.tick(first - hass.loop.time() + delay)
+        next_refresh = scheduler.async_next_refresh("test.poller", 3600)
+        assert next_refresh == pytest.approx(first + 3600)
+        first = next_refresh
+
+
+async def test_register_unique_keys(hass: HomeAssistant) -> None:
+    """Test pollers sharing a key get a counter appended."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    assert scheduler.async_register("test.poller", "test") == "test.poller"
+    assert scheduler.async_register("test.poller", "test") == "test.poller_2"
+    assert scheduler.async_register("test.poller", "test") == "test.poller_3"
+    assert set(polling.async_get_refresh_stats(hass)) == {
+        "test.poller",
+        "test.poller_2",
+        "test.poller_3",
+    }
+
+    scheduler.async_remove("test.poller_2")
+    assert set(polling.async_get_refresh_stats(hass)) == {
+        "test.poller",
+        "test.poller_3",
+    }
+    assert scheduler.async_register("test.poller", "test") == "test.poller_2"
+
+
+async def test_backoff_on_loop_lag(hass: HomeAssistant) -> None:
+    """Test intervals are stretched while the event loop is lagging."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+
+    scheduler._async_record_loop_lag(hass.loop.time() - 1)
+    assert scheduler.backoff_factor == 2
+    scheduler._async_record_loop_lag(hass.loop.time() - 1)
+    scheduler._async_record_loop_lag(hass.loop.time() - 1)
+    assert scheduler.backoff_factor == polling.MAX_BACKOFF_FACTOR
+
+    now = hass.loop.time()
+    assert scheduler.async_next_refresh("test.poller", 10) <= now + 40
+
+    scheduler.async_probe_loop_lag()
+    await asyncio.sleep(0)
+    assert scheduler.backoff_factor == 2
+    scheduler.async_probe_loop_lag()
+    await asyncio.sleep(0)
+    assert scheduler.backoff_factor == 1
+
+
+async def test_refresh_slots_capped_per_integration(hass: HomeAssistant) -> None:
+    """Test concurrent refreshes of an integration are capped."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def _refresh(idx: int) -> None:
+        nonlocal running, max_running
+        key = scheduler.async_register(f"test.poller_{idx}", "test")
+        async with scheduler.async_refresh_slot(key, "test"):
+            running += 1
+            max_running = max(max_running, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [hass.async_create_task(_refresh(idx)) for idx in range(20)]
+    await asyncio.sleep(0)
+    assert running == polling.MAX_CONCURRENT_REFRESHES_PER_INTEGRATION
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max_running == polling.MAX_CONCURRENT_REFRESHES_PER_INTEGRATION
+
+    stats = polling.async_get_refresh_stats(hass)
+    assert len(stats) == 20
+    assert stats["test.poller_0"]["integration"] == "test"
+    assert stats["test.poller_0"]["refreshes"] == 1
+
+
+async def test_coordinator_refresh_stats(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled coordinator refreshes are recorded."""
+    updates = 0
+
+    async def _update_method() -> int:
+        nonlocal updates
+        updates += 1
+        return updates
+
+    coordinator = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=_update_method,
+        update_interval=timedelta(seconds=30),
+    )
+    unsub = coordinator.async_add_listener(lambda: None)
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert updates == 1
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert updates == 2
+
+    stats = polling.async_get_refresh_stats(hass)
+    assert stats["tests.helpers.test_polling.test"]["refreshes"] == 2
+
+    unsub()
+    await coordinator.async_shutdown()
+    assert polling.async_get_refresh_stats(hass) == {}
@@ -11,13 +11,17 @@ import pytest
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import event
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    JOURNAL_STORAGE_KEY,
+    STATE_DUMP_INTERVAL,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -32,6 +36,7 @@ from tests.common import (
     MockModule,
     MockPlatform,
     async_fire_time_changed,
+    async_mock_load_restore_state_from_storage,
     json_round_trip,
     mock_integration,
     mock_platform,
@@ -127,6 +132,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         entity.entity_id = "input_boolean.b1"
 
         await entity.async_get_last_state()
+        data.async_restore_entity_added(entity)
         await hass.async_block_till_done()
 
     assert mock_write_data.called
@@ -134,7 +140,9 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
+        hass.states.async_set("input_boolean.b1", "on")
+        # The periodic dump may run up to a minute late
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=16))
         await hass.async_block_till_done()
 
     assert mock_write_data.called
@@ -142,6 +150,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
+        hass.states.async_set("input_boolean.b1", "off")
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
 
@@ -156,6 +165,30 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
 
+async def test_periodic_dump_in_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the periodic dump is batched in the timer wheel."""
+    data = async_get(hass)
+    await hass.async_block_till_done()
+
+    def _wheel_timers() -> int:
+        if (timer_wheel := hass.data.get(event._TIMER_WHEEL)) is None:
+            return 0
+        return sum(len(bucket.timers) for bucket in timer_wheel._buckets.values())
+
+    timers = _wheel_timers()
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+    assert _wheel_timers() == timers + 1
+
+    with patch.object(data, "async_dump_changed_states") as mock_dump:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + STATE_DUMP_INTERVAL + timedelta(minutes=1)
+        )
+        await hass.async_block_till_done()
+    assert mock_dump.called
+
+
 async def test_save_persistent_states(hass: HomeAssistant) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
@@ -175,6 +208,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         entity.entity_id = "input_boolean.b1"
 
         await entity.async_get_last_state()
+        data.async_restore_entity_added(entity)
         await hass.async_block_till_done()
 
     # Startup Save
@@ -200,6 +234,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
+        hass.states.async_set("input_boolean.b1", "on")
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
     # Verify still saving
@@ -208,6 +243,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
+        hass.states.async_set("input_boolean.b1", "off")
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
     # Verify normal shutdown
@@ -358,6 +394,99 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the states changed since the last dump are journaled."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    # The first dump is a full dump
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_changed_states()
+    journal = hass_storage[JOURNAL_STORAGE_KEY]["data"]
+    assert len(journal) == 1
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert journal[0]["state"]["state"] == "off"
+
+    # Nothing changed, nothing is written
+    with patch.object(data.journal_store, "async_save") as mock_save:
+        await data.async_dump_changed_states()
+    assert not mock_save.called
+
+    await entity.async_remove()
+    await data.async_dump_changed_states()
+    journal = hass_storage[JOURNAL_STORAGE_KEY]["data"]
+    assert len(journal) == 2
+    # The removed entity is kept as a last state until it expires
+    assert journal[1]["state"]["entity_id"] == "input_boolean.b3"
+
+    # The journal is replayed on top of the saved states
+    await async_mock_load_restore_state_from_storage(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b3"].state.state == "on"
+
+    # Too many changes fold the journal into a full dump
+    hass.states.async_set("input_boolean.b0", "off")
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_changed_states()
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+    written_states = {
+        item["state"]["entity_id"]: item["state"]["state"]
+        for item in json_round_trip(hass_storage[STORAGE_KEY]["data"])
+    }
+    assert written_states == {
+        "input_boolean.b0": "off",
+        "input_boolean.b1": "off",
+        "input_boolean.b2": "off",
+        "input_boolean.b3": "on",
+    }
+
+
+async def test_dump_changed_states_unencodable_extra_data(
+    hass: HomeAssistant,
+) -> None:
+    """Test extra data orjson cannot encode is always journaled."""
+
+    class BigIntRestoreEntity(RestoreEntity):
+        """A restore entity with extra data larger than 64 bit integers."""
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return the extra data."""
+            return RestoredExtraData({"value": 2**70})
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for entity in (RestoreEntity(), BigIntRestoreEntity()):
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{type(entity).__name__.lower()}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_changed_states()
+        assert len(mock_write_data.mock_calls[0][1][0]) == 2
+
+        for _ in range(2):
+            mock_write_data.reset_mock()
+            await data.async_dump_changed_states()
+            journal = mock_write_data.mock_calls[0][1][0]
+            assert [item["extra_data"] for item in journal] == [{"value": 2**70}]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
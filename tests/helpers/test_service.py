@@ -745,6 +745,34 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_cached_until_registry_changes(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test target expansions are cached until the registries change."""
+    call = ServiceCall("light", "turn_on", {"floor_id": "test-floor"})
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    cache = hass.data[service.TARGET_EXPANSION_CACHE]
+    assert len(cache._expansions) == 1
+
+    # Changes which do not change what targets expand to keep the cache
+    entity_registry.async_update_entity("light.no_area", name="No area")
+    await hass.async_block_till_done()
+    assert len(cache._expansions) == 1
+
+    entity_registry.async_update_entity("light.no_area", area_id="test-area")
+    await hass.async_block_till_done()
+    assert cache._expansions == {}
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.no_area",
+    }
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
@@ -916,6 +944,62 @@ async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     assert await service.async_get_all_descriptions(hass) is descriptions
 
 
+async def test_async_get_all_descriptions_services_file_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test parsed services files are reused while they did not change."""
+    integration = await async_get_integration(hass, DOMAIN_GROUP)
+    signatures = await hass.async_add_executor_job(
+        service._services_file_signatures, [integration]
+    )
+    hass_storage[service.SERVICES_FILE_CACHE_STORAGE_KEY] = {
+        "version": service.SERVICES_FILE_CACHE_STORAGE_VERSION,
+        "key": service.SERVICES_FILE_CACHE_STORAGE_KEY,
+        "data": {
+            DOMAIN_GROUP: {
+                "signature": signatures[DOMAIN_GROUP],
+                "services": {"reload": {"fields": {"cached": {"example": "x"}}}},
+            },
+        },
+    }
+    assert await async_setup_component(hass, DOMAIN_GROUP, {DOMAIN_GROUP: {}})
+
+    with patch(
+        "homeassistant.helpers.service._load_services_files",
+        side_effect=service._load_services_files,
+    ) as proxy_load_services_files:
+        descriptions = await service.async_get_all_descriptions(hass)
+
+    assert not proxy_load_services_files.mock_calls
+    assert "cached" in descriptions[DOMAIN_GROUP]["reload"]["fields"]
+
+    # A changed services file is parsed again
+    hass.data.pop(service.SERVICE_DESCRIPTION_CACHE)
+    hass.data.pop(service.ALL_SERVICE_DESCRIPTIONS_CACHE)
+    cache = service._async_get_services_file_cache(hass)
+    cache._entries[DOMAIN_GROUP]["signature"][-1] += 1
+
+    with patch(
+        "homeassistant.helpers.service._load_services_files",
+        side_effect=service._load_services_files,
+    ) as proxy_load_services_files:
+        descriptions = await service.async_get_all_descriptions(hass)
+
+    assert len(proxy_load_services_files.mock_calls) == 1
+    assert "cached" not in descriptions[DOMAIN_GROUP]["reload"]["fields"]
+    assert cache._entries[DOMAIN_GROUP]["signature"] == signatures[DOMAIN_GROUP]
+
+    # Descriptions of domains that did not change are kept
+    hass.services.async_register("test_domain", "test_service", lambda x: None)
+    service.async_set_service_schema(
+        hass, "test_domain", "test_service", {"description": "test"}
+    )
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert new_descriptions[DOMAIN_GROUP] is descriptions[DOMAIN_GROUP]
+    assert new_descriptions["test_domain"]["test_service"]["description"] == "test"
+
+
 async def test_async_get_all_descriptions_failing_integration(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
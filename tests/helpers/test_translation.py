@@ -426,10 +426,11 @@ async def test_caching(hass: HomeAssistant) -> None:
         side_effect=translation.build_resources,
     ) as mock_build_resources:
         load1 = await translation.async_get_translations(hass, "en", "entity_component")
-        assert len(mock_build_resources.mock_calls) == 5
+        # Only the requested category is flattened
+        assert len(mock_build_resources.mock_calls) == 1
 
         load2 = await translation.async_get_translations(hass, "en", "entity_component")
-        assert len(mock_build_resources.mock_calls) == 5
+        assert len(mock_build_resources.mock_calls) == 1
 
         assert load1 == load2
 
@@ -468,12 +469,12 @@ async def test_caching(hass: HomeAssistant) -> None:
         assert load_sensor_only
         for key in load_sensor_only:
             assert key == "component.sensor.title"
-        assert len(mock_build.mock_calls) == 0
+        assert len(mock_build.mock_calls) == 1
 
         assert await translation.async_get_translations(
             hass, "en", "title", integrations={"sensor"}
         )
-        assert len(mock_build.mock_calls) == 0
+        assert len(mock_build.mock_calls) == 1
 
         load_light_only = await translation.async_get_translations(
             hass, "en", "title", integrations={"media_player"}
@@ -481,7 +482,7 @@ async def test_caching(hass: HomeAssistant) -> None:
         assert load_light_only
         for key in load_light_only:
             assert key == "component.media_player.title"
-        assert len(mock_build.mock_calls) > 1
+        assert len(mock_build.mock_calls) == 2
 
 
 async def test_custom_component_translations(
@@ -598,7 +599,7 @@ async def test_translate_state(hass: HomeAssistant):
         result = translation.async_translate_state(
             hass, "on", "binary_sensor", "platform", "translation_key", None
         )
-        mock.assert_called_once_with(hass, hass.config.language, "entity")
+        mock.assert_called_once_with(hass, hass.config.language, "entity", "platform")
         assert result == "TRANSLATED"
 
     with patch(
@@ -610,7 +611,9 @@ async def test_translate_state(hass: HomeAssistant):
         result = translation.async_translate_state(
             hass, "on", "binary_sensor", "platform", None, "device_class"
         )
-        mock.assert_called_once_with(hass, hass.config.language, "entity_component")
+        mock.assert_called_once_with(
+            hass, hass.config.language, "entity_component", "binary_sensor"
+        )
         assert result == "TRANSLATED"
 
     with patch(
@@ -622,7 +625,9 @@ async def test_translate_state(hass: HomeAssistant):
         result = translation.async_translate_state(
             hass, "on", "binary_sensor", "platform", None, None
         )
-        mock.assert_called_once_with(hass, hass.config.language, "entity_component")
+        mock.assert_called_once_with(
+            hass, hass.config.language, "entity_component", "binary_sensor"
+        )
         assert result == "TRANSLATED"
 
     with patch(
@@ -634,7 +639,7 @@ async def test_translate_state(hass: HomeAssistant):
         )
         mock.assert_has_calls(
             [
-                call(hass, hass.config.language, "entity_component"),
+                call(hass, hass.config.language, "entity_component", "binary_sensor"),
             ]
         )
         assert result == "on"
@@ -648,8 +653,8 @@ async def test_translate_state(hass: HomeAssistant):
         )
         mock.assert_has_calls(
             [
-                call(hass, hass.config.language, "entity"),
-                call(hass, hass.config.language, "entity_component"),
+                call(hass, hass.config.language, "entity", "platform"),
+                call(hass, hass.config.language, "entity_component", "binary_sensor"),
             ]
         )
         assert result == "on"
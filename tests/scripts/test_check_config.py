@@ -145,6 +145,8 @@ def test_secrets(
         "ssl_profile": "modern",
         "use_x_frame_options": True,
         "server_host": ["0.0.0.0", "::"],
+        "compression_level": 6,
+        "compression_min_size": 1024,
     }
     assert res["secret_cache"] == {
         get_test_config_dir("secrets.yaml"): {"http_pw": "http://google.com"}
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 import functools
 import gc
 import logging
+import math
 import os
 import re
 from tempfile import TemporaryDirectory
@@ -63,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1533,6 +1535,79 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared with their JSON."""
+    attrs = {"unit_of_measurement": "W", "device_class": "power"}
+    hass.states.async_set("sensor.one", "1", attrs)
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.attributes is state_two.attributes
+    assert state_one.attributes_json is state_two.attributes_json
+    assert json_loads(state_two.as_dict_json)["attributes"] == attrs
+    assert json_loads(b"{" + state_two.as_compressed_state_json + b"}") == {
+        "sensor.two": {
+            "s": "2",
+            "a": attrs,
+            "c": state_two.context.id,
+            "lc": state_two.last_changed_timestamp,
+        }
+    }
+
+    # Values that are not equal are not shared even if their JSON matches
+    hass.states.async_set("sensor.one", "1", {"value": math.nan})
+    hass.states.async_set("sensor.two", "1", {"value": None})
+    assert math.isnan(hass.states.get("sensor.one").attributes["value"])
+    assert hass.states.get("sensor.two").attributes["value"] is None
+
+    # Attributes with mutable values are not shared
+    hass.states.async_set("sensor.one", "1", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.two", "1", {"options": ["a", "b"]})
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.attributes is not state_two.attributes
+    assert state_one.attributes["options"] is not state_two.attributes["options"]
+    assert state_one.attributes_json == state_two.attributes_json
+
+    # The JSON of attributes with mutable values is not cached between states
+    state_one.attributes["options"].append("c")
+    hass.states.async_set("sensor.one", "2", state_one.attributes)
+    assert hass.states.get("sensor.one").attributes is state_one.attributes
+    assert json_loads(hass.states.get("sensor.one").attributes_json) == {
+        "options": ["a", "b", "c"]
+    }
+
+    # Attributes that cannot be encoded are not interned
+    hass.states.async_set("sensor.one", "1", {"value": 2**64})
+    assert hass.states.get("sensor.one").attributes["value"] == 2**64
+
+
+async def test_statemachine_change_log(hass: HomeAssistant) -> None:
+    """Test the version and the changes since a version."""
+    version = hass.states.version
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    assert hass.states.version == version + 1
+    hass.states.async_set("light.bedroom", "off")
+    hass.states.async_remove("light.kitchen")
+    assert hass.states.version == version + 3
+
+    assert hass.states.async_changed_since(version) == {
+        "light.kitchen",
+        "light.bedroom",
+    }
+    assert hass.states.async_changed_since(version + 2) == {"light.kitchen"}
+    assert hass.states.async_changed_since(version + 3) == set()
+    assert hass.states.async_changed_since(version + 4) is None
+
+    with patch.object(ha, "STATE_CHANGE_LOG_SIZE", 2):
+        states = ha.StateMachine(hass.bus, hass.loop)
+    for idx in range(3):
+        states.async_set("light.kitchen", str(idx))
+    assert states.async_changed_since(0) is None
+    assert states.async_changed_since(1) == {"light.kitchen"}
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
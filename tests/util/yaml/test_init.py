@@ -729,3 +729,65 @@ def test_load_yaml_dict_fail(try_both_loaders, mock_hass_config_yaml: None) -> N
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def test_load_config_yaml_cached(try_both_loaders) -> None:
+    """Test unchanged configuration files are not parsed again."""
+    config_dir = get_test_config_dir()
+    config_file = get_test_config_dir("package.yaml")
+    secrets_file = get_test_config_dir(yaml.SECRET_YAML)
+    config = "automation:\n  alias: !secret alias\n  mode: single\n"
+
+    with patch_yaml_files({config_file: config, secrets_file: "alias: first"}):
+        first = yaml.load_yaml(config_file, yaml.Secrets(pathlib.Path(config_dir)))
+
+    cached = yaml_loader._PARSED_YAML_CACHE[config_file]
+
+    with patch_yaml_files({config_file: config, secrets_file: "alias: second"}):
+        second = yaml.load_yaml(config_file, yaml.Secrets(pathlib.Path(config_dir)))
+
+    assert yaml_loader._PARSED_YAML_CACHE[config_file] is cached
+    # Secrets are resolved on every load
+    assert first == {"automation": {"alias": "first", "mode": "single"}}
+    assert second == {"automation": {"alias": "second", "mode": "single"}}
+    assert second["automation"] is not first["automation"]
+    assert second["automation"].__line__ == 2
+    assert second["automation"].__config_file__ == config_file
+
+    with patch_yaml_files({config_file: "automation: []"}):
+        assert yaml.load_yaml(config_file, yaml.Secrets(pathlib.Path(config_dir))) == {
+            "automation": []
+        }
+
+
+def test_load_config_yaml_cache_bounded(try_both_loaders) -> None:
+    """Test the least recently used files are evicted from the cache."""
+    config_dir = get_test_config_dir()
+    files = {
+        get_test_config_dir(f"package{idx}.yaml"): "key: value" for idx in range(3)
+    }
+    first, second, third = files
+
+    with (
+        patch.object(yaml_loader, "_PARSED_YAML_CACHE_SIZE", 2),
+        patch_yaml_files(files),
+    ):
+        for fname in (first, second, first, third):
+            yaml.load_yaml(fname, yaml.Secrets(pathlib.Path(config_dir)))
+
+    assert list(yaml_loader._PARSED_YAML_CACHE) == [first, third]
+
+
+@pytest.mark.parametrize(
+    "hass_config_yaml_files",
+    [{YAML_CONFIG_FILE: "key: !include test.yaml", "test.yaml": "value"}],
+)
+def test_load_config_yaml_with_include_not_cached(
+    try_both_loaders, mock_hass_config_yaml: None
+) -> None:
+    """Test configuration files that include other files are not cached."""
+    assert load_yaml_config_file(YAML_CONFIG_FILE, yaml.Secrets(pathlib.Path("."))) == {
+        "key": "value"
+    }
+    assert YAML_CONFIG_FILE not in yaml_loader._PARSED_YAML_CACHE
+    assert "test.yaml" in yaml_loader._PARSED_YAML_CACHE